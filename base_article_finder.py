@@ -0,0 +1,441 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from logger import setup_logger
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlsplit
+from base_scraper import BaseScraper
+from transport import HTTPTransport
+from http_cache import HTTPCache
+from feed_discovery import FeedEntry, parse_feed
+from discovery_cache import DiscoveryCache, DiscoveryCacheConfig
+
+# Add custom exceptions
+class NoTopicsError(Exception):
+    """Raised when there's no topics provided"""
+    pass
+
+class InvalidJSONError(Exception):
+    """Raised when there's an error in the initialization of an article finder"""
+    pass
+
+class NoMatchingTopicsError(Exception):
+    """Raised when there's no matching topics found"""
+    pass
+
+class TopicNavigationError(Exception):
+    """Raised when there's an error in topic navigation"""
+    pass
+
+class PageSoupError(Exception):
+    """Raised when there's an error in getting soup"""
+    pass
+
+class DivNotFoundError(Exception):
+    """Raised when the div is not found in the soup"""
+    pass
+
+class AElementNotFoundError(Exception):
+    """Raised when the a elements are not found in the soup"""
+    pass
+
+class FinderConfig:
+    """Configuration shared by every source. Each source subclasses it with its own section map."""
+    BASE_URL = ""
+    TOPIC_PAGES: Dict[str, str] = {}
+    # RSS feed or news sitemap per topic, used by the 'feed' discovery mode. Topics that share
+    # one document (a site-wide sitemap) are told apart by URL section and feed categories.
+    FEED_PAGES: Dict[str, str] = {}
+    # Maximum number of section pages fetched at the same time
+    MAX_WORKERS = 10
+    # Bytes of a feed handed to the parser at a time
+    FEED_CHUNK_SIZE = 16 * 1024
+    # Seconds a crawl of the section pages or feeds is reused by the same finder
+    DISCOVERY_TTL = DiscoveryCacheConfig.TTL
+
+class FeedError(Exception):
+    """Raised when a feed could not be fetched"""
+    pass
+
+class BaseArticleFinder:
+    """
+    Extracts URLs for trending articles of the topics of interest from one news source.
+
+    Subclasses set `source`, `config` and `scraper_cls`, and implement extract_hrefs() to pull
+    article links out of a section page. Fetching, topic planning, URL absolutizing and
+    de-duplication are shared.
+    """
+    source = ''
+    config = FinderConfig
+    scraper_cls = None
+
+    def __init__(self, user_data: str, max_workers: int = None,
+                 transport: HTTPTransport = None, cache: HTTPCache = None,
+                 discovery: str = 'html', max_age: Optional[float] = None,
+                 discovery_ttl: Optional[float] = None, discovery_cache: Optional[DiscoveryCache] = None,
+                 revalidate: bool = False):
+        """
+        Args:
+            user_data (str): JSON string containing topics to find articles for
+                           Example: '{"topics": ["Technology", "Health"]}'                    
+            max_workers (int, optional): Maximum number of section pages fetched concurrently.
+                                         Defaults to the source's MAX_WORKERS.
+            transport (HTTPTransport, optional): HTTP client used for section pages. Defaults to the shared transport.
+            cache (HTTPCache, optional): Response cache for section pages. Defaults to the shared cache, if enabled.
+            discovery (str): 'html' scrapes the section pages, 'feed' reads the source's RSS feeds
+                             or news sitemaps instead.
+            max_age (float, optional): In 'feed' mode, skip stories published or modified more
+                                       than this many seconds ago.
+            discovery_ttl (float, optional): Seconds a crawl is reused by this finder. Defaults to
+                                             the source's DISCOVERY_TTL.
+            discovery_cache (DiscoveryCache, optional): Cache shared with other finders. Its own TTL
+                                                        applies. Defaults to a private cache.
+            revalidate (bool): Check cached section pages and feeds with the server on every crawl
+                               instead of serving them while fresh. A 304 still costs no body.
+        Raises:
+            NoTopicsError: If no topics are provided by the user_data json string
+            NoMatchingTopicsError: If no valid topics are found in the user_data json string
+            InvalidJSONError: Invalid JSON format in user_data
+        """
+        # Log under the subclass's module so each source keeps its own log directory
+        self.logger = setup_logger(type(self).__module__)
+        self.max_workers = max(1, max_workers or self.config.MAX_WORKERS)
+        self.transport = transport
+        self.cache = cache
+        self.revalidate = revalidate
+        if discovery not in ('html', 'feed'):
+            raise ValueError(f"Unknown discovery mode '{discovery}', expected 'html' or 'feed'")
+        self.discovery = discovery
+        self.max_age = max_age
+        # url -> FeedEntry from the last feed search, carries publication and lastmod times
+        self.feed_entries: Dict[str, FeedEntry] = {}
+        # Crawl results by topic, so repeated accessors do not fetch the pages again
+        if discovery_cache is None:
+            discovery_cache = DiscoveryCache(self.config.DISCOVERY_TTL if discovery_ttl is None else discovery_ttl)
+        self.discovery_cache = discovery_cache
+        config_name = self.config.__name__
+        
+        # This error handling will likely be given to another file. Will keep for now
+        try:
+            parsed_data = json.loads(user_data)
+            self.topics = parsed_data.get('topics', [])
+
+            if not self.topics:
+                self.logger.critical("No topics provided in user_data")
+                raise NoTopicsError("No topics provided in user_data")
+            
+            if not set(self.topics) & set(self.config.TOPIC_PAGES.keys()):
+                self.logger.critical(f"Invalid topics provided: {self.topics}. Valid topics are: {list(self.config.TOPIC_PAGES.keys())}")
+                raise NoMatchingTopicsError(f'User provided topics do not match the topics in the {config_name}.TOPIC_PAGES dictionary')  
+                  
+        except json.JSONDecodeError as e:
+            self.logger.critical(f"Invalid JSON format in user_data: {e}")
+            raise InvalidJSONError(f"Invalid JSON format in user_data: {e}")
+        
+        self.topic_pages = self.topic_navigation()
+
+    def topic_navigation(self) -> Dict[str, str]:
+        """
+        Navigates to the proper URLs based on selected topics.
+
+        Returns:
+            Dict[str, str]: Topic to section page URL plan, in the order the topics were requested
+
+        Raises:
+            NoMatchingTopicsError: If no matching topics are found
+            ValueError: Navigation fails
+        """
+        user_topics = self.topics
+        topic_pages = self.config.TOPIC_PAGES
+
+        try:
+            # dict.fromkeys keeps the user's ordering while dropping repeated topics
+            valid_topics = [topic for topic in dict.fromkeys(user_topics) if topic in topic_pages]
+            if not valid_topics:
+                # This may not be useful right now, but will be once the LLM is creating desired user topics based 
+                # on political preferences.
+                self.logger.error(f"No matching topics found. Provided topics: {self.topics}")
+                raise NoMatchingTopicsError(f"No matching topics found. Provided topics: {self.topics}")
+            
+            return {topic: topic_pages[topic] for topic in valid_topics}
+            
+        except Exception as e:
+            self.logger.error(f"Error in topic_navigation: {e}")
+            raise Exception(f"Error in topic_navigation: {e}")   
+
+    def fetch_page_soup(self, topic: str, page: str) -> object:
+        """
+        Fetches and parses the HTML content of a single topic page.
+
+        Args:
+            topic (str): Topic the page belongs to
+            page (str): URL of the section page
+
+        Returns:
+            object: BeautifulSoup object for the page
+
+        Raises:
+            PageSoupError: If page content could not be fetched
+        """
+        base_scraper = BaseScraper(
+            url=page, transport=self.transport, cache=self.cache, cache_kind='section', revalidate=self.revalidate
+        )
+        page_soup = base_scraper.get_soup() # Let the BaseScraper handle the errors
+        if not page_soup:
+            self.logger.error(f"Could not get soup for {topic} from {page}")
+            raise PageSoupError(f"Could not get soup for {topic} from {page}")
+
+        return page_soup
+
+    def get_page_soup(self, topics: Optional[List[str]] = None) -> Dict[str, object]:
+        """
+        Fetches and parses HTML content for each topic page.
+        Every section page is fetched exactly once, with up to max_workers fetches in flight.
+
+        Args:
+            topics (List[str], optional): Topics to fetch. Defaults to every planned topic.
+
+        Returns:
+            Dict[str, object]: Dictionary containing BeautifulSoup objects for each topic
+
+        Raises:
+            PageSoupError: If page content could not be fetched for any topic
+        """
+        pages = {topic: self.topic_pages[topic] for topic in (self.topic_pages if topics is None else topics)}
+        workers = min(self.max_workers, len(pages)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                topic: executor.submit(self.fetch_page_soup, topic, page)
+                for topic, page in pages.items()
+            }
+            # result() re-raises the PageSoupError of the first failing topic
+            content = {topic: future.result() for topic, future in futures.items()}
+
+        return content
+
+    def extract_hrefs(self, topic: str, page: object) -> List[str]:
+        """
+        Pulls the article hrefs out of one section page. Implemented by each source.
+
+        Args:
+            topic (str): Topic of the section page
+            page (object): BeautifulSoup object of the section page
+
+        Returns:
+            List[str]: Raw href values, relative or absolute
+        """
+        raise NotImplementedError
+
+    def discovery_key(self, mode: str, topic: str) -> tuple:
+        """
+        Key of one topic's crawl in the discovery cache.
+        """
+        return (self.source, mode, topic, self.max_age if mode == 'feed' else None)
+
+    def cached_topics(self, mode: str) -> Dict[str, object]:
+        """
+        Returns the unexpired crawl results of the planned topics. Topics not in the result need a crawl.
+        """
+        cached = {}
+        for topic in self.topic_pages:
+            value = self.discovery_cache.get(self.discovery_key(mode, topic))
+            if value is not None:
+                cached[topic] = value
+        return cached
+
+    def clear_discovery(self):
+        """
+        Forgets this source's crawls, so the next accessor fetches the pages again.
+        """
+        self.discovery_cache.clear(self.source)
+
+    def hyperlink_search(self) -> Dict[str, List[str]]:
+        """
+        Searches soup for hyperlinks.
+        Section pages crawled within the discovery TTL are not fetched again.
+
+        Returns:
+            Dict[str, List[str]]: Dictionary containing article hyperlinks by topic
+
+        Raises:
+            ValueError: If page soup is not found
+        """
+        content = self.cached_topics('html')
+        missing = [topic for topic in self.topic_pages if topic not in content]
+        if missing:
+            soup = self.get_page_soup(missing)
+            try:
+                for topic, page in soup.items():
+                    content[topic] = self.extract_hrefs(topic, page)
+                    self.discovery_cache.put(self.discovery_key('html', topic), content[topic])
+
+            except Exception as e:
+                self.logger.error(f"Error in hyperlink_search: {e}")
+                raise Exception(f"Error in hyperlink_search: {e}")
+
+        # Copies, so callers editing the result cannot alter the cached crawl
+        return {topic: list(content[topic]) for topic in self.topic_pages}
+
+    def fetch_feed(self, feed_url: str) -> List[FeedEntry]:
+        """
+        Fetches one feed document and parses it incrementally.
+
+        Feeds go through the same path as section pages: browser headers, the response cache
+        with conditional revalidation, and the transport's byte accounting.
+
+        Args:
+            feed_url (str): RSS feed or sitemap URL
+
+        Returns:
+            List[FeedEntry]: Stories listed in the feed
+
+        Raises:
+            FeedError: If the feed could not be fetched or parsed
+        """
+        scraper = BaseScraper(
+            url=feed_url, transport=self.transport, cache=self.cache, cache_kind='section', revalidate=self.revalidate
+        )
+        content = scraper.fetch_html_content()
+        if not content:
+            self.logger.error(f"Could not read feed {feed_url}")
+            raise FeedError(f"Could not read feed {feed_url}")
+
+        chunk_size = self.config.FEED_CHUNK_SIZE
+        chunks = (content[start:start + chunk_size] for start in range(0, len(content), chunk_size))
+        try:
+            return list(parse_feed(chunks))
+        except Exception as e:
+            self.logger.error(f"Could not parse feed {feed_url}: {e}")
+            raise FeedError(f"Could not parse feed {feed_url}: {e}")
+
+    def topic_terms(self, topic: str) -> set:
+        """
+        Words that identify a topic in a shared feed: the topic name and its section path.
+        """
+        terms = {topic.lower()}
+        section = urlsplit(self.config.TOPIC_PAGES.get(topic, '')).path.strip('/').lower()
+        if section:
+            terms.add(section)
+        return terms
+
+    def matches_topic(self, topic: str, entry: FeedEntry) -> bool:
+        """
+        Checks whether a story from a shared feed belongs to a topic, by URL path segment or category.
+        """
+        terms = self.topic_terms(topic)
+        segments = {segment.lower() for segment in urlsplit(entry.url).path.split('/') if segment}
+        categories = {category.lower() for category in entry.categories}
+        return bool(terms & (segments | categories))
+
+    def feed_search(self) -> Dict[str, List[str]]:
+        """
+        Finds article URLs by topic from the source's feeds instead of its section pages.
+        Every distinct feed document is fetched once, concurrently, and shared by the topics using it.
+        Topics read within the discovery TTL are not fetched again.
+
+        Returns:
+            Dict[str, List[str]]: Dictionary containing article URLs by topic, newest first
+
+        Raises:
+            FeedError: If a feed could not be read
+        """
+        plan = {topic: self.config.FEED_PAGES[topic] for topic in self.topic_pages if topic in self.config.FEED_PAGES}
+        if not plan:
+            raise FeedError(f"No feeds configured for topics {list(self.topic_pages)}")
+
+        # topic -> stories, newest first
+        stories_by_topic = {topic: stories for topic, stories in self.cached_topics('feed').items() if topic in plan}
+        plan = {topic: feed_url for topic, feed_url in plan.items() if topic not in stories_by_topic}
+        if plan:
+            stories_by_topic.update(self.read_feeds(plan))
+
+        content = {}
+        # Rebuilt on every search, so it only describes the stories currently listed
+        feed_entries = {}
+        for topic in self.topic_pages:
+            stories = stories_by_topic.get(topic)
+            if stories is None:
+                continue
+            for entry in stories:
+                feed_entries[self.absolutize(entry.url)] = entry
+            content[topic] = [entry.url for entry in stories]
+        self.feed_entries = feed_entries
+
+        return content
+
+    def read_feeds(self, plan: Dict[str, str]) -> Dict[str, List[FeedEntry]]:
+        """
+        Fetches the feeds of a topic -> feed URL plan and files their stories by topic.
+
+        Returns:
+            Dict[str, List[FeedEntry]]: Stories by topic, newest first
+
+        Raises:
+            FeedError: If a feed could not be read
+        """
+        feed_urls = list(dict.fromkeys(plan.values()))
+        workers = min(self.max_workers, len(feed_urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            entries = dict(zip(feed_urls, executor.map(self.fetch_feed, feed_urls)))
+
+        cutoff = None
+        if self.max_age is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.max_age)
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
+
+        # Feeds configured for more than one topic need filtering by topic
+        configured = list(self.config.FEED_PAGES.values())
+
+        stories_by_topic = {}
+        for topic, feed_url in plan.items():
+            shared = configured.count(feed_url) > 1
+            stories = [
+                entry for entry in entries[feed_url]
+                if (cutoff is None or (entry.timestamp and entry.timestamp >= cutoff))
+                and (not shared or self.matches_topic(topic, entry))
+            ]
+            stories.sort(key=lambda entry: entry.timestamp or oldest, reverse=True)
+            stories_by_topic[topic] = stories
+            self.discovery_cache.put(self.discovery_key('feed', topic), stories)
+
+        return stories_by_topic
+
+    def absolutize(self, hyperlink: str) -> str:
+        """
+        Resolves an href against the source's base URL. Absolute hrefs are kept as they are.
+        """
+        return urljoin(f"{self.config.BASE_URL}/", hyperlink.strip())
+
+    def is_article_url(self, url: str) -> bool:
+        """
+        Decides whether an absolute URL points to an article. By default any http(s) link qualifies.
+        """
+        return urlsplit(url).scheme in ('http', 'https')
+
+    def get_link(self) -> Dict[str, List[str]]:
+        """
+        Converts extracted hyperlinks to accessible URLs.
+
+        Returns:
+            Dict[str, List[str]]: Dictionary of complete URLs by topic
+
+        Raises:
+            ValueError: If no hyperlinks are found
+        """
+        try:
+            hyperlinks = self.feed_search() if self.discovery == 'feed' else self.hyperlink_search()
+            if not hyperlinks:
+                raise ValueError('No hyperlinks found')
+
+            urls = {}
+            for topic, hyperlink_list in hyperlinks.items():
+                absolute = (self.absolutize(hyperlink) for hyperlink in hyperlink_list)
+                urls[topic] = [url for url in absolute if self.is_article_url(url)]
+            
+            # remove duplicates
+            urls = {topic: list(dict.fromkeys(links)) for topic, links in urls.items()}
+            return urls
+            
+        except Exception as e:
+            self.logger.error(f"Error creating URLs in get_link: {e}")
+            raise Exception(f"Error creating URLs in get_link: {e}")
@@ -1,31 +1,124 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from typing import Dict, Iterable, Optional, Tuple
+from logger import setup_logger
+from metrics import REGISTRY, timed
+from politeness import host_key
+from transport import RESPONSE_BYTES, HTTPTransport, get_default_transport
+from http_cache import HTTPCache, get_default_cache
+from html_parser import parse_html
+from extraction_spec import SelectorSpec
+from streaming import ArticleBoundaryDetector, StreamConfig, read_capped
+
+EXTRACTIONS = REGISTRY.counter('extraction_total', 'Field extractions by source, field, selector and result (found or missing)')
 
 class BaseScraper:
-    def __init__(self, url):
+    # Maps each field name to the method that extracts it from a parsed soup.
+    # Subclasses register their extractors here, e.g. {'headline': 'parse_headline'}
+    extractors: Dict[str, str] = {}
+
+    # Where each field lives on the page. Compiled once per source, see extraction_spec.
+    selectors: Optional[SelectorSpec] = None
+
+    # Subtrees the extractors need. Used to skip the rest of the page when partial parsing is on.
+    parse_only: Optional[SoupStrainer] = None
+
+    def __init__(
+        self,
+        url,
+        transport: Optional[HTTPTransport] = None,
+        cache: Optional[HTTPCache] = None,
+        parser: Optional[str] = None,
+        partial: bool = False,
+        stream: bool = False,
+        max_bytes: int = StreamConfig.MAX_BYTES,
+        cache_kind: str = 'article',
+        revalidate: bool = False
+    ):
+        """
+        Args:
+            url (str): The URL of the page to scrape.
+            transport (HTTPTransport, optional): HTTP client used for fetching. Defaults to the
+                                                 shared pooled transport.
+            cache (HTTPCache, optional): Response cache consulted before fetching. Defaults to the
+                                         process-wide cache, if one has been enabled.
+            parser (str, optional): HTML parser backend ('lxml', 'html.parser'). Defaults to the
+                                    fastest one installed.
+            partial (bool): Parse only the subtrees in `parse_only` instead of the whole page.
+            stream (bool): Read the response in chunks, stop at max_bytes, and stop as soon as
+                           every field container in `selectors` has been received.
+            max_bytes (int): Byte cap for streamed fetches.
+            cache_kind (str): Kind of page being fetched, selects its cache TTL ('section' or 'article')
+            revalidate (bool): Check a cached copy with the server (conditional request) even while
+                               it is fresh, so a changed page is never served from the cache.
+        """
         self.url = url
+        self.transport = transport or get_default_transport()
+        self.cache = cache if cache is not None else get_default_cache()
+        self.parser = parser
+        self.partial = partial
+        self.stream = stream
+        self.max_bytes = max_bytes
+        self.cache_kind = cache_kind
+        self.revalidate = revalidate
+        self.logger = setup_logger(__name__)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3',
             'Referer': 'https://www.google.com/',
             'Accept-Language': 'en-US,en;q=0.9'
         }
 
+        # Parsed document, populated on the first successful call to get_soup()
+        self._soup = None
+
     def fetch_html_content(self) -> bytes:
         """
         Fetches the HTML content of the specified URL.
+        When a response cache is configured, fresh entries are served from disk and stale
+        ones are revalidated with a conditional request.
 
         Returns:
             bytes: The HTML content of the response if successful.
             None: If an error occurs during the request.
         """
+        headers = self.headers
+        cached = self.cache.lookup(self.url) if self.cache else None
+        if cached:
+            if not self.revalidate and self.cache.is_fresh(cached, self.cache_kind):
+                return cached.body
+            headers = {**self.headers, **self.cache.conditional_headers(cached)}
+
         try:
-            # Make the HTTP GET request
-            response = requests.get(url=self.url, headers=self.headers)
+            # Make the HTTP GET request through the pooled transport (timeouts and retries included)
+            response = self.transport.get(self.url, headers=headers, stream=self.stream)
+
+            # Closing hands the pooled connection back, even on a 304 or an error status
+            with response:
+                # The cached copy is still current, nothing but headers was transferred
+                if cached and response.status_code == 304:
+                    self.cache.refresh(self.url, response.headers)
+                    return cached.body
+                # The stale copy could not be reused, the request costs a full download
+                if cached:
+                    self.cache.record_miss()
+
+                # Raise an error for non-200 status codes
+                response.raise_for_status()
 
-            # Raise an error for non-200 status codes
-            response.raise_for_status()
+                if not self.stream:
+                    content = response.content
+                else:
+                    content, reason = self.read_stream(response)
+                    # Only a body read to the end is the page the validators describe. One cut off at
+                    # the byte cap or once the article was complete would come back from the cache,
+                    # or from a 304, as if it were whole.
+                    if reason != 'eof':
+                        return content
 
-            return response.content
+                if self.cache:
+                    self.cache.store(self.url, content, response.headers)
+
+                return content
         
         # Handle HTTP-specific errors (4xx, 5xx)
         except requests.exceptions.HTTPError as http_err:
@@ -42,27 +135,127 @@ class BaseScraper:
         # Handle other requests exceptions
         except requests.RequestException as req_err:
             self.log_errors(f"An error occurred during the request: {req_err}")
-        
+
+    def read_stream(self, response: requests.Response) -> Tuple[bytes, str]:
+        """
+        Reads a streamed response up to max_bytes, stopping early once the article is complete.
+
+        Returns:
+            Tuple[bytes, str]: The bytes read and why reading stopped ('eof', 'complete', 'truncated')
+        """
+        detector = ArticleBoundaryDetector(self.selectors) if self.selectors else None
+        content, reason = read_capped(response, max_bytes=self.max_bytes, detector=detector)
+        RESPONSE_BYTES.inc(len(content), host=host_key(self.url))
+
+        if reason == 'truncated':
+            self.logger.warning(f"Stopped reading {self.url} at the {self.max_bytes} byte cap")
+        return content, reason
+
+    def log_errors(self, message: str):
+        """
+        Logs a fetch error together with the URL it happened on.
+        """
+        self.logger.error(f"{message} ({self.url})")
+
     def get_soup(self):
         """
-        Parses HTML content with BS4 and returns the BS4 object
+        Parses HTML content with BS4 and returns the BS4 object.
+        The page is fetched and parsed once per instance; later calls reuse the cached tree.
         
         Returns:
             bs4.BeautifulSoup: The parsed HTML content of the response if successful.
             None: If an error occurs when the object is being created.      
         """
+        if self._soup is not None:
+            return self._soup
+
         # retrieve html content
         html_content = self.fetch_html_content()
 
+        return self.load_html(html_content)
+
+    def load_html(self, html_content: bytes):
+        """
+        Parses already downloaded HTML and caches the tree, so extract() runs without fetching.
+        
+        Args:
+            html_content (bytes): Raw HTML of the page at self.url
+
+        Returns:
+            bs4.BeautifulSoup: The parsed HTML content if successful.
+            None: If html_content is empty or could not be parsed.
+        """
         # if html content is None
         if not html_content:
             return None
             
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
-            return soup
+            parse_only = self.parse_only if self.partial else None
+            with timed('parse_seconds', source=type(self).__name__, mode='partial' if parse_only else 'full'):
+                self._soup = parse_html(html_content, parser=self.parser, parse_only=parse_only)
+            return self._soup
         except Exception as e:
             return None
 
+    def select(self, soup, field: str):
+        """
+        Finds the element holding a field using the source's compiled selectors.
+
+        Args:
+            soup (bs4.BeautifulSoup): The parsed page
+            field (str): Field name in `selectors`
+
+        Returns:
+            bs4.Tag: The matching element.
+            None: If the field is not on the page.
+        """
+        partial = self.partial and self.parse_only is self.selectors.strainer
+        return self.selectors.select_one(soup, field, partial=partial)
+
+    def clear_cache(self):
+        """
+        Drops the cached parsed document so the next extraction fetches the page again.
+        """
+        self._soup = None
+
+    def extract(self, fields: Optional[Iterable[str]] = None) -> Dict[str, object]:
+        """
+        Runs the registered field extractors against a single fetch and parse of the page.
+
+        Args:
+            fields (Iterable[str], optional): Names of the fields to extract. Defaults to every
+                                              field registered in `extractors`.
+
+        Returns:
+            Dict[str, object]: Extracted value for each requested field. Values are None
+                               when the page could not be fetched or parsed.
+
+        Raises:
+            KeyError: If a requested field has no registered extractor
+        """
+        fields = list(self.extractors) if fields is None else list(fields)
+        for field in fields:
+            if field not in self.extractors:
+                raise KeyError(f"No extractor registered for field '{field}' on {type(self).__name__}")
+
+        soup = self.get_soup()
+        if not soup:
+            return {field: None for field in fields}
+
+        result = {field: getattr(self, self.extractors[field])(soup) for field in fields}
+        self.record_extractions(result)
+        return result
+
+    def record_extractions(self, result: Dict[str, object]):
+        """
+        Counts which fields were found, per selector, so a source whose markup changed shows up
+        as a drop in the found rate rather than as silently empty articles.
+        """
+        source = type(self).__name__
+        for field, value in result.items():
+            selector = self.selectors.fields[field].label if self.selectors and field in self.selectors.fields else ''
+            EXTRACTIONS.inc(source=source, field=field, selector=selector,
+                            result='missing' if value is None else 'found')
+
 if __name__ == '__main__':
-    print('File has been excecuted properly')
\ No newline at end of file
+    print('File has been excecuted properly')
@@ -0,0 +1,211 @@
+import argparse
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+from base_article_finder import InvalidJSONError, NoTopicsError
+from dedup import StoryDeduplicator
+from finders import build_finders
+from http_cache import HTTPCache, set_default_cache
+from logger import setup_logger
+from map_reduce import ChunkConfig, MapReduceSummarizer
+from pipeline import ArticleResult, CrawlPipeline
+from scheduling import LLMBudget
+from seen_index import SeenArticleIndex
+from summarizer import OllamaSummarizer
+from summary_cache import SummaryCache
+from text_cleaner import TextCleaner
+
+@dataclass
+class UserRequest:
+    """One user's topic request, as read from a line of the batch file"""
+    user: str
+    topics: List[str]
+    # Restricts the user's feed to these sources. None means every source.
+    sources: Optional[List[str]] = None
+
+@dataclass
+class UserFeed:
+    """The articles fanned out to one user"""
+    user: str
+    articles: List[Dict[str, object]] = field(default_factory=list)
+
+def load_requests(path: str) -> List[UserRequest]:
+    """
+    Reads a JSONL file of user topic requests, one {"user": ..., "topics": [...]} object per line.
+    An optional "sources" list limits a user's feed to those outlets.
+
+    Args:
+        path (str): Path to the JSONL file
+
+    Returns:
+        List[UserRequest]: The requests in file order
+
+    Raises:
+        InvalidJSONError: If a line is not valid JSON
+        NoTopicsError: If the file holds no request with topics
+    """
+    requests = []
+    with open(path) as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise InvalidJSONError(f"Invalid JSON on line {line_number} of {path}: {e}")
+
+            topics = data.get('topics', [])
+            if not topics:
+                continue
+            requests.append(UserRequest(
+                user=str(data.get('user', line_number)),
+                topics=list(topics),
+                sources=data.get('sources')
+            ))
+
+    if not requests:
+        raise NoTopicsError(f"No topic requests found in {path}")
+    return requests
+
+def merge_topics(requests: List[UserRequest]) -> List[str]:
+    """
+    Returns the union of every user's topics, in first-requested order.
+    """
+    return list(dict.fromkeys(topic for request in requests for topic in request.topics))
+
+def topic_weights(requests: List[UserRequest]) -> Dict[str, float]:
+    """
+    Weighs each topic by the number of users who asked for it.
+    """
+    weights: Dict[str, float] = {}
+    for request in requests:
+        for topic in set(request.topics):
+            weights[topic] = weights.get(topic, 0) + 1
+    return weights
+
+def fan_out(requests: List[UserRequest], articles: List[ArticleResult]) -> List[UserFeed]:
+    """
+    Gives each user the successfully scraped articles discovered under one of their topics.
+
+    Args:
+        requests (List[UserRequest]): The user requests
+        articles (List[ArticleResult]): Pipeline results, one per unique article
+
+    Returns:
+        List[UserFeed]: One feed per request, in request order
+    """
+    # topic -> articles, so each user costs one lookup per topic rather than a pass over all articles
+    by_topic: Dict[str, List[ArticleResult]] = {}
+    for article in articles:
+        if article.error:
+            continue
+        for topic in article.topics:
+            by_topic.setdefault(topic, []).append(article)
+
+    feeds = []
+    for request in requests:
+        feed = UserFeed(user=request.user)
+        delivered = set()
+        for topic in request.topics:
+            for article in by_topic.get(topic, []):
+                if article.url in delivered:
+                    continue
+                if request.sources and article.source not in request.sources:
+                    continue
+                delivered.add(article.url)
+                feed.articles.append({
+                    'topic': topic,
+                    'source': article.source,
+                    'url': article.url,
+                    'headline': article.headline,
+                    'summary': article.summary,
+                })
+        feeds.append(feed)
+    return feeds
+
+def run_batch(
+    requests: List[UserRequest],
+    summarizer: Optional[OllamaSummarizer] = None,
+    seen_index: Optional[SeenArticleIndex] = None,
+    budget: Optional[LLMBudget] = None,
+    chunk_tokens: Optional[int] = ChunkConfig.CHUNK_TOKENS,
+    **finder_kwargs
+) -> List[UserFeed]:
+    """
+    Serves many users with a single crawl: the union of their topics is discovered once,
+    every unique article is fetched and summarized once, and the results are fanned out.
+
+    Args:
+        requests (List[UserRequest]): The user requests
+        summarizer (OllamaSummarizer, optional): Summarizer for the articles. Without one,
+                                                 feeds carry headlines only.
+        seen_index (SeenArticleIndex, optional): Skips articles already handled by earlier runs
+        budget (LLMBudget, optional): Limits summarization. Topics requested by more users are
+                                      ranked higher, so their stories are summarized first.
+        chunk_tokens (int, optional): Articles longer than this are summarized chunk by chunk
+                                      (map-reduce) instead of in one prompt. None disables chunking.
+        **finder_kwargs: Options passed to every finder (transport, cache, discovery, ...)
+
+    Returns:
+        List[UserFeed]: One feed per request, in request order
+    """
+    logger = setup_logger(__name__)
+    topics = merge_topics(requests)
+    # Only narrow the crawl when every user named their sources
+    sources = None
+    if all(request.sources for request in requests):
+        sources = list(dict.fromkeys(source for request in requests for source in request.sources))
+    logger.info(f"{len(requests)} users requested {len(topics)} unique topics: {topics}")
+
+    finders = build_finders(json.dumps({'topics': topics}), sources=sources, **finder_kwargs)
+    map_reducer = MapReduceSummarizer(summarizer, chunk_tokens=chunk_tokens) if summarizer and chunk_tokens else None
+    summarize = None
+    if summarizer:
+        summarize = map_reducer.summarize if map_reducer else summarizer.summarize
+    pipeline = CrawlPipeline(
+        finders=finders,
+        summarize=summarize,
+        summarize_concurrency=summarizer.max_concurrency if summarizer else 1,
+        deduplicator=StoryDeduplicator(),
+        seen_index=seen_index,
+        cleaner=TextCleaner(),
+        topic_weights=topic_weights(requests),
+        budget=budget
+    )
+    try:
+        articles = pipeline.run_sync()
+    finally:
+        if map_reducer:
+            map_reducer.close()
+    logger.info(f"Scraped {len(articles)} unique articles for {len(requests)} users")
+
+    return fan_out(requests, articles)
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Summarize the news for many users in one crawl")
+    arg_parser.add_argument('requests', help="JSONL file with one {\"user\": ..., \"topics\": [...]} per line")
+    arg_parser.add_argument('--output', default='batch_results.jsonl', help="JSONL file receiving one feed per user")
+    arg_parser.add_argument('--discovery', choices=('html', 'feed'), default='html')
+    arg_parser.add_argument('--time-budget', type=float, default=None, help="seconds of summarization for the batch")
+    arg_parser.add_argument('--token-budget', type=int, default=None, help="prompt tokens summarized for the batch")
+    arg_parser.add_argument('--chunk-tokens', type=int, default=ChunkConfig.CHUNK_TOKENS,
+                            help="summarize longer articles chunk by chunk, 0 sends every article as one prompt")
+    args = arg_parser.parse_args()
+
+    # Reuse pages downloaded by earlier runs, revalidating them when they go stale
+    set_default_cache(HTTPCache())
+    summarizer = OllamaSummarizer(cache=SummaryCache())
+    try:
+        budget = LLMBudget(args.time_budget, args.token_budget) if args.time_budget or args.token_budget else None
+        feeds = run_batch(load_requests(args.requests), summarizer=summarizer, budget=budget,
+                          chunk_tokens=args.chunk_tokens or None, discovery=args.discovery)
+    finally:
+        summarizer.close()
+
+    with open(args.output, 'w') as f:
+        for feed in feeds:
+            f.write(json.dumps(asdict(feed)) + '\n')
+
+if __name__ == '__main__':
+    main()
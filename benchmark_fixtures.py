@@ -0,0 +1,194 @@
+import glob
+import os
+import random
+from typing import Iterable, List, Optional
+
+# Recorded pages live in fixtures/<source>/<kind>/*.html. When none have been recorded,
+# synthetic pages with the same structure as the live sites are generated instead.
+FIXTURE_DIR = 'fixtures'
+
+# Class of the article body container for each source, as matched by its scraper
+CONTENT_CLASSES = {
+    'cnn': 'article__content',
+    'fox': 'article-content',
+    'ap': 'RichTextStoryBody RichTextBody',
+}
+
+WORDS = (
+    "the officials said on tuesday that a new report found the state would "
+    "review its plan after residents raised concerns about costs and delays in "
+    "federal funding while lawmakers debated the measure late into the night"
+).split()
+
+def sentence(rng: random.Random, length: int = 18) -> str:
+    words = [rng.choice(WORDS) for _ in range(length)]
+    return ' '.join(words).capitalize() + '.'
+
+def build_article_page(source: str, paragraphs: int = 40, filler_kb: int = 400, seed: int = 0) -> bytes:
+    """
+    Builds a synthetic article page shaped like the live pages of a source.
+
+    The page has navigation, large inline scripts and JSON, ad slots, related-article
+    teasers and image captions around one h1 and the article body container.
+
+    Args:
+        source (str): One of CONTENT_CLASSES
+        paragraphs (int): Number of body paragraphs
+        filler_kb (int): Approximate kilobytes of inline script and markup outside the article
+        seed (int): Seed for the generated text
+
+    Returns:
+        bytes: The page as UTF-8 HTML
+    """
+    rng = random.Random(seed)
+    script = '<script>window.__DATA__ = {"items": [%s]};</script>' % ','.join(
+        '{"id": %d, "title": "%s"}' % (i, sentence(rng, 6)) for i in range(filler_kb * 1024 // 120)
+    )
+    nav = '<nav class="header__nav">%s</nav>' % ''.join(
+        f'<div class="nav__item"><a href="/section/{i}">{rng.choice(WORDS)}</a></div>' for i in range(200)
+    )
+
+    body = []
+    for i in range(paragraphs):
+        body.append(f'<p class="paragraph">{" ".join(sentence(rng) for _ in range(4))}</p>')
+        if i % 8 == 3:
+            body.append('<div class="ad-slot"><div class="ad-feedback">Ad Feedback</div></div>')
+        if i % 10 == 5:
+            body.append(f'<div class="related-content"><span>Related Article</span><a href="/r/{i}">{sentence(rng, 8)}</a></div>')
+        if i % 12 == 7:
+            body.append(f'<figure class="image"><figcaption class="image__caption">{sentence(rng, 10)} Credit: Getty Images</figcaption></figure>')
+
+    page = (
+        '<!DOCTYPE html><html><head><title>Article</title>'
+        f'{script}</head><body>{nav}'
+        f'<div class="layout"><div class="headline"><h1 class="headline__text">{sentence(rng, 10)}</h1></div>'
+        f'<div class="{CONTENT_CLASSES[source]}">{"".join(body)}</div>'
+        f'<footer>{"".join(f"<div class=footer__item>{sentence(rng, 5)}</div>" for _ in range(100))}</footer>'
+        '</div></body></html>'
+    )
+    return page.encode('utf-8')
+
+def article_href(source: str, index: int) -> str:
+    """
+    Returns a link to the index-th synthetic story, in the form the source's section pages use.
+    """
+    if source == 'cnn':
+        return f'/2025/01/15/us/story-{index}/index.html'
+    if source == 'fox':
+        return f'https://www.foxnews.com/us/story-{index}'
+    return f'https://apnews.com/article/story-{index}'
+
+def build_section_page(source: str, links: int = 30, seed: int = 0) -> bytes:
+    """
+    Builds a synthetic section page holding article links in the markup each finder reads:
+    the CNN headline card wrapper, Fox News article cards and AP story promos.
+
+    Args:
+        source (str): One of CONTENT_CLASSES
+        links (int): Number of article links on the page
+        seed (int): Seed for the generated text and link numbering
+
+    Returns:
+        bytes: The page as UTF-8 HTML
+    """
+    rng = random.Random(seed)
+    nav = '<nav class="header__nav">%s</nav>' % ''.join(
+        f'<div class="nav__item"><a href="/section/{i}">{rng.choice(WORDS)}</a></div>' for i in range(200)
+    )
+
+    hrefs = [article_href(source, seed * 1000 + i) for i in range(links)]
+    if source == 'cnn':
+        cards = '<div class="container_lead-plus-headlines__cards-wrapper">%s</div>' % ''.join(
+            f'<div class="card"><a href="{href}"><span class="container__headline-text">{sentence(rng, 9)}</span></a></div>'
+            for href in hrefs
+        )
+    elif source == 'fox':
+        cards = ''.join(
+            f'<article class="article"><div class="info"><h3 class="title"><a href="{href}">{sentence(rng, 9)}</a></h3></div></article>'
+            for href in hrefs
+        )
+    else:
+        cards = ''.join(
+            f'<div class="PagePromo"><h3 class="PagePromo-title"><a class="Link" href="{href}">{sentence(rng, 9)}</a></h3></div>'
+            for href in hrefs
+        )
+
+    page = (
+        '<!DOCTYPE html><html><head><title>Section</title></head>'
+        f'<body>{nav}<main class="layout">{cards}</main></body></html>'
+    )
+    return page.encode('utf-8')
+
+def fixture_path(source: str, kind: str, name: str) -> str:
+    """
+    Returns where a recorded page is kept, creating its directory.
+    """
+    directory = os.path.join(FIXTURE_DIR, source, kind)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f'{name}.html')
+
+def save_page(source: str, kind: str, name: str, html: bytes):
+    """
+    Records a downloaded page as a fixture.
+
+    Args:
+        source (str): One of CONTENT_CLASSES
+        kind (str): Fixture kind, 'article' or 'section'
+        name (str): File name without extension
+        html (bytes): Raw page
+    """
+    with open(fixture_path(source, kind, name), 'wb') as f:
+        f.write(html)
+
+def recorded_paths(source: str, kind: str) -> List[str]:
+    """
+    Returns the recorded pages of one source and kind, empty when none have been recorded.
+    """
+    return sorted(glob.glob(os.path.join(FIXTURE_DIR, source, kind, '*.html')))
+
+def synthetic_notice(sources: Iterable[str], kinds: Iterable[str] = ('article',)) -> Optional[str]:
+    """
+    Describes which fixtures fall back to synthetic pages, for benchmarks to print with their results.
+
+    Synthetic sets are a handful of pages built from one small vocabulary, so the pages are
+    near-duplicates of each other: deduplication collapses most articles and the summarization
+    numbers do not reflect live traffic. Record real pages with offline_benchmark.py --record.
+
+    Returns:
+        str: The notice, if any source and kind has no recorded pages.
+        None: If every page comes from recorded fixtures.
+    """
+    kinds = list(kinds)
+    synthetic = [
+        f"{source}/{kind}" for source in sources for kind in kinds if not recorded_paths(source, kind)
+    ]
+    if not synthetic:
+        return None
+    return (
+        f"NOTE: no recorded fixtures for {', '.join(synthetic)}; using SYNTHETIC pages. They are "
+        f"near-duplicates of each other, so timings and dedup/summarization counts do not reflect "
+        f"live pages. Record real ones with: python offline_benchmark.py --record"
+    )
+
+def load_pages(source: str, kind: str = 'article', count: int = 5) -> List[bytes]:
+    """
+    Loads recorded pages for a source, falling back to synthetic ones.
+
+    Args:
+        source (str): One of CONTENT_CLASSES
+        kind (str): Fixture kind, 'article' or 'section'
+        count (int): Number of synthetic pages to generate if nothing is recorded
+
+    Returns:
+        List[bytes]: Raw HTML pages
+    """
+    paths = recorded_paths(source, kind)
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+        return pages
+
+    build = build_section_page if kind == 'section' else build_article_page
+    return [build(source, seed=seed) for seed in range(count)]
@@ -1,31 +1,60 @@
-from cnn_article_finder import CNNArticleFinder
-from cnn_scraper import CNNScraper
+from finders import build_finders
+from pipeline import CrawlPipeline
+from http_cache import HTTPCache, set_default_cache
+from summarizer import OllamaSummarizer
+from map_reduce import MapReduceSummarizer
+from summary_cache import SummaryCache
+from dedup import StoryDeduplicator
+from seen_index import SeenArticleIndex
+from text_cleaner import TextCleaner
+from metrics import REGISTRY
 import json
+import os
 from logger import setup_logger
 
 def main():
     # setup logger
     # logger is inside the function to keep the module name as cnn_pipeline_test
     logger = setup_logger(__name__)
+
+    # Reuse pages downloaded by earlier runs, revalidating them when they go stale
+    set_default_cache(HTTPCache())
     
     user_data = json.dumps({
         'topics': ['US']
     })
     
-    cnn_article_finder = CNNArticleFinder(user_data)
-    links = cnn_article_finder.get_link() #dict {topic: [link1, link2, ...]}
+    # CNN, Fox News and AP are discovered in parallel, each scraped with its own scraper
+    article_finders = build_finders(user_data)
+
+    summarizer = OllamaSummarizer(cache=SummaryCache())
+    # Long articles are summarized chunk by chunk, short ones in a single request
+    map_reducer = MapReduceSummarizer(summarizer)
+
+    try:
+        # Discovery, fetching/extraction and summarization run as concurrent stages
+        pipeline = CrawlPipeline(
+            finders=article_finders,
+            summarize=map_reducer.summarize,
+            summarize_concurrency=summarizer.max_concurrency,
+            deduplicator=StoryDeduplicator(),
+            seen_index=SeenArticleIndex(),
+            cleaner=TextCleaner()
+        )
+        articles = pipeline.run_sync()
+    finally:
+        map_reducer.close()
+        summarizer.close()
+
+    for article in articles:
+        print(f"Link ({article.source}): {article.url}")
+        if article.error:
+            continue
+        logger.info(f"Article Body: found")
+        logger.info(f"Summary: {article.summary}")
 
-    for topic, link_list in links.items():
-        for link in link_list:
-            print(f"Link: {link}")
-            try:  
-                cnn_scraper = CNNScraper(link)
-                headline, article_body = cnn_scraper.get_article_data()
-                logger.info(f"Headline: {headline}")
-                logger.info(f"Article Body: found")
-            except Exception as e:
-                logger.error(f"Error: {e}") 
-                logger.error(f"Link: {link}")   
+    # Per-stage timings, cache hit rates and LLM throughput for this run
+    REGISTRY.write_snapshot(os.path.join('logs', 'metrics.json'))
 
 if __name__ == "__main__":
     main()
@@ -1,34 +1,43 @@
 from base_scraper import BaseScraper
+from extraction_spec import FieldSelector, SelectorSpec
+from html_parser import block_text
 
 class CNNScraper(BaseScraper):
-    def __init__(self, url: str):
+    extractors = {
+        'headline': 'parse_headline',
+        'content': 'parse_content',
+    }
+    selectors = SelectorSpec(
+        headline=FieldSelector('h1'),
+        content=FieldSelector('div', class_contains=('article', 'content')),
+    )
+    parse_only = selectors.strainer
+
+    def __init__(self, url: str, **kwargs):
         """
         Initializes the CNNScraper with the URL of the CNN article.
 
         Args:
             url (str): The URL of the article to scrape.
+            **kwargs: Fetch and parse options passed to BaseScraper (transport, cache, parser, partial).
         """
         if not isinstance(url, str) or not url:
             raise ValueError("A valid URL is required to initialize CNNScraper.")
-        super().__init__(url)
+        super().__init__(url, **kwargs)
 
-    def get_headline(self) -> str:
+    def parse_headline(self, soup) -> str:
         """
-        Extracts the headline from the article page.
+        Extracts the headline from an already parsed article page.
+
+        Args:
+            soup (bs4.BeautifulSoup): The parsed article page.
 
         Returns:
             str: The article headline if found.
             None: If an error occurs or the headline is not found.
-        """ 
-        # retrieve html content
-        soup = self.get_soup()
-
-        # if html content is None
-        if not soup:
-            return None
-            
+        """
         try:
-            article_headline = soup.find('h1').get_text(strip=True)  
+            article_headline = self.select(soup, 'headline').get_text(strip=True)  
 
             # Check if the headline exists
             if not article_headline:
@@ -38,33 +47,27 @@ class CNNScraper(BaseScraper):
         except Exception as e:
             # error is most likely due to the element class name changing over time
             return None
-    
-    def get_content(self) -> str:
+
+    def parse_content(self, soup) -> str:
         """
-        Extracts the main content of the article from the page.
+        Extracts the main content of the article from an already parsed page.
+
+        Args:
+            soup (bs4.BeautifulSoup): The parsed article page.
 
         Returns:
             str: The extracted article content if found.
             None: If an error occurs or the content is not found.
         """
-        # retrieve HTML content
-        soup = self.get_soup()
-
-        if not soup:
-            return None
-
         try:
             # Match a div where the class contains 'article' and 'content'.
-            raw_content = soup.find(
-                'div', 
-                class_= lambda cls: cls and 'article' in cls and 'content' in cls in cls
-                )                 
+            raw_content = self.select(soup, 'content')
 
             if not raw_content:
                 raise ValueError("Article content not found in the provided HTML structure.")
             
-            # Extract the text from the raw content
-            raw_text = raw_content.get_text()
+            # Extract the text from the raw content, one block per line
+            raw_text = block_text(raw_content)
             
             return raw_text
 
@@ -72,18 +75,37 @@ class CNNScraper(BaseScraper):
             # Log errors, likely due to changes in HTML structure
             return None
 
+    def get_headline(self) -> str:
+        """
+        Extracts the headline from the article page.
+
+        Returns:
+            str: The article headline if found.
+            None: If an error occurs or the headline is not found.
+        """ 
+        return self.extract(['headline'])['headline']
+    
+    def get_content(self) -> str:
+        """
+        Extracts the main content of the article from the page.
+
+        Returns:
+            str: The extracted article content if found.
+            None: If an error occurs or the content is not found.
+        """
+        return self.extract(['content'])['content']
+
     def get_article_data(self) -> tuple[str, str]:
         """
         Extracts the headline and content from the website.
+        The page is fetched and parsed once for both fields.
 
         Returns:
             tuple: (str, str) The article headline and content if found.
         """
+        article = self.extract(['headline', 'content'])
 
-        headline = self.get_headline()
-        content = self.get_content()
-
-        return headline, content
+        return article['headline'], article['content']
 
 def main():
     scraper_cnn = CNNScraper(url='https://www.cnn.com/2025/01/04/politics/mike-johnson-donald-trump-gop-agenda/index.html')
@@ -91,4 +113,4 @@ def main():
     print(f'CNN:\nArticle Headline: {article_headline}\n\nArticle Content: {article_content}\n')
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,229 @@
+import argparse
+import json
+import os
+import signal
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from dedup import StoryDeduplicator
+from finders import build_finders
+from http_cache import HTTPCache, get_default_cache, set_default_cache
+from logger import setup_logger, stop_logging
+from map_reduce import ChunkConfig, MapReduceSummarizer
+from metrics import REGISTRY
+from pipeline import ArticleResult, CrawlPipeline
+from scheduling import LLMBudget
+from seen_index import SeenArticleIndex, SeenIndexConfig
+from summarizer import OllamaSummarizer
+from summary_cache import SummaryCache
+from text_cleaner import TextCleaner
+from transport import get_default_transport
+
+class DaemonConfig:
+    """Default polling settings for the resident service"""
+    INTERVAL = 300.0            # seconds between two polls of the same source
+    # Per-source overrides of INTERVAL, e.g. {'ap': 120.0}
+    SOURCE_INTERVALS: Dict[str, float] = {}
+    METRICS_PATH = os.path.join('logs', 'metrics.json')
+    SEEN_RETENTION = SeenIndexConfig.RETENTION  # seconds a seen article is remembered without being fetched
+
+class NewsDaemon:
+    """
+    Resident service that polls every source on its own schedule.
+
+    The transport's connection pools, the HTTP and summary caches, the seen-article index
+    and the finders are created once and stay warm across cycles, so each cycle only pays
+    for articles that are new or changed. SIGTERM and SIGINT let the running cycle finish,
+    then close everything and return.
+    """
+    def __init__(
+        self,
+        user_data: str,
+        interval: float = DaemonConfig.INTERVAL,
+        source_intervals: Optional[Dict[str, float]] = None,
+        summarizer: Optional[OllamaSummarizer] = None,
+        seen_index: Optional[SeenArticleIndex] = None,
+        on_results: Optional[Callable[[List[ArticleResult]], None]] = None,
+        metrics_path: Optional[str] = DaemonConfig.METRICS_PATH,
+        topic_weights: Optional[Dict[str, float]] = None,
+        time_budget: Optional[float] = None,
+        token_budget: Optional[int] = None,
+        chunk_tokens: Optional[int] = ChunkConfig.CHUNK_TOKENS,
+        **finder_kwargs
+    ):
+        """
+        Args:
+            user_data (str): JSON string containing topics, e.g. '{"topics": ["US"]}'
+            interval (float): Seconds between two polls of a source
+            source_intervals (Dict[str, float], optional): Per-source overrides of interval
+            summarizer (OllamaSummarizer, optional): Summarizer kept for the daemon's lifetime.
+                                                     Defaults to one backed by a SummaryCache.
+            seen_index (SeenArticleIndex, optional): Seen-article state. Defaults to the on-disk index.
+            on_results (Callable, optional): Called with each cycle's results. Defaults to logging them.
+            metrics_path (str, optional): Where the metrics snapshot is written after every cycle
+            topic_weights (Dict[str, float], optional): Importance of each topic when ranking articles
+            time_budget (float, optional): Seconds per cycle during which new summaries may start
+            token_budget (int, optional): Estimated prompt tokens summarized per cycle. Articles
+                                          over either budget are deferred to the next cycle.
+            chunk_tokens (int, optional): Articles longer than this are summarized chunk by chunk
+                                          (map-reduce) instead of in one prompt. None disables chunking.
+            **finder_kwargs: Options passed to every finder (discovery, max_age, ...)
+        """
+        self.logger = setup_logger(__name__)
+        if get_default_cache() is None:
+            set_default_cache(HTTPCache())
+        # Created now so the first cycle does not pay for it
+        self.transport = get_default_transport()
+        self.summarizer = summarizer or OllamaSummarizer(cache=SummaryCache())
+        self.map_reducer = MapReduceSummarizer(self.summarizer, chunk_tokens=chunk_tokens) if chunk_tokens else None
+        self.seen_index = seen_index if seen_index is not None else SeenArticleIndex()
+        self.cleaner = TextCleaner()
+        # Every poll asks the servers whether the section pages changed, the HTTP cache only saves the body
+        self.finders = build_finders(user_data, **{'revalidate': True, **finder_kwargs})
+        self.on_results = on_results or self.log_results
+        self.metrics_path = metrics_path
+        self.topic_weights = topic_weights
+        self.budget = LLMBudget(time_budget, token_budget) if time_budget or token_budget else None
+        # url -> article the budget deferred, kept with its extracted text until its source is polled again
+        self.deferred: Dict[str, ArticleResult] = {}
+
+        intervals = {**DaemonConfig.SOURCE_INTERVALS, **(source_intervals or {})}
+        self.intervals = {finder.source: intervals.get(finder.source, interval) for finder in self.finders}
+        # source -> monotonic time of its next poll; every source is due immediately
+        self.next_poll = {finder.source: 0.0 for finder in self.finders}
+        self.stop_event = threading.Event()
+        self.cycles = 0
+
+    def due_finders(self, now: float) -> List[object]:
+        return [finder for finder in self.finders if self.next_poll[finder.source] <= now]
+
+    def run_cycle(self, finders: List[object]) -> List[ArticleResult]:
+        """
+        Polls the given finders once and summarizes what is new.
+        """
+        sources = [finder.source for finder in finders]
+        self.logger.info(f"Polling {sources}")
+        # The finders memoize their crawls; a poll must see the pages as they are now
+        for finder in finders:
+            finder.clear_discovery()
+        start = time.monotonic()
+
+        pipeline = CrawlPipeline(
+            finders=finders,
+            summarize=self.map_reducer.summarize if self.map_reducer else self.summarizer.summarize,
+            summarize_concurrency=self.summarizer.max_concurrency,
+            # Groups only this cycle's stories; duplicates take the summary of their group's first article
+            deduplicator=StoryDeduplicator(),
+            seen_index=self.seen_index,
+            cleaner=self.cleaner,
+            topic_weights=self.topic_weights,
+            budget=self.budget,
+            carry_over=self.deferred
+        )
+        results = pipeline.run_sync()
+        # Carried to the next poll of their source; ones the polled sources no longer list are dropped
+        self.deferred = {url: article for url, article in self.deferred.items() if article.source not in sources}
+        self.deferred.update({article.url: article for article in results if article.deferred and article.content})
+        self.seen_index.prune(DaemonConfig.SEEN_RETENTION)
+        self.cycles += 1
+        self.logger.info(f"Cycle {self.cycles} for {sources}: {len(results)} new or changed articles in {time.monotonic() - start:.1f}s")
+        return results
+
+    def log_results(self, results: List[ArticleResult]):
+        for article in results:
+            if not article.error:
+                self.logger.info(f"{article.source}: {article.headline} ({article.url})")
+
+    def handle_signal(self, signum, frame):
+        """
+        Asks the daemon to stop after the running cycle. A second signal exits immediately.
+        """
+        self.logger.info(f"Received {signal.Signals(signum).name}, draining the current cycle")
+        self.stop_event.set()
+        signal.signal(signum, signal.SIG_DFL)
+
+    def install_signal_handlers(self):
+        # Signal handlers can only be installed from the main thread
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, self.handle_signal)
+
+    def run_forever(self, max_cycles: Optional[int] = None):
+        """
+        Polls sources as they come due until stopped.
+
+        Args:
+            max_cycles (int, optional): Stop after this many cycles. Runs until signalled by default.
+        """
+        self.install_signal_handlers()
+        try:
+            while not self.stop_event.is_set():
+                now = time.monotonic()
+                finders = self.due_finders(now)
+                if finders:
+                    try:
+                        self.on_results(self.run_cycle(finders))
+                    except Exception as e:
+                        self.logger.error(f"Cycle failed: {e}")
+                    # Schedule from the end of the cycle so a slow cycle cannot queue up back-to-back polls
+                    finished = time.monotonic()
+                    for finder in finders:
+                        self.next_poll[finder.source] = finished + self.intervals[finder.source]
+                    if self.metrics_path:
+                        REGISTRY.write_snapshot(self.metrics_path)
+
+                if max_cycles is not None and self.cycles >= max_cycles:
+                    break
+                # Sleeps until the next source is due, waking early on a stop signal
+                self.stop_event.wait(max(0.0, min(self.next_poll.values()) - time.monotonic()))
+        finally:
+            self.close()
+
+    def stop(self):
+        """
+        Asks the daemon to stop after the running cycle.
+        """
+        self.stop_event.set()
+
+    def close(self):
+        """
+        Releases the warm state: worker threads, pooled connections and databases.
+        """
+        self.logger.info("Shutting down")
+        if self.map_reducer:
+            self.map_reducer.close()
+        self.summarizer.close()
+        self.seen_index.close()
+        cache = get_default_cache()
+        if cache is not None:
+            cache.close()
+            set_default_cache(None)
+        self.transport.close()
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Poll the news sources on a schedule and summarize new articles")
+    arg_parser.add_argument('--topics', nargs='+', default=['US'])
+    arg_parser.add_argument('--interval', type=float, default=DaemonConfig.INTERVAL, help="seconds between polls of a source")
+    arg_parser.add_argument('--discovery', choices=('html', 'feed'), default='html')
+    arg_parser.add_argument('--time-budget', type=float, default=None, help="seconds of summarization per cycle")
+    arg_parser.add_argument('--token-budget', type=int, default=None, help="prompt tokens summarized per cycle")
+    arg_parser.add_argument('--chunk-tokens', type=int, default=ChunkConfig.CHUNK_TOKENS,
+                            help="summarize longer articles chunk by chunk, 0 sends every article as one prompt")
+    args = arg_parser.parse_args()
+
+    daemon = NewsDaemon(
+        json.dumps({'topics': args.topics}),
+        interval=args.interval,
+        time_budget=args.time_budget,
+        token_budget=args.token_budget,
+        chunk_tokens=args.chunk_tokens or None,
+        discovery=args.discovery
+    )
+    try:
+        daemon.run_forever()
+    finally:
+        stop_logging()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+import functools
+import hashlib
+import re
+import struct
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from logger import setup_logger
+
+class DedupConfig:
+    """Default settings for near-duplicate story detection"""
+    SHINGLE_SIZE = 5        # words per shingle
+    NUM_PERM = 128          # MinHash signature length (number of bins)
+    BANDS = 32              # LSH bands; rows per band = NUM_PERM / BANDS
+    THRESHOLD = 0.8         # estimated Jaccard similarity above which two stories are duplicates
+
+# Mersenne prime used by the universal hash that permutes the shingle hashes
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+# Added per bin of distance when an empty bin borrows a neighbour's value, larger than any bin value
+DENSIFY_OFFSET = 1 << 61
+
+def shingles(text: str, size: int = DedupConfig.SHINGLE_SIZE) -> Set[int]:
+    """
+    Splits text into overlapping word n-grams, hashed to 32-bit integers.
+
+    Args:
+        text (str): Article text
+        size (int): Words per shingle
+
+    Returns:
+        Set[int]: Hashed shingles
+    """
+    words = re.findall(r'\w+', (text or '').lower())
+    if len(words) < size:
+        words_groups = [' '.join(words)] if words else []
+    else:
+        words_groups = [' '.join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+    return {
+        struct.unpack('<I', hashlib.blake2b(group.encode('utf-8'), digest_size=4).digest())[0]
+        for group in words_groups
+    }
+
+class MinHasher:
+    """
+    Computes MinHash signatures, whose agreement rate estimates the Jaccard similarity
+    of two shingle sets.
+
+    Uses one-permutation hashing: every shingle is permuted once and falls into one of
+    num_perm bins, and each bin keeps its smallest value. That is one multiplication per
+    shingle instead of num_perm of them, with the same signature length and estimator.
+    Empty bins, common in short texts, borrow the value of the next non-empty bin
+    (rotation densification) so they still agree exactly when the sets agree.
+    """
+    def __init__(self, num_perm: int = DedupConfig.NUM_PERM, seed: int = 1):
+        """
+        Args:
+            num_perm (int): Signature length
+            seed (int): Seed for the permutation coefficients, fixed so signatures are comparable across runs
+        """
+        self.num_perm = num_perm
+        raw = hashlib.sha256(f"minhash-{seed}".encode('utf-8')).digest()
+        self.a = int.from_bytes(raw[:8], 'little') % (MERSENNE_PRIME - 1) + 1
+        self.b = int.from_bytes(raw[8:16], 'little') % MERSENNE_PRIME
+
+    def signature(self, shingle_set: Set[int]) -> Tuple[int, ...]:
+        """
+        Returns the MinHash signature of a shingle set. Empty sets get an all-max signature.
+        """
+        num_perm = self.num_perm
+        if not shingle_set:
+            return (MAX_HASH,) * num_perm
+
+        a, b = self.a, self.b
+        bins = [None] * num_perm
+        for shingle in shingle_set:
+            value, slot = divmod((a * shingle + b) % MERSENNE_PRIME, num_perm)
+            current = bins[slot]
+            if current is None or value < current:
+                bins[slot] = value
+
+        if None in bins:
+            filled = list(bins)
+            for slot in range(num_perm):
+                if bins[slot] is not None:
+                    continue
+                distance = 1
+                while bins[(slot + distance) % num_perm] is None:
+                    distance += 1
+                filled[slot] = bins[(slot + distance) % num_perm] + distance * DENSIFY_OFFSET
+            bins = filled
+        return tuple(bins)
+
+@functools.lru_cache(maxsize=None)
+def get_hasher(num_perm: int) -> MinHasher:
+    return MinHasher(num_perm)
+
+def text_signature(text: str, shingle_size: int = DedupConfig.SHINGLE_SIZE,
+                   num_perm: int = DedupConfig.NUM_PERM) -> Tuple[int, ...]:
+    """
+    Shingles and signs an article. A plain function, so a process pool can run it.
+    """
+    return get_hasher(num_perm).signature(shingles(text, shingle_size))
+
+def estimate_similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+    """
+    Estimates Jaccard similarity from two MinHash signatures.
+    """
+    return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+class StoryDeduplicator:
+    """
+    Groups near-duplicate articles (e.g. the same AP wire story on CNN, Fox News and AP)
+    so each group is summarized once.
+
+    Signatures are indexed with locality-sensitive hashing: each signature is cut into
+    bands, and only articles sharing a band bucket are compared. Lookup cost depends on
+    the number of candidates, not on how many articles have been indexed.
+    """
+    def __init__(
+        self,
+        threshold: float = DedupConfig.THRESHOLD,
+        num_perm: int = DedupConfig.NUM_PERM,
+        bands: int = DedupConfig.BANDS,
+        shingle_size: int = DedupConfig.SHINGLE_SIZE,
+    ):
+        """
+        Args:
+            threshold (float): Estimated Jaccard similarity above which two articles are grouped
+            num_perm (int): MinHash signature length
+            bands (int): Number of LSH bands, must divide num_perm
+            shingle_size (int): Words per shingle
+        """
+        if num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+
+        self.logger = setup_logger(__name__)
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+
+        self._lock = threading.Lock()
+        self.buckets: List[Dict[Tuple[int, ...], List[str]]] = [defaultdict(list) for _ in range(bands)]
+        self.signatures: Dict[str, Tuple[int, ...]] = {}
+        # Article key -> key of the first article of its cluster
+        self.cluster_of: Dict[str, str] = {}
+
+    def band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        return [signature[band * self.rows:(band + 1) * self.rows] for band in range(self.bands)]
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """
+        Returns the MinHash signature add() would compute for text.
+        """
+        return text_signature(text, self.shingle_size, self.num_perm)
+
+    def add(self, key: str, text: str, signature: Optional[Tuple[int, ...]] = None) -> Optional[str]:
+        """
+        Indexes an article and reports whether it duplicates one seen earlier.
+
+        Args:
+            key (str): Unique identifier of the article, e.g. its URL
+            text (str): Extracted article text
+            signature (Tuple[int, ...], optional): The text's signature if already computed,
+                                                   e.g. in a worker process
+
+        Returns:
+            str: Key of the cluster representative if the article is a near-duplicate.
+            None: If the article starts a new cluster.
+        """
+        if signature is None:
+            signature = self.signature(text)
+        band_keys = self.band_keys(signature)
+
+        with self._lock:
+            if key in self.cluster_of:
+                representative = self.cluster_of[key]
+                return None if representative == key else representative
+
+            best_key, best_score = None, self.threshold
+            seen = set()
+            for band, band_key in enumerate(band_keys):
+                for candidate in self.buckets[band].get(band_key, ()):
+                    if candidate in seen:
+                        continue
+                    seen.add(candidate)
+                    score = estimate_similarity(signature, self.signatures[candidate])
+                    if score >= best_score:
+                        best_key, best_score = candidate, score
+
+            for band, band_key in enumerate(band_keys):
+                self.buckets[band][band_key].append(key)
+            self.signatures[key] = signature
+
+            if best_key is None:
+                self.cluster_of[key] = key
+                return None
+
+            representative = self.cluster_of[best_key]
+            self.cluster_of[key] = representative
+            return representative
+
+    def clusters(self) -> Dict[str, List[str]]:
+        """
+        Returns every cluster as representative key -> member keys (representative first).
+        """
+        with self._lock:
+            groups = defaultdict(list)
+            for key, representative in self.cluster_of.items():
+                groups[representative].append(key)
+            return dict(groups)
@@ -0,0 +1,62 @@
+import threading
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+class DiscoveryCacheConfig:
+    """Default settings for memoized article discovery"""
+    TTL = 60.0      # seconds a section page or feed crawl is reused before it is repeated
+
+class DiscoveryCache:
+    """
+    In-memory TTL cache of discovery results, keyed by (source, mode, topic, ...).
+
+    Every finder keeps a private one, so hyperlink_search(), get_link() and any later
+    accessor reuse one crawl. Passing the same instance to several finders shares the
+    crawls between them as well.
+    """
+    def __init__(self, ttl: float = DiscoveryCacheConfig.TTL):
+        """
+        Args:
+            ttl (float): Seconds an entry is served before it expires
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (monotonic time stored, value)
+        self._entries: Dict[Tuple[Hashable, ...], Tuple[float, object]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[object]:
+        """
+        Returns the value stored under key.
+
+        Returns:
+            object: The stored value if present and younger than the TTL.
+            None: If missing or expired. Expired entries are dropped.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Tuple[Hashable, ...], value: object):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+
+    def clear(self, source: Optional[str] = None):
+        """
+        Drops every entry, or only those of one source (the first element of the key).
+        """
+        with self._lock:
+            if source is None:
+                self._entries.clear()
+            else:
+                self._entries = {key: entry for key, entry in self._entries.items() if key[0] != source}
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,114 @@
+import re
+from typing import Dict, Optional, Tuple
+
+from bs4 import Tag
+
+from html_parser import TagStrainer
+
+class FieldSelector:
+    """
+    Where one field lives on the page: a tag name plus substrings its class attribute must contain.
+
+    The class rule is compiled once into a single regex, and lookups walk the tree directly
+    instead of going through bs4's find() with a Python callback per element. The same rule
+    doubles as the raw-attribute predicate used for partial parsing. Evaluating the equivalent
+    CSS selector with soupsieve measured 4-5x slower on large pages, so `label` only describes
+    the rule in CSS notation for logs and metrics; it is never evaluated.
+    """
+    def __init__(self, tag: str, class_contains: Tuple[str, ...] = (), ignore_case: bool = False):
+        """
+        Args:
+            tag (str): Tag name, e.g. 'div'
+            class_contains (Tuple[str, ...]): Substrings the class attribute must all contain
+            ignore_case (bool): Match the substrings case-insensitively
+        """
+        self.tag = tag
+        self.ignore_case = ignore_case
+        self.class_contains = tuple(part.lower() for part in class_contains) if ignore_case else tuple(class_contains)
+
+        flag = ' i' if ignore_case else ''
+        self.label = tag + ''.join(f'[class*="{part}"{flag}]' for part in self.class_contains)
+
+        # One lookahead per substring: the class string must contain all of them, in any order
+        self.class_pattern = None
+        if self.class_contains:
+            lookaheads = ''.join(f'(?=.*{re.escape(part)})' for part in self.class_contains)
+            self.class_pattern = re.compile(f'^{lookaheads}', re.IGNORECASE if ignore_case else 0)
+
+    def matches(self, name: str, attrs: Dict[str, object]) -> bool:
+        """
+        Checks raw tag data against the selector, with the same semantics as the CSS form in `label`.
+        """
+        if name != self.tag:
+            return False
+        if self.class_pattern is None:
+            return True
+
+        classes = attrs.get('class') or ''
+        if not isinstance(classes, str):
+            classes = ' '.join(classes)
+        return self.class_pattern.search(classes) is not None
+
+    def find(self, root) -> Optional[Tag]:
+        """
+        Returns the first matching element under root, in document order.
+        """
+        tag = self.tag
+        for node in root.descendants:
+            # NavigableStrings have no name, so this also skips text nodes
+            if node.name == tag and self.matches(tag, node.attrs):
+                return node
+        return None
+
+    def __repr__(self) -> str:
+        return f"FieldSelector({self.label!r})"
+
+class SelectorSpec:
+    """
+    Declarative, per-source map of field name to FieldSelector, compiled once per source.
+    """
+    def __init__(self, **fields: FieldSelector):
+        """
+        Args:
+            **fields (FieldSelector): Selector for each field, e.g. headline=FieldSelector('h1')
+        """
+        self.fields = fields
+
+        # Keeps only the subtrees of the fields when parsing partially
+        self.strainer = TagStrainer(self.matches)
+
+    def matches(self, name: str, attrs: Dict[str, object]) -> bool:
+        """
+        Checks whether a tag holds any of the fields.
+        """
+        return any(selector.matches(name, attrs) for selector in self.fields.values())
+
+    def select_one(self, soup, field: str, partial: bool = False) -> Optional[Tag]:
+        """
+        Finds the first element for a field, in document order.
+
+        Args:
+            soup (bs4.BeautifulSoup): The parsed page
+            field (str): Field name
+            partial (bool): Whether soup was parsed with this spec's strainer. Its top level then
+                            holds only field subtrees, which are checked directly before searching.
+
+        Returns:
+            bs4.Tag: The matching element.
+            None: If the field is not on the page.
+        """
+        selector = self.fields[field]
+        if not partial:
+            return selector.find(soup)
+
+        # Fast path: the strained tree is a short list of field subtrees
+        for node in soup.children:
+            if not isinstance(node, Tag):
+                continue
+            if selector.matches(node.name, node.attrs):
+                return node
+            # The field can be nested inside another field's subtree
+            found = selector.find(node)
+            if found is not None:
+                return found
+        return None
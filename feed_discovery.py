@@ -0,0 +1,142 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Iterator, List, Optional
+from xml.etree.ElementTree import XMLPullParser
+
+# Element that wraps one story in each supported format: RSS, sitemap (incl. Google News) and Atom
+ENTRY_TAGS = frozenset({'item', 'url', 'entry'})
+
+SITEMAP_NAMESPACE = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+NEWS_NAMESPACE = 'http://www.google.com/schemas/sitemap-news/0.9'
+ATOM_NAMESPACE = 'http://www.w3.org/2005/Atom'
+# Elements that carry the story URL, with the namespaces they may come from ('' for plain RSS).
+# Anything else named loc or link, e.g. <image:loc> or <video:loc>, points at media, not the story.
+URL_TAGS = {
+    'loc': frozenset({'', SITEMAP_NAMESPACE}),
+    'link': frozenset({'', ATOM_NAMESPACE}),
+}
+
+@dataclass
+class FeedEntry:
+    """One story listed in an RSS feed or news sitemap"""
+    url: str
+    title: Optional[str] = None
+    published: Optional[datetime] = None
+    lastmod: Optional[datetime] = None
+    categories: List[str] = field(default_factory=list)
+
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        """
+        Most recent known time the story was published or modified.
+        """
+        times = [value for value in (self.published, self.lastmod) if value]
+        return max(times) if times else None
+
+def local_name(tag: str) -> str:
+    """
+    Strips the XML namespace from a tag, e.g. '{http://...}loc' -> 'loc'.
+    """
+    return tag.rsplit('}', 1)[-1]
+
+def namespace(tag: str) -> str:
+    """
+    Returns the XML namespace of a tag, e.g. '{http://...}loc' -> 'http://...', or '' if it has none.
+    """
+    return tag[1:].split('}', 1)[0] if tag.startswith('{') else ''
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parses RFC 822 (RSS) and ISO 8601 (sitemaps, Atom) dates into aware datetimes.
+
+    Returns:
+        datetime: The parsed time, in UTC when the feed gave no zone.
+        None: If the value is missing or malformed.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def build_entry(element) -> Optional[FeedEntry]:
+    """
+    Builds a FeedEntry from a completed item/url/entry element.
+
+    Only the element's own children are read, plus the fields of a Google News <news:news>
+    block, so nested media (image and video sitemaps) cannot supply the URL or title.
+    """
+    url = title = published = lastmod = None
+    categories = []
+
+    children = []
+    for child in element:
+        if namespace(child.tag) == NEWS_NAMESPACE and local_name(child.tag) == 'news':
+            children.extend(child)
+        else:
+            children.append(child)
+
+    for child in children:
+        name = local_name(child.tag)
+        text = (child.text or '').strip()
+        if name in URL_TAGS:
+            if namespace(child.tag) not in URL_TAGS[name]:
+                continue
+            # Atom puts the URL in href (skipping rel="enclosure" and the like), RSS and sitemaps in the text
+            if child.get('rel', 'alternate') == 'alternate':
+                url = url or text or child.get('href')
+        elif name == 'guid' and child.get('isPermaLink', 'true') == 'true':
+            url = url or text
+        elif name == 'title':
+            title = title or text
+        elif name in ('pubDate', 'publication_date', 'published'):
+            published = published or parse_date(text)
+        elif name in ('lastmod', 'updated'):
+            lastmod = lastmod or parse_date(text)
+        elif name == 'category':
+            categories.append(text or child.get('term', ''))
+        elif name == 'keywords':
+            categories.extend(keyword.strip() for keyword in text.split(','))
+
+    if not url:
+        return None
+    return FeedEntry(url=url, title=title, published=published, lastmod=lastmod,
+                     categories=[category for category in categories if category])
+
+def parse_feed(chunks: Iterable[bytes]) -> Iterator[FeedEntry]:
+    """
+    Incrementally parses an RSS feed, sitemap or Atom feed as its bytes arrive.
+
+    Each story is yielded as soon as its closing tag has been read and its element is then
+    cleared, so memory stays flat no matter how large the document is.
+
+    Args:
+        chunks (Iterable[bytes]): The document, e.g. response.iter_content()
+
+    Yields:
+        FeedEntry: Every story in document order
+    """
+    parser = XMLPullParser(events=('end',))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            if local_name(element.tag) in ENTRY_TAGS:
+                entry = build_entry(element)
+                element.clear()
+                if entry:
+                    yield entry
+    parser.close()
+    for _, element in parser.read_events():
+        if local_name(element.tag) in ENTRY_TAGS:
+            entry = build_entry(element)
+            if entry:
+                yield entry
@@ -0,0 +1,44 @@
+from typing import Dict, Iterable, List, Optional
+
+from base_article_finder import BaseArticleFinder, NoMatchingTopicsError
+from cnn_article_finder import CNNArticleFinder
+from fox_news_article_finder import FoxNewsArticleFinder
+from the_ap_article_finder import TheAPArticleFinder
+from logger import setup_logger
+
+# Every supported source, keyed by BaseArticleFinder.source
+FINDERS: Dict[str, type] = {
+    finder.source: finder
+    for finder in (CNNArticleFinder, FoxNewsArticleFinder, TheAPArticleFinder)
+}
+
+# Source name -> scraper that extracts its articles
+SCRAPERS: Dict[str, type] = {source: finder.scraper_cls for source, finder in FINDERS.items()}
+
+def build_finders(user_data: str, sources: Optional[Iterable[str]] = None, **kwargs) -> List[BaseArticleFinder]:
+    """
+    Creates a finder for every source that covers at least one of the requested topics.
+
+    Args:
+        user_data (str): JSON string containing topics, e.g. '{"topics": ["US", "Health"]}'
+        sources (Iterable[str], optional): Sources to include. Defaults to all of FINDERS.
+        **kwargs: Options passed to every finder (max_workers, transport, cache)
+
+    Returns:
+        List[BaseArticleFinder]: One finder per source with matching topics
+
+    Raises:
+        NoMatchingTopicsError: If no source covers any of the topics
+    """
+    logger = setup_logger(__name__)
+    finders = []
+    for source in (sources or FINDERS):
+        try:
+            finders.append(FINDERS[source](user_data, **kwargs))
+        except NoMatchingTopicsError:
+            # A topic only some outlets have is not an error for the others
+            logger.info(f"Skipping {source}: no matching topics")
+
+    if not finders:
+        raise NoMatchingTopicsError(f"No source covers the topics in {user_data}")
+    return finders
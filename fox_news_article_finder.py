@@ -0,0 +1,83 @@
+import json
+from typing import List
+from urllib.parse import urlsplit
+from base_article_finder import BaseArticleFinder, FinderConfig, AElementNotFoundError
+from fox_news_scraper import FoxNewsScraper
+
+class FoxNewsConfig(FinderConfig):
+    """Configuration class for Fox News-related constants and settings"""
+    BASE_URL = "https://www.foxnews.com"
+    TOPIC_PAGES = {
+        'US': f'{BASE_URL}/us',
+        'World': f'{BASE_URL}/world',
+        'Politics': f'{BASE_URL}/politics',
+        'Health': f'{BASE_URL}/health',
+        'Entertainment': f'{BASE_URL}/entertainment',
+        'Travel': f'{BASE_URL}/travel',
+        'Science': f'{BASE_URL}/science',
+        'Technology': f'{BASE_URL}/tech'
+    }
+    FEED_URL = "https://moxie.foxnews.com/google-publisher"
+    FEED_PAGES = {
+        'US': f'{FEED_URL}/us.xml',
+        'World': f'{FEED_URL}/world.xml',
+        'Politics': f'{FEED_URL}/politics.xml',
+        'Health': f'{FEED_URL}/health.xml',
+        'Entertainment': f'{FEED_URL}/entertainment.xml',
+        'Travel': f'{FEED_URL}/travel.xml',
+        'Science': f'{FEED_URL}/science.xml',
+        'Technology': f'{FEED_URL}/tech.xml'
+    }
+    # Maximum number of section pages fetched at the same time
+    MAX_WORKERS = 10
+
+class FoxNewsArticleFinder(BaseArticleFinder):
+    """
+    Extracts URLs for trending Fox News articles of the topics of interest.
+    """
+    source = 'fox'
+    config = FoxNewsConfig
+    scraper_cls = FoxNewsScraper
+
+    def extract_hrefs(self, topic: str, page: object) -> List[str]:
+        """
+        Pulls the headline links out of the article cards of a Fox News section page.
+
+        Raises:
+            AElementNotFoundError: If the page holds no article cards with links
+        """
+        hrefs = []
+        for card in page.find_all('article'):
+            title = card.find(['h2', 'h3', 'h4'], class_='title')
+            link = title.find('a', href=True) if title else None
+            if link:
+                hrefs.append(link['href'])
+
+        if not hrefs:
+            self.logger.warning(f"No a elements found for {topic}. Hyperlinks not found")
+            raise AElementNotFoundError(f"No a elements found for {topic}. Hyperlinks not found")
+
+        return hrefs
+
+    def is_article_url(self, url: str) -> bool:
+        """
+        Keeps foxnews.com article pages, dropping video, section and off-site links.
+        """
+        parts = urlsplit(url)
+        if not (parts.hostname or '').endswith('foxnews.com') or parts.hostname.startswith('video.'):
+            return False
+
+        # Articles live at /<section>/<slug>; single-segment paths are section fronts
+        segments = [segment for segment in parts.path.split('/') if segment]
+        return len(segments) >= 2 and segments[0] != 'video'
+
+def main():
+    user_data = json.dumps({
+        'topics': ['US']
+    })
+
+    article_finder = FoxNewsArticleFinder(user_data=user_data)
+    article_finder.logger.info(f"Complete URLs: {article_finder.get_link()}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+from typing import Callable, Dict, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import CData, NavigableString, Tag
+from bs4.builder import builder_registry
+
+# Elements that start a new line of text, so paragraphs, captions and teasers stay apart
+BLOCK_TAGS = frozenset((
+    'address', 'article', 'aside', 'blockquote', 'dd', 'details', 'div', 'dl', 'dt', 'figcaption',
+    'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main',
+    'nav', 'ol', 'p', 'pre', 'section', 'summary', 'table', 'td', 'th', 'tr', 'ul'
+))
+
+# Elements whose text is never part of the visible article
+HIDDEN_TAGS = frozenset(('script', 'style', 'noscript', 'template'))
+
+# Tree builders in order of preference, fastest first. html5lib is left out on purpose,
+# it is slower than the built-in html.parser.
+PARSER_PREFERENCE = ('lxml', 'html.parser')
+
+def available_parsers() -> List[str]:
+    """
+    Returns the installed parser backends, fastest first.
+    """
+    return [name for name in PARSER_PREFERENCE if builder_registry.lookup(name) is not None]
+
+def resolve_parser(name: Optional[str] = None) -> str:
+    """
+    Picks the parser backend to use.
+
+    Args:
+        name (str, optional): A BeautifulSoup tree builder name such as 'lxml' or 'html.parser'.
+                              None or 'auto' selects the fastest one installed.
+
+    Returns:
+        str: The tree builder name
+
+    Raises:
+        ValueError: If the requested backend is not installed
+    """
+    if name in (None, 'auto'):
+        return available_parsers()[0]
+
+    if builder_registry.lookup(name) is None:
+        raise ValueError(f"HTML parser backend '{name}' is not installed. Available: {available_parsers()}")
+    return name
+
+class TagStrainer(SoupStrainer):
+    """
+    SoupStrainer that keeps every tag accepted by a predicate(name, attrs), with its subtree.
+
+    Everything outside the kept tags (scripts, navigation, ads) is skipped while parsing,
+    so it is never turned into Tag objects.
+    """
+    def __init__(self, predicate: Callable[[str, Dict[str, object]], bool]):
+        # bs4 < 4.13 calls a callable name with (name, attrs) directly
+        super().__init__(name=predicate)
+        self.predicate = predicate
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        # bs4 >= 4.13 asks the strainer before creating each tag
+        return bool(self.predicate(name, attrs or {}))
+
+def parse_html(html_content: bytes, parser: Optional[str] = None, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parses HTML with the selected backend.
+
+    Args:
+        html_content (bytes): Raw HTML
+        parser (str, optional): Backend name, see resolve_parser()
+        parse_only (SoupStrainer, optional): Restricts the tree to the matching subtrees
+
+    Returns:
+        bs4.BeautifulSoup: The parsed document
+    """
+    return BeautifulSoup(html_content, resolve_parser(parser), parse_only=parse_only)
+
+def block_text(element: Tag) -> str:
+    """
+    Returns the text of an element like get_text(), but with a line break around every
+    block-level element, so text from neighbouring blocks is never glued together.
+
+    Args:
+        element (bs4.Tag): Element to read
+
+    Returns:
+        str: The element's text, one block per line (lines may still carry extra whitespace)
+    """
+    parts = []
+
+    def walk(node: Tag):
+        for child in node.children:
+            if isinstance(child, Tag):
+                if child.name in HIDDEN_TAGS:
+                    continue
+                if child.name == 'br':
+                    parts.append('\n')
+                elif child.name in BLOCK_TAGS:
+                    parts.append('\n')
+                    walk(child)
+                    parts.append('\n')
+                else:
+                    walk(child)
+            # Comments, doctypes and processing instructions are not text
+            elif type(child) in (NavigableString, CData):
+                parts.append(child)
+
+    walk(element)
+    return ''.join(parts)
@@ -0,0 +1,243 @@
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+from logger import setup_logger
+from metrics import REGISTRY
+from url_utils import normalize_url
+
+CACHE_REQUESTS = REGISTRY.counter('http_cache_requests_total', 'HTTP cache outcomes (hit, revalidated or miss)')
+
+class CacheConfig:
+    """Default settings for the on-disk HTTP response cache"""
+    CACHE_PATH = os.path.join('cache', 'http_cache.sqlite3')
+    MAX_BYTES = 256 * 1024 * 1024   # total body bytes kept before LRU eviction
+    DEFAULT_TTL = 300               # seconds a response is served without revalidation
+    # Freshness window per kind of page. Section pages and feeds change often, published articles rarely do.
+    KIND_TTLS = {
+        'section': 60,
+        'article': 24 * 60 * 60,
+    }
+
+@dataclass
+class CacheEntry:
+    """A cached response body together with its validators"""
+    url: str
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+class HTTPCache:
+    """
+    Persistent, size-bounded HTTP response cache keyed by normalized URL.
+
+    Entries younger than the TTL of their kind of page are served without touching the network. Older
+    entries are revalidated with If-None-Match / If-Modified-Since, and a 304 reply refreshes
+    the entry without transferring the body again. When the stored bodies exceed max_bytes
+    the least recently used entries are evicted.
+    """
+    def __init__(
+        self,
+        path: str = CacheConfig.CACHE_PATH,
+        max_bytes: int = CacheConfig.MAX_BYTES,
+        default_ttl: float = CacheConfig.DEFAULT_TTL,
+        kind_ttls: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            path (str): SQLite file holding the cache. ':memory:' keeps it in process.
+            max_bytes (int): Maximum total size of the cached bodies
+            default_ttl (float): Freshness window for kinds of page without their own TTL
+            kind_ttls (Dict[str, float], optional): Freshness window per kind of page ('section', 'article')
+        """
+        self.logger = setup_logger(__name__)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.kind_ttls = dict(CacheConfig.KIND_TTLS if kind_ttls is None else kind_ttls)
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+        if path != ':memory:' and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        self._conn.commit()
+
+    def ttl_for(self, kind: str) -> float:
+        """
+        Returns the freshness window in seconds for a kind of page.
+        """
+        return self.kind_ttls.get(kind, self.default_ttl)
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """
+        Looks up a cached response and marks it as recently used. Counts a miss if there is none.
+
+        Returns:
+            CacheEntry: The cached response if present.
+            None: If the URL has not been cached.
+        """
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE url = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.record_miss()
+                return None
+
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (time.time(), key))
+            self._conn.commit()
+
+        body, etag, last_modified, fetched_at = row
+        return CacheEntry(url=key, body=bytes(body), etag=etag, last_modified=last_modified, fetched_at=fetched_at)
+
+    def is_fresh(self, entry: CacheEntry, kind: str = 'article') -> bool:
+        """
+        Checks whether an entry can be served without revalidation. Counts a hit if so.
+
+        Args:
+            entry (CacheEntry): Entry returned by lookup()
+            kind (str): Kind of page the entry holds, selects its TTL ('section' or 'article')
+        """
+        fresh = time.time() - entry.fetched_at < self.ttl_for(kind)
+        if fresh:
+            self.hits += 1
+            CACHE_REQUESTS.inc(result='hit')
+        return fresh
+
+    def record_miss(self):
+        """
+        Counts a request the cache could not answer: no entry, or a stale entry the server
+        replaced with a new body.
+        """
+        self.misses += 1
+        CACHE_REQUESTS.inc(result='miss')
+
+    @staticmethod
+    def conditional_headers(entry: CacheEntry) -> Dict[str, str]:
+        """
+        Builds the validator headers for revalidating an entry.
+        """
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def store(self, url: str, body: bytes, headers: Mapping[str, str]):
+        """
+        Stores a fully downloaded response, then evicts old entries if the cache is over budget.
+
+        Args:
+            url (str): URL the response was fetched from
+            body (bytes): Response body
+            headers (Mapping[str, str]): Response headers carrying the validators
+        """
+        # Responses the server asked us not to keep are never written to disk
+        if 'no-store' in headers.get('Cache-Control', '').lower():
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (normalize_url(url), sqlite3.Binary(body), headers.get('ETag'),
+                 headers.get('Last-Modified'), now, now, len(body))
+            )
+            self.evict()
+            self._conn.commit()
+
+    def refresh(self, url: str, headers: Mapping[str, str]):
+        """
+        Records a 304 Not Modified reply: restarts the entry's TTL and keeps the body.
+
+        Args:
+            url (str): URL that was revalidated
+            headers (Mapping[str, str]): Headers of the 304 response, which may carry new validators
+        """
+        self.hits += 1
+        self.revalidated += 1
+        CACHE_REQUESTS.inc(result='revalidated')
+        key = normalize_url(url)
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE responses
+                SET fetched_at = ?,
+                    etag = COALESCE(?, etag),
+                    last_modified = COALESCE(?, last_modified)
+                WHERE url = ?
+                """,
+                (time.time(), headers.get('ETag'), headers.get('Last-Modified'), key)
+            )
+            self._conn.commit()
+
+    def evict(self):
+        """
+        Deletes least recently used entries until the bodies fit in max_bytes.
+        Must be called with the lock held.
+        """
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        rows = self._conn.execute("SELECT url, size FROM responses ORDER BY last_access ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (key,))
+            total -= size
+            evicted += 1
+        self.logger.info(f"Evicted {evicted} cached responses to stay under {self.max_bytes} bytes")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns hit/miss counters for this process.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'revalidated': self.revalidated}
+
+    def close(self):
+        """
+        Closes the underlying database.
+        """
+        with self._lock:
+            self._conn.close()
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_default_cache() -> Optional[HTTPCache]:
+    """
+    Returns the process-wide response cache, or None when caching has not been enabled.
+    """
+    with _default_cache_lock:
+        return _default_cache
+
+def set_default_cache(cache: Optional[HTTPCache]):
+    """
+    Enables (or with None, disables) the process-wide response cache used by every scraper.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
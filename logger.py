@@ -1,57 +1,254 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
+from typing import Dict, Optional
+
+class LogConfig:
+    """Default logging settings"""
+    LOG_DIR = 'logs'
+    LEVEL = logging.INFO
+    FORMAT = '%(asctime)s - %(filename)s - %(levelname)s - %(funcName)s - %(message)s'
+    QUEUED = True               # hand records to one background writer instead of writing in the caller
+    JSON_LINES = False          # write log files as one JSON object per line
+    ROTATE = None               # None (one dated file per day of first use), 'size' or 'time'
+    MAX_BYTES = 10 * 1024 * 1024    # file size that triggers a rollover when ROTATE is 'size'
+    WHEN = 'midnight'           # rollover interval when ROTATE is 'time'
+    BACKUP_COUNT = 7            # rotated files kept per module
+
+class JSONLinesFormatter(logging.Formatter):
+    """Formats each record as a single JSON object"""
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'file': record.filename,
+            'function': record.funcName,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Queued records arrive with the traceback already rendered by RecordQueueHandler
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+_settings = {
+    'log_dir': LogConfig.LOG_DIR,
+    'level': LogConfig.LEVEL,
+    'queued': LogConfig.QUEUED,
+    'json_lines': LogConfig.JSON_LINES,
+    'rotate': LogConfig.ROTATE,
+    'max_bytes': LogConfig.MAX_BYTES,
+    'when': LogConfig.WHEN,
+    'backup_count': LogConfig.BACKUP_COUNT,
+}
+_lock = threading.RLock()
+_loggers: Dict[str, logging.Logger] = {}
+_created_dirs = set()
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def module_log_dir(name: str) -> str:
+    """
+    Returns the directory a module logs to, creating it the first time it is needed.
+    """
+    # Gets the last part of the module path
+    filename = name.split('.')[-1]
+    log_dir = _settings['log_dir'] if filename == '__main__' else os.path.join(_settings['log_dir'], filename)
+    if log_dir not in _created_dirs:
+        os.makedirs(log_dir, exist_ok=True)
+        _created_dirs.add(log_dir)
+    return log_dir
+
+def text_formatter() -> logging.Formatter:
+    return logging.Formatter(LogConfig.FORMAT)
+
+def file_handler_for(name: str) -> logging.Handler:
+    """
+    Creates the file handler for one module, rotating by size or time if configured.
+    """
+    log_dir = module_log_dir(name)
+    extension = 'jsonl' if _settings['json_lines'] else 'log'
+
+    if _settings['rotate'] == 'size':
+        handler = logging.handlers.RotatingFileHandler(
+            os.path.join(log_dir, f'{name.split(".")[-1]}.{extension}'),
+            maxBytes=_settings['max_bytes'], backupCount=_settings['backup_count']
+        )
+    elif _settings['rotate'] == 'time':
+        handler = logging.handlers.TimedRotatingFileHandler(
+            os.path.join(log_dir, f'{name.split(".")[-1]}.{extension}'),
+            when=_settings['when'], backupCount=_settings['backup_count']
+        )
+    else:
+        handler = logging.FileHandler(
+            filename=os.path.join(log_dir, f'{datetime.now().strftime("%Y-%m-%d")}.{extension}'),
+            mode='a'
+        )
+
+    handler.setLevel(_settings['level'])
+    handler.setFormatter(JSONLinesFormatter() if _settings['json_lines'] else text_formatter())
+    return handler
+
+def console_handler() -> logging.Handler:
+    handler = logging.StreamHandler()
+    handler.setLevel(_settings['level'])
+    handler.setFormatter(text_formatter())
+    return handler
+
+class ModuleFileRouter(logging.Handler):
+    """
+    Writes each record to its module's log file. Runs only on the listener thread,
+    so the per-module handlers are opened lazily and never contended.
+    """
+    def __init__(self):
+        super().__init__()
+        self.handlers: Dict[str, logging.Handler] = {}
+
+    def emit(self, record: logging.LogRecord):
+        handler = self.handlers.get(record.name)
+        if handler is None:
+            handler = self.handlers[record.name] = file_handler_for(record.name)
+        if record.levelno >= handler.level:
+            handler.handle(record)
+
+    def close(self):
+        for handler in self.handlers.values():
+            handler.close()
+        self.handlers.clear()
+        super().close()
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that keeps the exception apart from the message.
+
+    The stock prepare() folds the traceback into msg and drops exc_info, which leaves the
+    JSON formatter nothing to put under 'exception'. Here the traceback is rendered into
+    exc_text instead, which every formatter on the listener side already understands.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = text_formatter().formatException(record.exc_info)
+        # Tracebacks hold frames, which must not outlive the call or cross the queue
+        record.exc_info = None
+        return record
+
+def get_queue_handler() -> logging.handlers.QueueHandler:
+    """
+    Returns the handler shared by every queued logger, starting the background writer on first use.
+    """
+    global _queue_handler, _listener
+    with _lock:
+        if _queue_handler is None:
+            records = queue.SimpleQueue()
+            _listener = logging.handlers.QueueListener(
+                records, console_handler(), ModuleFileRouter(), respect_handler_level=True
+            )
+            _listener.start()
+            _queue_handler = RecordQueueHandler(records)
+        return _queue_handler
+
+def attach_handlers(logger: logging.Logger):
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        # The queue handler is shared, it is closed by stop_logging()
+        if handler is not _queue_handler:
+            handler.close()
+
+    logger.setLevel(_settings['level'])
+    if _settings['queued']:
+        logger.addHandler(get_queue_handler())
+    else:
+        logger.addHandler(console_handler())
+        logger.addHandler(file_handler_for(logger.name))
+
+def stop_logging():
+    """
+    Flushes every queued record and stops the background writer. Registered to run at exit.
+    """
+    global _queue_handler, _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+        _queue_handler = None
+        _listener = None
+
+atexit.register(stop_logging)
+
+def configure_logging(
+    queued: bool = LogConfig.QUEUED,
+    json_lines: bool = LogConfig.JSON_LINES,
+    rotate: Optional[str] = LogConfig.ROTATE,
+    max_bytes: int = LogConfig.MAX_BYTES,
+    when: str = LogConfig.WHEN,
+    backup_count: int = LogConfig.BACKUP_COUNT,
+    log_dir: str = LogConfig.LOG_DIR,
+    level: int = LogConfig.LEVEL
+):
+    """
+    Sets how every logger created by setup_logger writes, including ones that already exist.
+
+    Args:
+        queued (bool): Put records on a queue drained by a single background writer, so
+                       worker threads never block on file or console I/O.
+        json_lines (bool): Write log files as JSON lines instead of the text format.
+        rotate (str, optional): 'size' to roll over at max_bytes, 'time' to roll over every
+                                `when` interval, None for one dated file per day of first use.
+        max_bytes (int): Size threshold for size-based rotation.
+        when (str): Interval for time-based rotation, as accepted by TimedRotatingFileHandler.
+        backup_count (int): Rotated files kept per module.
+        log_dir (str): Root directory of the log files.
+        level (int): Minimum level written.
+
+    Raises:
+        ValueError: If rotate is not None, 'size' or 'time'
+    """
+    if rotate not in (None, 'size', 'time'):
+        raise ValueError(f"Unknown rotation mode '{rotate}', expected None, 'size' or 'time'")
+
+    with _lock:
+        # Drain and close the current writer before the file layout changes
+        stop_logging()
+        _settings.update(
+            queued=queued, json_lines=json_lines, rotate=rotate, max_bytes=max_bytes,
+            when=when, backup_count=backup_count, log_dir=log_dir, level=level
+        )
+        for logger in _loggers.values():
+            attach_handlers(logger)
 
 def setup_logger(name: str) -> logging.Logger:
     """
     Creates and configures a logger instance.
-    
+
     Args:
         name (str): The name of the logger (typically __name__ from the calling module)
-        
+
     Returns:
         logging.Logger: Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
-    
-    # Get the filename from the logger name and create its directory
-    filename = name.split('.')[-1]  # Gets the last part of the module path
-    if filename != '__main__':
-        log_dir = os.path.join('logs', filename)
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-    else:
-        log_dir = 'logs'
-        
-    # Create logger
-    logger = logging.getLogger(name)
-    
-    # Only add handlers if the logger doesn't already have them
-    if not logger.handlers:
-        logger.setLevel(logging.INFO)
-        
-        # Create handlers
-        console_handler = logging.StreamHandler()
-        file_handler = logging.FileHandler(
-            filename=os.path.join(log_dir, f'{datetime.now().strftime("%Y-%m-%d")}.log'),
-            mode='a'
-        )
-        
-        # Set levels
-        console_handler.setLevel(logging.INFO)
-        file_handler.setLevel(logging.INFO)
-        
-        # Create formatters and add it to handlers
-        log_format = logging.Formatter(
-            '%(asctime)s - %(filename)s - %(levelname)s - %(funcName)s - %(message)s'
-        )
-        console_handler.setFormatter(log_format)
-        file_handler.setFormatter(log_format)
-        
-        # Add handlers to the logger
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
-    
-    return logger
\ No newline at end of file
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
+
+    with _lock:
+        logger = logging.getLogger(name)
+
+        # Only add handlers if the logger doesn't already have them
+        if not logger.handlers:
+            attach_handlers(logger)
+        _loggers[name] = logger
+
+    return logger
@@ -0,0 +1,222 @@
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+from logger import setup_logger
+from summarizer import OllamaSummarizer
+
+class ChunkConfig:
+    """Default settings for chunked map-reduce summarization"""
+    CHUNK_TOKENS = 1500     # token budget of every chunk sent in the map pass
+    OVERLAP_TOKENS = 150    # tokens of trailing context repeated at the start of the next chunk
+    REDUCE_PROMPT = """
+        The user will provide several partial summaries of one article, in order. Combine them into a
+        single unbiased summary of the whole article without repeating points. 
+        Begin each response with Unbiased Summary:"""
+
+# Words and individual punctuation marks, a close stand-in for subword token counts
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimates the number of model tokens in text.
+    """
+    return len(TOKEN_PATTERN.findall(text))
+
+def split_long_paragraph(paragraph: str, chunk_tokens: int) -> List[str]:
+    """
+    Splits a paragraph that exceeds the budget on sentence boundaries, then on words.
+    """
+    pieces = []
+    current = []
+    current_tokens = 0
+    for sentence in re.split(r'(?<=[.!?])\s+', paragraph):
+        sentence_tokens = estimate_tokens(sentence)
+        if sentence_tokens > chunk_tokens:
+            # A single runaway sentence: fall back to fixed word windows
+            words = sentence.split()
+            step = max(1, chunk_tokens // 2)
+            sentences = [' '.join(words[i:i + step]) for i in range(0, len(words), step)]
+        else:
+            sentences = [sentence]
+
+        for piece in sentences:
+            piece_tokens = estimate_tokens(piece)
+            if current and current_tokens + piece_tokens > chunk_tokens:
+                pieces.append(' '.join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+
+    if current:
+        pieces.append(' '.join(current))
+    return pieces
+
+def split_into_chunks(
+    text: str,
+    chunk_tokens: int = ChunkConfig.CHUNK_TOKENS,
+    overlap_tokens: int = ChunkConfig.OVERLAP_TOKENS
+) -> List[str]:
+    """
+    Splits text into token-budgeted chunks on paragraph boundaries.
+
+    Args:
+        text (str): Article text, paragraphs separated by newlines
+        chunk_tokens (int): Maximum estimated tokens per chunk
+        overlap_tokens (int): Tokens of trailing paragraphs repeated at the start of the next chunk
+
+    Returns:
+        List[str]: The chunks, in order
+    """
+    paragraphs = []
+    for paragraph in re.split(r'\n+', text or ''):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if estimate_tokens(paragraph) > chunk_tokens:
+            paragraphs.extend(split_long_paragraph(paragraph, chunk_tokens))
+        else:
+            paragraphs.append(paragraph)
+
+    chunks = []
+    current = []
+    current_tokens = 0
+    for paragraph in paragraphs:
+        paragraph_tokens = estimate_tokens(paragraph)
+        if current and current_tokens + paragraph_tokens > chunk_tokens:
+            chunks.append('\n\n'.join(current))
+
+            # Carry the tail of the finished chunk over as context for the next one
+            overlap = []
+            overlap_size = 0
+            for previous in reversed(current):
+                previous_tokens = estimate_tokens(previous)
+                if overlap_size + previous_tokens > overlap_tokens or overlap_size + previous_tokens + paragraph_tokens > chunk_tokens:
+                    break
+                overlap.insert(0, previous)
+                overlap_size += previous_tokens
+            current, current_tokens = overlap, overlap_size
+
+        current.append(paragraph)
+        current_tokens += paragraph_tokens
+
+    if current:
+        chunks.append('\n\n'.join(current))
+    return chunks
+
+class MapReduceSummarizer:
+    """
+    Summarizes long articles by summarizing token-budgeted chunks in parallel (map) and
+    then combining the partial summaries (reduce). Articles that fit in one chunk are
+    summarized directly.
+    """
+    def __init__(
+        self,
+        summarizer: OllamaSummarizer,
+        chunk_tokens: int = ChunkConfig.CHUNK_TOKENS,
+        overlap_tokens: int = ChunkConfig.OVERLAP_TOKENS,
+        reduce_prompt: str = ChunkConfig.REDUCE_PROMPT,
+    ):
+        """
+        Args:
+            summarizer (OllamaSummarizer): Client used for the map pass. Its concurrency limit
+                                           bounds how many chunks are summarized at once.
+            chunk_tokens (int): Maximum estimated tokens per chunk
+            overlap_tokens (int): Tokens of context repeated between consecutive chunks
+            reduce_prompt (str): System prompt for combining partial summaries
+        """
+        if overlap_tokens >= chunk_tokens:
+            raise ValueError("overlap_tokens must be smaller than chunk_tokens")
+
+        self.logger = setup_logger(__name__)
+        self.summarizer = summarizer
+        self.chunk_tokens = chunk_tokens
+        self.overlap_tokens = overlap_tokens
+
+        # Same server, pool and cache; only the system prompt differs
+        self.reducer = OllamaSummarizer(
+            url=summarizer.url,
+            model=summarizer.model,
+            system_prompt=reduce_prompt,
+            max_concurrency=summarizer.max_concurrency,
+            cache=summarizer.cache,
+            transport=summarizer.transport
+        )
+        # Map and reduce requests count against one concurrency cap
+        self.reducer.slots = summarizer.slots
+
+    def summarize_with_timings(self, text: str) -> Tuple[Optional[str], Dict[str, float]]:
+        """
+        Summarizes text and reports how long each stage took.
+
+        Args:
+            text (str): Article text
+
+        Returns:
+            Tuple[Optional[str], Dict[str, float]]: The summary (None if any request failed) and
+                                                    timings with keys chunks, split, map, reduce, total
+                                                    (seconds, except chunks which is a count).
+        """
+        timings = {'chunks': 0, 'split': 0.0, 'map': 0.0, 'reduce': 0.0, 'total': 0.0}
+        start = time.perf_counter()
+
+        chunks = split_into_chunks(text, self.chunk_tokens, self.overlap_tokens)
+        timings['chunks'] = len(chunks)
+        timings['split'] = time.perf_counter() - start
+
+        if len(chunks) <= 1:
+            stage_start = time.perf_counter()
+            summary = self.summarizer.summarize(text)
+            timings['map'] = time.perf_counter() - stage_start
+            timings['total'] = time.perf_counter() - start
+            return summary, timings
+
+        stage_start = time.perf_counter()
+        partials = self.summarizer.summarize_many(chunks)
+        timings['map'] = time.perf_counter() - stage_start
+        if any(partial is None for partial in partials):
+            self.logger.error(f"Map pass failed for {partials.count(None)} of {len(chunks)} chunks")
+            timings['total'] = time.perf_counter() - start
+            return None, timings
+
+        stage_start = time.perf_counter()
+        summary = self.reduce(partials)
+        timings['reduce'] = time.perf_counter() - stage_start
+        timings['total'] = time.perf_counter() - start
+
+        self.logger.info(
+            f"Summarized {len(chunks)} chunks: map {timings['map']:.2f}s, reduce {timings['reduce']:.2f}s"
+        )
+        return summary, timings
+
+    def reduce(self, partials: List[str]) -> Optional[str]:
+        """
+        Combines partial summaries. If they do not fit in one chunk they are combined in
+        groups first, until a single reduce call can take them all.
+        """
+        while True:
+            combined = '\n\n'.join(partials)
+            if estimate_tokens(combined) <= self.chunk_tokens or len(partials) <= 1:
+                return self.reducer.summarize(combined)
+
+            groups = split_into_chunks(combined, self.chunk_tokens, overlap_tokens=0)
+            if len(groups) >= len(partials):
+                # Every partial is already close to the budget, grouping cannot shrink the input
+                return self.reducer.summarize(combined)
+
+            partials = self.reducer.summarize_many(groups)
+            if any(partial is None for partial in partials):
+                return None
+
+    def summarize(self, text: str) -> Optional[str]:
+        """
+        Summarizes text. Drop-in replacement for OllamaSummarizer.summarize.
+        """
+        summary, _ = self.summarize_with_timings(text)
+        return summary
+
+    def close(self):
+        """
+        Stops the reducer's worker threads. The wrapped summarizer is owned by the caller.
+        """
+        self.reducer.executor.shutdown(wait=True)
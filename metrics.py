@@ -0,0 +1,262 @@
+import functools
+import json
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, Optional, Tuple
+
+# Upper bounds in seconds, suited to everything from a selector lookup to an LLM call
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+def label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def format_labels(key: LabelKey, extra: Optional[Dict[str, str]] = None) -> str:
+    pairs = list(key) + list((extra or {}).items())
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{escape_label(value)}"' for name, value in pairs) + '}'
+
+class Counter:
+    """Monotonically increasing count, one series per label set"""
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+        self.values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        """
+        Adds amount to the series selected by labels.
+        """
+        key = label_key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def reset(self):
+        with self._lock:
+            self.values.clear()
+
+    def state(self) -> Dict[LabelKey, float]:
+        with self._lock:
+            return dict(self.values)
+
+    def merge(self, state: Dict[LabelKey, float]):
+        """
+        Adds the series of another process's counter, see MetricsRegistry.export().
+        """
+        with self._lock:
+            for key, value in state.items():
+                self.values[key] = self.values.get(key, 0) + value
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [{'labels': dict(key), 'value': value} for key, value in self.values.items()]
+
+    def prometheus(self) -> Iterable[str]:
+        with self._lock:
+            for key, value in self.values.items():
+                yield f"{self.name}{format_labels(key)} {value}"
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets, one series per label set"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label key -> [per-bucket counts (+Inf last), sum, count]
+        self.series: Dict[LabelKey, list] = {}
+
+    def observe(self, value: float, **labels):
+        """
+        Records one value in the series selected by labels.
+        """
+        key = label_key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self.series.get(key)
+            if series is None:
+                series = self.series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def reset(self):
+        with self._lock:
+            self.series.clear()
+
+    def state(self) -> Dict[LabelKey, list]:
+        with self._lock:
+            return {key: [list(counts), total, count] for key, (counts, total, count) in self.series.items()}
+
+    def merge(self, state: Dict[LabelKey, list]):
+        """
+        Adds the series of another process's histogram, see MetricsRegistry.export().
+        Both sides must use the same buckets.
+        """
+        with self._lock:
+            for key, (counts, total, count) in state.items():
+                series = self.series.get(key)
+                if series is None:
+                    series = self.series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                series[0] = [mine + theirs for mine, theirs in zip(series[0], counts)]
+                series[1] += total
+                series[2] += count
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [
+                {'labels': dict(key), 'count': count, 'sum': total,
+                 'mean': total / count if count else 0.0,
+                 'buckets': dict(zip([str(bound) for bound in self.buckets] + ['+Inf'], counts))}
+                for key, (counts, total, count) in self.series.items()
+            ]
+
+    def prometheus(self) -> Iterable[str]:
+        with self._lock:
+            for key, (counts, total, count) in self.series.items():
+                cumulative = 0
+                for bound, bucket_count in zip(list(self.buckets) + ['+Inf'], counts):
+                    cumulative += bucket_count
+                    yield f"{self.name}_bucket{format_labels(key, {'le': str(bound)})} {cumulative}"
+                yield f"{self.name}_sum{format_labels(key)} {total}"
+                yield f"{self.name}_count{format_labels(key)} {count}"
+
+class MetricsRegistry:
+    """
+    Holds every metric of the process and exports them as a JSON snapshot or Prometheus text.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.metrics: Dict[str, object] = {}
+
+    def counter(self, name: str, help_text: str = '') -> Counter:
+        """
+        Returns the counter called name, creating it on first use.
+        """
+        with self._lock:
+            return self.metrics.setdefault(name, Counter(name, help_text))
+
+    def histogram(self, name: str, help_text: str = '', buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """
+        Returns the histogram called name, creating it on first use.
+        """
+        with self._lock:
+            return self.metrics.setdefault(name, Histogram(name, help_text, buckets))
+
+    def snapshot(self) -> dict:
+        """
+        Returns every metric as plain data.
+        """
+        with self._lock:
+            metrics = list(self.metrics.values())
+        return {
+            'timestamp': time.time(),
+            'metrics': {
+                metric.name: {'type': metric.kind, 'help': metric.help, 'series': metric.snapshot()}
+                for metric in metrics
+            }
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format.
+        """
+        with self._lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.prometheus())
+        return '\n'.join(lines) + '\n'
+
+    def write_snapshot(self, path: str):
+        """
+        Writes the JSON snapshot to a file.
+        """
+        with open(path, 'w') as f:
+            f.write(self.to_json())
+
+    def reset(self):
+        """
+        Zeroes every metric, e.g. between benchmark runs. Registered metrics stay usable.
+        """
+        with self._lock:
+            metrics = list(self.metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def export(self) -> dict:
+        """
+        Returns the raw, picklable state of every non-empty metric, so a worker process can
+        hand what it recorded to the parent's registry.
+        """
+        with self._lock:
+            metrics = list(self.metrics.values())
+        exported = {}
+        for metric in metrics:
+            state = metric.state()
+            if state:
+                buckets = getattr(metric, 'buckets', None)
+                exported[metric.name] = (metric.kind, metric.help, buckets, state)
+        return exported
+
+    def merge(self, exported: dict):
+        """
+        Adds metrics exported by another registry to this one.
+        """
+        for name, (kind, help_text, buckets, state) in exported.items():
+            if kind == 'histogram':
+                self.histogram(name, help_text, buckets).merge(state)
+            else:
+                self.counter(name, help_text).merge(state)
+
+REGISTRY = MetricsRegistry()
+
+class timed:
+    """
+    Times a block or a function into a histogram of seconds.
+
+    Example:
+        with timed('parse_seconds', parser='lxml'):
+            soup = parse_html(page)
+
+        @timed('summarize_seconds')
+        def summarize(text): ...
+    """
+    def __init__(self, name: str, registry: Optional[MetricsRegistry] = None, **labels):
+        self.histogram = (registry or REGISTRY).histogram(name)
+        self.labels = labels
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.histogram.observe(time.perf_counter() - start, **self.labels)
+        return wrapper
@@ -0,0 +1,205 @@
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from benchmark_fixtures import save_page
+from finders import FINDERS
+from html_parser import parse_html
+from replay_server import ReplayConfig, ReplayServer, ReplayTransport
+from summarizer import OllamaSummarizer
+
+def run_items(func: Callable, items: List, concurrency: int, keep: bool) -> tuple:
+    """
+    Calls func on every item, concurrency at a time, timing each call.
+
+    Returns:
+        tuple: (latencies in seconds, wall time in seconds, results in item order or [] when keep is False)
+    """
+    def timed_call(item):
+        start = time.perf_counter()
+        result = func(item)
+        return time.perf_counter() - start, result if keep else None
+
+    start = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = list(executor.map(timed_call, items))
+    else:
+        outcomes = [timed_call(item) for item in items]
+    wall = time.perf_counter() - start
+
+    return [latency for latency, _ in outcomes], wall, [result for _, result in outcomes] if keep else []
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+def measure_stage(func: Callable, items: List, concurrency: int = 1) -> tuple:
+    """
+    Runs one stage over its inputs and reports throughput, latency percentiles and peak memory.
+
+    Returns:
+        tuple: (report dict, stage results in item order)
+    """
+    if not items:
+        return {'items': 0, 'throughput': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'peak_mb': 0.0}, []
+
+    latencies, wall, results = run_items(func, items, concurrency, keep=True)
+
+    # Peak memory is measured in a separate pass so tracing overhead does not skew the timings
+    tracemalloc.start()
+    run_items(func, items, concurrency, keep=False)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    report = {
+        'items': len(items),
+        'throughput': len(items) / wall if wall else 0.0,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'peak_mb': peak / (1024 * 1024),
+    }
+    return report, results
+
+def run_benchmark(
+    server: ReplayServer,
+    sources: List[str],
+    topics: List[str],
+    articles: int,
+    fetch_concurrency: int,
+    parser: Optional[str]
+) -> Dict[str, dict]:
+    """
+    Runs discovery, fetch, parse, extraction and summarization against the replay server.
+
+    Args:
+        server (ReplayServer): Running replay server
+        sources (List[str]): Sources to benchmark
+        topics (List[str]): Topics passed to every finder
+        articles (int): Maximum articles per source carried past discovery
+        fetch_concurrency (int): Concurrent page downloads
+        parser (str, optional): HTML parser backend
+
+    Returns:
+        Dict[str, dict]: Report per stage
+    """
+    transport = ReplayTransport(server.url, pool_maxsize=max(fetch_concurrency, 10))
+    user_data = json.dumps({'topics': topics})
+    finders = [FINDERS[source](user_data, transport=transport) for source in sources]
+    reports = {}
+
+    def discover(finder):
+        # Finders memoize their crawls; without this the memory pass would be served from the cache
+        finder.clear_discovery()
+        return finder.get_link()
+    reports['discovery'], discovered = measure_stage(discover, finders)
+    jobs = []
+    for finder, links in zip(finders, discovered):
+        urls = list(dict.fromkeys(url for topic_links in links.values() for url in topic_links))
+        jobs.extend((finder.scraper_cls, url) for url in urls[:articles])
+
+    def fetch(job):
+        scraper_cls, url = job
+        return scraper_cls, scraper_cls(url, transport=transport, cache=None).fetch_html_content()
+    reports['fetch'], pages = measure_stage(fetch, jobs, fetch_concurrency)
+    pages = [(scraper_cls, html) for scraper_cls, html in pages if html]
+
+    reports['parse'], soups = measure_stage(
+        lambda page: (page[0], parse_html(page[1], parser=parser)), pages
+    )
+
+    def extract(parsed):
+        scraper_cls, soup = parsed
+        scraper = scraper_cls('https://example.com/fixture', parser=parser)
+        return scraper.parse_headline(soup), scraper.parse_content(soup)
+    reports['extraction'], extracted = measure_stage(extract, soups)
+    del soups
+
+    summarizer = OllamaSummarizer(url=server.generate_url)
+    texts = [content for _, content in extracted if content]
+    try:
+        reports['summarization'], _ = measure_stage(summarizer.summarize, texts, summarizer.max_concurrency)
+    finally:
+        summarizer.close()
+        transport.close()
+
+    return reports
+
+def record_fixtures(sources: List[str], topics: List[str], articles: int):
+    """
+    Downloads live section and article pages into the fixture directory.
+    """
+    user_data = json.dumps({'topics': topics})
+    for source in sources:
+        finder = FINDERS[source](user_data)
+        for topic, page_url in finder.topic_navigation().items():
+            html = finder.scraper_cls(page_url).fetch_html_content()
+            if html:
+                save_page(source, 'section', topic.lower(), html)
+
+        urls = [url for links in finder.get_link().values() for url in links][:articles]
+        for index, url in enumerate(urls):
+            html = finder.scraper_cls(url).fetch_html_content()
+            if html:
+                save_page(source, 'article', f'{index:03d}', html)
+        print(f"Recorded {source}: {len(urls)} articles")
+
+def compare(reports: Dict[str, dict], baseline: Dict[str, dict]):
+    print(f"\n{'stage':<14} {'throughput':>11} {'p50':>8} {'p95':>8} {'peak':>8}  (change vs baseline)")
+    for stage, report in reports.items():
+        base = baseline.get(stage)
+        if not base:
+            continue
+        change = lambda key: (report[key] - base[key]) / base[key] * 100 if base[key] else 0.0
+        print(
+            f"{stage:<14} {change('throughput'):>+10.1f}% {change('p50_ms'):>+7.1f}% "
+            f"{change('p95_ms'):>+7.1f}% {change('peak_mb'):>+7.1f}%"
+        )
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark every pipeline stage offline against recorded pages")
+    arg_parser.add_argument('--sources', nargs='+', default=list(FINDERS), choices=list(FINDERS))
+    arg_parser.add_argument('--topics', nargs='+', default=['US'])
+    arg_parser.add_argument('--articles', type=int, default=20, help="articles per source")
+    arg_parser.add_argument('--fetch-concurrency', type=int, default=8)
+    arg_parser.add_argument('--parser', default=None)
+    arg_parser.add_argument('--page-latency', type=float, default=ReplayConfig.PAGE_LATENCY)
+    arg_parser.add_argument('--llm-latency', type=float, default=ReplayConfig.LLM_LATENCY)
+    arg_parser.add_argument('--llm-tokens', type=int, default=ReplayConfig.LLM_TOKENS)
+    arg_parser.add_argument('--save', help="write the report to this JSON file")
+    arg_parser.add_argument('--baseline', help="compare against a report saved with --save")
+    arg_parser.add_argument('--record', action='store_true', help="download live fixtures and exit")
+    args = arg_parser.parse_args()
+
+    if args.record:
+        record_fixtures(args.sources, args.topics, args.articles)
+        return
+
+    server = ReplayServer(page_latency=args.page_latency, llm_latency=args.llm_latency, llm_tokens=args.llm_tokens).start()
+    try:
+        reports = run_benchmark(server, args.sources, args.topics, args.articles, args.fetch_concurrency, args.parser)
+    finally:
+        server.close()
+
+    if server.fixture_notice:
+        print(server.fixture_notice)
+    print(f"{'stage':<14} {'items':>6} {'items/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'peak MB':>8}")
+    for stage, report in reports.items():
+        print(
+            f"{stage:<14} {report['items']:>6} {report['throughput']:>10.1f} {report['p50_ms']:>9.2f} "
+            f"{report['p95_ms']:>9.2f} {report['peak_mb']:>8.2f}"
+        )
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(reports, json.load(f))
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(reports, f, indent=2)
+
+if __name__ == '__main__':
+    main()
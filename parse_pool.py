@@ -0,0 +1,145 @@
+import asyncio
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from dedup import DedupConfig, text_signature
+from finders import SCRAPERS
+from metrics import REGISTRY
+
+class ParsePoolConfig:
+    """Default settings for the extraction process pool"""
+    WORKERS = os.cpu_count() or 1
+    MAX_TASKS_PER_CHILD = 200   # articles a worker parses before it is replaced, capping memory growth
+
+def extract_article(source: str, url: str, html_content: bytes, parser: Optional[str] = None,
+                    partial: bool = True, scraper_cls: Optional[type] = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Parses raw HTML with the source's scraper and returns only the extracted fields.
+    Runs inside a worker process, so the parsed tree never crosses the process boundary.
+
+    Args:
+        source (str): Key in finders.SCRAPERS
+        url (str): URL the HTML was fetched from
+        html_content (bytes): Raw HTML
+        parser (str, optional): HTML parser backend
+        partial (bool): Parse only the subtrees the extractors need
+        scraper_cls (type, optional): Scraper to use instead of the source's
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: (headline, body). Fields that could not be
+                                             extracted are None.
+    """
+    scraper = (scraper_cls or SCRAPERS[source])(url, parser=parser, partial=partial)
+    if scraper.load_html(html_content) is None:
+        return None, None
+    try:
+        return scraper.get_article_data()
+    except ValueError:
+        # TheAPScraper raises instead of returning None
+        return None, None
+
+def extract_in_worker(*args) -> Tuple[Tuple[Optional[str], Optional[str]], dict]:
+    """
+    Runs extract_article() in a worker process and returns its result together with the
+    metrics it recorded, which would otherwise stay in the worker's own registry.
+    """
+    # A worker runs one article at a time, so its registry holds exactly this article's metrics
+    REGISTRY.reset()
+    fields = extract_article(*args)
+    return fields, REGISTRY.export()
+
+def merge_metrics(worker_future: Future, result: Future):
+    """
+    Records a finished worker's metrics in this process and resolves result with its fields.
+    """
+    try:
+        fields, metrics = worker_future.result()
+    except BaseException as e:
+        result.set_exception(e)
+        return
+    REGISTRY.merge(metrics)
+    result.set_result(fields)
+
+class ParsePool:
+    """
+    Process pool that runs the CPU-bound parse and extraction step on every core.
+
+    Only raw bytes go to the workers and only the (headline, body) strings come back.
+    Workers are recycled after max_tasks_per_child articles so fragmented heaps from
+    large pages do not grow without bound.
+    """
+    def __init__(
+        self,
+        workers: int = ParsePoolConfig.WORKERS,
+        max_tasks_per_child: Optional[int] = ParsePoolConfig.MAX_TASKS_PER_CHILD,
+        parser: Optional[str] = None,
+        partial: bool = True,
+    ):
+        """
+        Args:
+            workers (int): Number of worker processes
+            max_tasks_per_child (int, optional): Articles per worker before it is replaced.
+                                                 None keeps workers for the pool's lifetime, as
+                                                 does any value on Python before 3.11.
+            parser (str, optional): HTML parser backend used by the workers
+            partial (bool): Parse only the subtrees the extractors need
+        """
+        self.workers = max(1, workers)
+        self.parser = parser
+        self.partial = partial
+
+        kwargs = {}
+        # ProcessPoolExecutor only accepts max_tasks_per_child from Python 3.11
+        if max_tasks_per_child and sys.version_info >= (3, 11):
+            # Worker recycling requires the spawn start method
+            kwargs['max_tasks_per_child'] = max_tasks_per_child
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, **kwargs)
+
+    def submit(self, source: str, url: str, html_content: bytes, scraper_cls: Optional[type] = None) -> Future:
+        """
+        Queues one article for extraction.
+
+        Args:
+            source (str): Source the article came from, selects its scraper
+            url (str): URL the HTML was fetched from
+            html_content (bytes): Raw HTML
+            scraper_cls (type, optional): Scraper to use instead of the source's
+
+        Returns:
+            Future: Resolves to (headline, body) once the worker's metrics have been recorded here
+        """
+        result = Future()
+        worker_future = self.executor.submit(
+            extract_in_worker, source, url, html_content, self.parser, self.partial, scraper_cls
+        )
+        worker_future.add_done_callback(lambda done: merge_metrics(done, result))
+        return result
+
+    def extract(self, source: str, url: str, html_content: bytes,
+                scraper_cls: Optional[type] = None) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Extracts one article and waits for the result.
+        """
+        return self.submit(source, url, html_content, scraper_cls).result()
+
+    async def extract_async(self, source: str, url: str, html_content: bytes,
+                            scraper_cls: Optional[type] = None) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Extracts one article without blocking the event loop.
+        """
+        return await asyncio.wrap_future(self.submit(source, url, html_content, scraper_cls))
+
+    async def signature_async(self, text: str, shingle_size: int = DedupConfig.SHINGLE_SIZE,
+                              num_perm: int = DedupConfig.NUM_PERM) -> Tuple[int, ...]:
+        """
+        Computes an article's near-duplicate signature in a worker, off the fetch threads.
+        """
+        return await asyncio.wrap_future(self.executor.submit(text_signature, text, shingle_size, num_perm))
+
+    def close(self):
+        """
+        Waits for queued articles and stops the workers.
+        """
+        self.executor.shutdown(wait=True)
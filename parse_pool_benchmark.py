@@ -0,0 +1,51 @@
+import argparse
+import os
+import time
+
+from benchmark_fixtures import CONTENT_CLASSES, load_pages, synthetic_notice
+from parse_pool import ParsePool
+
+def run(pool: ParsePool, pages: list) -> float:
+    """
+    Extracts every (source, page) pair through the pool.
+
+    Returns:
+        float: Articles extracted per second
+    """
+    start = time.perf_counter()
+    futures = [pool.submit(source, 'https://example.com/fixture', page) for source, page in pages]
+    for future in futures:
+        headline, body = future.result()
+        assert headline and body, "fixture page did not extract"
+    return len(pages) / (time.perf_counter() - start)
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark process-pool extraction throughput by worker count")
+    arg_parser.add_argument('--articles', type=int, default=120)
+    arg_parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument('--full', action='store_true', help="parse whole pages instead of the article subtrees")
+    args = arg_parser.parse_args()
+
+    fixtures = [(source, page) for source in CONTENT_CLASSES for page in load_pages(source)]
+    pages = [fixtures[i % len(fixtures)] for i in range(args.articles)]
+
+    notice = synthetic_notice(CONTENT_CLASSES)
+    if notice:
+        print(notice)
+    print(f"{'workers':>7} {'articles/s':>11} {'speedup':>8}")
+    # Powers of two up to the core count, plus the core count itself
+    counts = sorted({2 ** i for i in range(args.max_workers.bit_length()) if 2 ** i <= args.max_workers} | {args.max_workers})
+
+    baseline = None
+    for workers in counts:
+        pool = ParsePool(workers=workers, partial=not args.full)
+        # Warm up so process start-up is not counted
+        run(pool, pages[:workers])
+        rate = run(pool, pages)
+        pool.close()
+
+        baseline = baseline or rate
+        print(f"{workers:>7} {rate:>11.1f} {rate / baseline:>7.2f}x")
+
+if __name__ == '__main__':
+    main()
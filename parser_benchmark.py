@@ -0,0 +1,70 @@
+import argparse
+import statistics
+import time
+import tracemalloc
+from typing import Dict, List
+
+from benchmark_fixtures import CONTENT_CLASSES, load_pages, synthetic_notice
+from finders import SCRAPERS
+from html_parser import available_parsers, parse_html
+
+def measure(scraper_cls: type, pages: List[bytes], parser: str, partial: bool, repeat: int) -> Dict[str, float]:
+    """
+    Parses and extracts every page with one backend and reports per-article cost.
+
+    Returns:
+        Dict[str, float]: Median and p95 milliseconds per article, peak traced memory in MB
+                          and whether every page still produced a headline and body.
+    """
+    parse_only = scraper_cls.parse_only if partial else None
+    scraper = scraper_cls('https://example.com/fixture', parser=parser, partial=partial)
+    timings = []
+    complete = True
+
+    for _ in range(repeat):
+        for page in pages:
+            start = time.perf_counter()
+            soup = parse_html(page, parser=parser, parse_only=parse_only)
+            headline, content = scraper.parse_headline(soup), scraper.parse_content(soup)
+            timings.append((time.perf_counter() - start) * 1000)
+            complete = complete and bool(headline) and bool(content)
+
+    # Peak memory is measured separately so tracing overhead does not skew the timings
+    tracemalloc.start()
+    for page in pages:
+        soup = parse_html(page, parser=parser, parse_only=parse_only)
+        del soup
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'median_ms': statistics.median(timings),
+        'p95_ms': timings[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0],
+        'peak_mb': peak / (1024 * 1024),
+        'complete': complete,
+    }
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on fixture pages")
+    arg_parser.add_argument('--sources', nargs='+', default=list(CONTENT_CLASSES), choices=list(CONTENT_CLASSES))
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    notice = synthetic_notice(args.sources)
+    if notice:
+        print(notice)
+    print(f"{'source':<6} {'parser':<12} {'mode':<8} {'median ms':>10} {'p95 ms':>8} {'peak MB':>8}  ok")
+    for source in args.sources:
+        pages = load_pages(source)
+        for parser in available_parsers():
+            for partial in (False, True):
+                result = measure(SCRAPERS[source], pages, parser, partial, args.repeat)
+                mode = 'partial' if partial else 'full'
+                print(
+                    f"{source:<6} {parser:<12} {mode:<8} {result['median_ms']:>10.2f} "
+                    f"{result['p95_ms']:>8.2f} {result['peak_mb']:>8.2f}  {result['complete']}"
+                )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,538 @@
+import asyncio
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from dedup import StoryDeduplicator
+from logger import setup_logger
+from map_reduce import estimate_tokens
+from metrics import REGISTRY, timed
+from parse_pool import ParsePool
+from scheduling import LLMBudget, ScheduleConfig, article_priority
+from seen_index import SeenArticleIndex
+from text_cleaner import TextCleaner
+
+ARTICLES = REGISTRY.counter('pipeline_articles_total', 'Articles leaving the fetch stage by source and outcome')
+DEFERRED = REGISTRY.counter('pipeline_deferred_total', 'Articles whose summary was deferred because the cycle budget was spent')
+
+class PipelineConfig:
+    """Default concurrency settings for the crawl pipeline"""
+    DISCOVERY_CONCURRENCY = 2   # finders running get_link() at the same time
+    FETCH_CONCURRENCY = 8       # articles being downloaded and extracted at the same time
+    SUMMARIZE_CONCURRENCY = 2   # articles being summarized at the same time
+    QUEUE_SIZE = 32             # items buffered between two stages before producers block
+
+@dataclass
+class ArticleResult:
+    """An article as it moves through the pipeline stages"""
+    topic: str
+    url: str
+    source: str = ''
+    headline: Optional[str] = None
+    content: Optional[str] = None
+    summary: Optional[str] = None
+    error: Optional[str] = None
+    duplicate_of: Optional[str] = None
+    # Estimated prompt tokens dropped by the cleaning stage
+    tokens_removed: int = 0
+    # Higher is summarized first, see scheduling.article_priority
+    priority: float = 0.0
+    # Not summarized because the cycle's LLM budget ran out; picked up again next cycle
+    deferred: bool = False
+    # Every topic the URL was discovered under; `topic` is the first of them
+    topics: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.topics:
+            self.topics = [self.topic]
+
+class CrawlPipeline:
+    """
+    Runs discovery -> fetch/extract -> summarize as concurrent asyncio stages.
+
+    Stages are connected by bounded queues, so a slow stage applies backpressure to the
+    one before it instead of letting work pile up in memory. The existing finders, scrapers
+    and summarizer are blocking, so every stage runs them on a shared thread pool while the
+    event loop coordinates the hand-offs.
+    """
+    def __init__(
+        self,
+        finders: List[object],
+        scraper_cls: Optional[type] = None,
+        summarize: Optional[Callable[[str], str]] = None,
+        discovery_concurrency: int = PipelineConfig.DISCOVERY_CONCURRENCY,
+        fetch_concurrency: int = PipelineConfig.FETCH_CONCURRENCY,
+        summarize_concurrency: int = PipelineConfig.SUMMARIZE_CONCURRENCY,
+        queue_size: int = PipelineConfig.QUEUE_SIZE,
+        deduplicator: Optional[StoryDeduplicator] = None,
+        seen_index: Optional[SeenArticleIndex] = None,
+        parse_pool: Optional[ParsePool] = None,
+        cleaner: Optional[TextCleaner] = None,
+        topic_weights: Optional[Dict[str, float]] = None,
+        budget: Optional[LLMBudget] = None,
+        carry_over: Optional[Dict[str, ArticleResult]] = None,
+    ):
+        """
+        Args:
+            finders (List[object]): Article finders exposing get_link() -> {topic: [url, ...]}.
+                                    All finders are discovered concurrently.
+            scraper_cls (type, optional): Scraper class instantiated with each URL, exposing
+                                          get_article_data(). Only needed for finders that do not
+                                          name their own `scraper_cls`.
+            summarize (Callable[[str], str], optional): Summarizes article text. When omitted the
+                                                        summarize stage passes articles through.
+            discovery_concurrency (int): Maximum number of finders running at once
+            fetch_concurrency (int): Maximum number of articles fetched at once
+            summarize_concurrency (int): Maximum number of summaries generated at once
+            queue_size (int): Capacity of each queue between stages
+            deduplicator (StoryDeduplicator, optional): Groups near-duplicate stories so only the
+                                                       first article of each group is summarized
+            seen_index (SeenArticleIndex, optional): Articles scraped in earlier runs. Only new
+                                                     articles, and re-checked ones whose text
+                                                     changed, continue past the fetch stage.
+            parse_pool (ParsePool, optional): Runs parsing and extraction in worker processes.
+                                              Threads then only download the raw HTML.
+            cleaner (TextCleaner, optional): Strips whitespace runs, source boilerplate and repeated
+                                             lines from the text before it is deduplicated and summarized
+            topic_weights (Dict[str, float], optional): Importance of each topic when ranking articles.
+                                                        Unlisted topics weigh 1.0.
+            budget (LLMBudget, optional): Time and/or token limit on summarization for one run.
+                                          Articles are admitted highest priority first across the
+                                          whole run; the ones left when it runs out are deferred to
+                                          the next run.
+            carry_over (Dict[str, ArticleResult], optional): Articles an earlier run deferred, by URL.
+                                                             When one is discovered again its extracted
+                                                             text is reused instead of fetching it.
+        """
+        self.logger = setup_logger(__name__)
+        self.finders = list(finders)
+        self.scraper_cls = scraper_cls
+        # source name -> scraper class, so each article is extracted by its own outlet's scraper
+        self.scrapers = {
+            getattr(finder, 'source', ''): getattr(finder, 'scraper_cls', None) or scraper_cls
+            for finder in self.finders
+        }
+        # source -> the finder's transport and cache, so articles are fetched the way their section pages were
+        self.scraper_options = {
+            getattr(finder, 'source', ''): {
+                'transport': getattr(finder, 'transport', None),
+                'cache': getattr(finder, 'cache', None)
+            }
+            for finder in self.finders
+        }
+        self.summarize = summarize
+        self.discovery_concurrency = max(1, discovery_concurrency)
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        self.summarize_concurrency = max(1, summarize_concurrency)
+        self.queue_size = max(1, queue_size)
+        self.deduplicator = deduplicator
+        self.seen_index = seen_index
+        self.parse_pool = parse_pool
+        self.cleaner = cleaner
+        self.topic_weights = topic_weights or {}
+        self.budget = budget
+        self.carry_over = carry_over or {}
+        self.executor = None
+        # Tie-breaker for the priority queues, keeps equal priorities in arrival order
+        self.sequence = itertools.count()
+        # url -> queued article, so a link listed under several topics is fetched once
+        self.queued: Dict[str, ArticleResult] = {}
+        # Budget admission state: url -> priority of articles not yet through the fetch stage,
+        # fetched articles waiting for admission, and finders still discovering
+        self.pending: Dict[str, float] = {}
+        self.held: List[tuple] = []
+        self.discovering = 0
+
+    async def run_blocking(self, func: Callable, *args):
+        """
+        Runs a blocking call on the pipeline's thread pool.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    def entry(self, article: Optional[ArticleResult]) -> tuple:
+        """
+        Wraps an article for the priority queues. The None sentinel sorts after every article.
+        """
+        priority = float('inf') if article is None else -article.priority
+        return priority, next(self.sequence), article
+
+    def prioritize(self, finder: object, topic: str, links: List[str]) -> Dict[str, float]:
+        """
+        Scores one topic's links by their position on the page, the topic's weight and,
+        for feeds, how recently each story was published.
+        """
+        weight = self.topic_weights.get(topic, ScheduleConfig.DEFAULT_TOPIC_WEIGHT)
+        feed_entries = getattr(finder, 'feed_entries', {})
+        priorities = {}
+        for position, link in enumerate(links):
+            feed_entry = feed_entries.get(link)
+            published = feed_entry.timestamp if feed_entry else None
+            priorities[link] = article_priority(position, weight, published)
+        return priorities
+
+    @staticmethod
+    def modified_times(finder: object, links: List[str]) -> Dict[str, float]:
+        """
+        Maps links to the last publication or modification time their feed reports, so a seen
+        article updated since its last fetch is picked up without waiting for the re-check interval.
+        """
+        feed_entries = getattr(finder, 'feed_entries', {})
+        times = {}
+        for link in links:
+            feed_entry = feed_entries.get(link)
+            if feed_entry and feed_entry.timestamp:
+                times[link] = feed_entry.timestamp.timestamp()
+        return times
+
+    async def discover(
+        self,
+        finder: object,
+        semaphore: asyncio.Semaphore,
+        link_queue: asyncio.Queue,
+        article_queue: asyncio.Queue
+    ):
+        """
+        Discovery stage: runs one finder and queues every link it returns.
+        """
+        try:
+            await self.discover_links(finder, semaphore, link_queue)
+        finally:
+            # Held articles may be waiting for every candidate of the run to be known
+            self.discovering -= 1
+            if self.budget:
+                await self.release(article_queue)
+
+    async def discover_links(self, finder: object, semaphore: asyncio.Semaphore, link_queue: asyncio.Queue):
+        async with semaphore:
+            try:
+                with timed('pipeline_stage_seconds', stage='discover', source=getattr(finder, 'source', '')):
+                    links = await self.run_blocking(finder.get_link)
+            except Exception as e:
+                self.logger.error(f"Discovery failed for {type(finder).__name__}: {e}")
+                return
+
+        fresh = []
+        for topic, link_list in links.items():
+            # Ranked on the full list, so a link keeps the position it has on the page
+            priorities = self.prioritize(finder, topic, link_list)
+            if self.seen_index is not None:
+                link_list = await self.run_blocking(
+                    self.seen_index.filter_new, link_list, self.modified_times(finder, link_list)
+                )
+            for link in link_list:
+                queued = self.queued.get(link)
+                if queued is not None:
+                    if topic not in queued.topics:
+                        queued.topics.append(topic)
+                    queued.priority = max(queued.priority, priorities[link])
+                    if link in self.pending:
+                        self.pending[link] = queued.priority
+                    continue
+
+                article = self.queued[link] = ArticleResult(
+                    topic=topic, url=link, source=getattr(finder, 'source', ''), priority=priorities[link]
+                )
+                carried = self.carry_over.get(link)
+                if carried is not None and carried.content:
+                    # Extracted and cleaned by the run that deferred it
+                    article.headline, article.content = carried.headline, carried.content
+                    article.tokens_removed = carried.tokens_removed
+                if self.budget:
+                    self.pending[link] = article.priority
+                fresh.append(article)
+
+        for article in sorted(fresh, key=lambda article: article.priority, reverse=True):
+            # Blocks while the fetch stage is saturated
+            await link_queue.put(self.entry(article))
+
+    def build_scraper(self, article: ArticleResult) -> object:
+        """
+        Creates the scraper for an article with its finder's transport and cache.
+        """
+        return self.scrapers[article.source](article.url, **self.scraper_options.get(article.source, {}))
+
+    def scrape(self, article: ArticleResult) -> ArticleResult:
+        """
+        Downloads and extracts one article. Runs on the thread pool.
+        """
+        try:
+            scraper = self.build_scraper(article)
+            article.headline, article.content = scraper.get_article_data()
+            if not article.content:
+                article.error = "Article body not found"
+        except Exception as e:
+            article.error = str(e)
+        return article
+
+    async def scrape_in_pool(self, article: ArticleResult) -> ArticleResult:
+        """
+        Downloads one article on the thread pool and extracts it in the process pool.
+        """
+        try:
+            scraper = self.build_scraper(article)
+            html_content = await self.run_blocking(scraper.fetch_html_content)
+            if not html_content:
+                article.error = "Could not fetch article"
+                return article
+
+            article.headline, article.content = await self.parse_pool.extract_async(
+                article.source, article.url, html_content, self.scrapers[article.source]
+            )
+            if not article.content:
+                article.error = "Article body not found"
+        except Exception as e:
+            article.error = str(e)
+        return article
+
+    def clean(self, article: ArticleResult) -> ArticleResult:
+        """
+        Cleaning stage: normalizes the extracted text. Runs on the thread pool.
+        """
+        cleaned = self.cleaner.clean(article.content, article.source)
+        article.content = cleaned.text
+        article.tokens_removed = cleaned.tokens_removed
+        self.logger.info(f"Cleaned {article.url}: removed {cleaned.tokens_removed} of {cleaned.tokens_before} tokens")
+        if not article.content:
+            article.error = "Article body empty after cleaning"
+        return article
+
+    async def fetch_article(self, article: ArticleResult) -> Optional[ArticleResult]:
+        """
+        Downloads, extracts, cleans and deduplicates one article. An article carried over from
+        an earlier run already has its text and skips the download, extraction and cleaning.
+
+        Returns:
+            ArticleResult: The article for the summarize stage, with its error set if it failed.
+            None: If the article was re-checked and its text has not changed.
+        """
+        if article.content is None:
+            with timed('pipeline_stage_seconds', stage='fetch', source=article.source):
+                if self.parse_pool:
+                    article = await self.scrape_in_pool(article)
+                else:
+                    article = await self.run_blocking(self.scrape, article)
+            if self.cleaner and not article.error:
+                article = await self.run_blocking(self.clean, article)
+        else:
+            self.logger.info(f"Reusing the text extracted by an earlier run for {article.url}")
+        if article.error:
+            ARTICLES.inc(source=article.source, outcome='error')
+            self.logger.error(f"Error: {article.error}")
+            self.logger.error(f"Link: {article.url}")
+            return article
+
+        self.logger.info(f"Headline: {article.headline}")
+        if self.seen_index is not None:
+            changed = await self.run_blocking(self.seen_index.record, article.url, article.content)
+            if not changed:
+                # Re-checked article with unchanged text, nothing downstream to do
+                ARTICLES.inc(source=article.source, outcome='unchanged')
+                return None
+        if self.deduplicator:
+            signature = None
+            if self.parse_pool:
+                # Shingling and hashing are CPU-bound, keep them off the fetch threads
+                signature = await self.parse_pool.signature_async(
+                    article.content, self.deduplicator.shingle_size, self.deduplicator.num_perm
+                )
+            article.duplicate_of = await self.run_blocking(self.deduplicator.add, article.url, article.content, signature)
+        ARTICLES.inc(source=article.source, outcome='duplicate' if article.duplicate_of else 'new')
+        return article
+
+    async def fetch_worker(self, link_queue: asyncio.Queue, article_queue: asyncio.Queue):
+        """
+        Fetch stage: pulls links until it receives the None sentinel.
+        """
+        while True:
+            _, _, article = await link_queue.get()
+            try:
+                if article is None:
+                    break
+                url = article.url
+
+                # A failure must not kill the worker: once every fetcher is gone, discovery
+                # blocks forever on the full link queue
+                try:
+                    article = await self.fetch_article(article)
+                except Exception as e:
+                    article.error = f"Fetch stage failed: {e}"
+                    ARTICLES.inc(source=article.source, outcome='error')
+                    self.logger.error(f"{article.error} ({article.url})")
+                    # The failure may come after the article was recorded as seen
+                    await self.forget(article)
+
+                await self.hand_off(url, article, article_queue)
+            finally:
+                link_queue.task_done()
+
+    async def hand_off(self, url: str, article: Optional[ArticleResult], article_queue: asyncio.Queue):
+        """
+        Passes a fetched article (None if it was unchanged) to the summarize stage. Under a
+        budget it is held until release() admits it.
+        """
+        if not self.budget:
+            if article is not None:
+                await article_queue.put(self.entry(article))
+            return
+
+        self.pending.pop(url, None)
+        if article is not None:
+            heapq.heappush(self.held, self.entry(article))
+        await self.release(article_queue)
+
+    async def release(self, article_queue: asyncio.Queue):
+        """
+        Admits held articles highest priority first, once no article still being discovered or
+        fetched could outrank them, and charges the budget as it goes. Admission therefore
+        follows priority over the whole run, not the order in which fetches happen to finish.
+        Articles the budget cannot take are deferred.
+        """
+        while self.held:
+            article = self.held[0][2]
+            if self.discovering or any(priority > article.priority for priority in self.pending.values()):
+                return
+
+            heapq.heappop(self.held)
+            if self.summarize and not article.error and not article.duplicate_of:
+                if not self.budget.reserve(estimate_tokens(article.content)):
+                    await self.defer(article)
+            await article_queue.put(self.entry(article))
+
+    async def summarize_article(self, article: ArticleResult):
+        """
+        Summarizes one extracted article, or defers it when the budget is spent.
+        """
+        if not self.summarize or article.error or article.duplicate_of or article.deferred:
+            return
+        # Admitted by release(), but no new summary may start once the time budget is spent
+        if self.budget and self.budget.expired():
+            await self.defer(article)
+            return
+
+        try:
+            with timed('pipeline_stage_seconds', stage='summarize', source=article.source):
+                article.summary = await self.run_blocking(self.summarize, article.content)
+            if article.summary is None:
+                article.error = "Summarization failed: no summary returned"
+        except Exception as e:
+            article.error = f"Summarization failed: {e}"
+        if article.error:
+            self.logger.error(f"{article.error} ({article.url})")
+            # Recorded as seen by the fetch stage; the next run must try it again
+            await self.forget(article)
+
+    async def summarize_worker(self, article_queue: asyncio.Queue, results: List[ArticleResult]):
+        """
+        Summarize stage: pulls the highest-priority extracted article until it receives the None sentinel.
+        """
+        while True:
+            _, _, article = await article_queue.get()
+            try:
+                if article is None:
+                    break
+
+                # A failure must not kill the worker: once every summarizer is gone, the fetch
+                # workers block forever on the full article queue
+                try:
+                    await self.summarize_article(article)
+                except Exception as e:
+                    article.error = f"Summarize stage failed: {e}"
+                    self.logger.error(f"{article.error} ({article.url})")
+                results.append(article)
+            finally:
+                article_queue.task_done()
+
+    async def defer(self, article: ArticleResult):
+        """
+        Leaves an article unsummarized for this run and makes sure the next run picks it up again.
+        """
+        article.deferred = True
+        DEFERRED.inc(source=article.source)
+        self.logger.info(f"LLM budget spent, deferring {article.url} (priority {article.priority:.3f})")
+        await self.forget(article)
+
+    async def forget(self, article: ArticleResult):
+        """
+        Drops an article from the seen index, so the next run fetches it again.
+        """
+        if self.seen_index is not None:
+            await self.run_blocking(self.seen_index.forget, article.url)
+
+    async def run(self) -> List[ArticleResult]:
+        """
+        Runs every stage to completion.
+
+        Returns:
+            List[ArticleResult]: One entry per unique discovered link, in completion order.
+                                 Failed articles are included with their error set.
+        """
+        # Priority queues, so the fetch and summarize stages always take the most valuable article waiting
+        link_queue = asyncio.PriorityQueue(maxsize=self.queue_size)
+        article_queue = asyncio.PriorityQueue(maxsize=self.queue_size)
+        results = []
+        self.queued = {}
+        self.pending = {}
+        self.held = []
+        self.discovering = len(self.finders)
+        if self.budget:
+            self.budget.start()
+
+        workers = self.discovery_concurrency + self.fetch_concurrency + self.summarize_concurrency
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            fetchers = [
+                asyncio.create_task(self.fetch_worker(link_queue, article_queue))
+                for _ in range(self.fetch_concurrency)
+            ]
+            summarizers = [
+                asyncio.create_task(self.summarize_worker(article_queue, results))
+                for _ in range(self.summarize_concurrency)
+            ]
+
+            semaphore = asyncio.Semaphore(self.discovery_concurrency)
+            await asyncio.gather(*(
+                self.discover(finder, semaphore, link_queue, article_queue) for finder in self.finders
+            ))
+
+            # Shut the stages down in order once everything upstream has drained
+            for _ in fetchers:
+                await link_queue.put(self.entry(None))
+            await asyncio.gather(*fetchers)
+
+            for _ in summarizers:
+                await article_queue.put(self.entry(None))
+            await asyncio.gather(*summarizers)
+        finally:
+            self.executor.shutdown(wait=False)
+
+        # Near-duplicates share the summary of the first article in their group
+        summaries = {article.url: article.summary for article in results if not article.duplicate_of}
+        for article in results:
+            if article.duplicate_of:
+                article.summary = summaries.get(article.duplicate_of)
+
+        # A duplicate of a deferred or failed article has no summary to share yet, so it waits for the next run too
+        deferred = {article.url for article in results if article.deferred}
+        failed = {article.url for article in results if article.error and not article.duplicate_of}
+        for article in results:
+            if article.duplicate_of in deferred:
+                article.deferred = True
+            elif article.duplicate_of in failed:
+                article.error = f"Summarization failed for {article.duplicate_of}"
+            else:
+                continue
+            if self.seen_index is not None:
+                self.seen_index.forget(article.url)
+        if self.budget:
+            self.logger.info(f"LLM budget: {self.budget.stats()}, {len(deferred)} articles deferred")
+
+        return results
+
+    def run_sync(self) -> List[ArticleResult]:
+        """
+        Convenience wrapper that runs the pipeline on a fresh event loop.
+        """
+        return asyncio.run(self.run())
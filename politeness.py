@@ -0,0 +1,238 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+from logger import setup_logger
+
+class PolitenessConfig:
+    """Default per-host crawl budget"""
+    RATE = 2.0                  # requests per second per host
+    BURST = 4                   # requests a host can receive back to back
+    MAX_CONCURRENCY = 4         # requests in flight per host
+    MIN_RATE = 0.05             # floor for the adaptive rate
+    THROTTLE_FACTOR = 0.5       # rate multiplier after a 429 or 503
+    SLOW_FACTOR = 0.8           # rate multiplier when latency climbs
+    RECOVERY_FACTOR = 1.05      # rate multiplier after a healthy response
+    LATENCY_RATIO = 2.0         # latency this many times the baseline counts as rising
+    ROBOTS_TIMEOUT = 5.0        # seconds allowed to fetch robots.txt
+    USER_AGENT = '*'            # robots.txt group to honour
+
+def host_key(url: str) -> str:
+    """
+    Returns the host and port a request goes to, which is what a budget applies to.
+    """
+    return urlsplit(url).netloc.lower()
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second, holding at most `capacity` tokens.
+    Not thread-safe on its own; HostBudget guards it with its lock.
+    """
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """
+        Takes one token, going into debt if none are left.
+
+        Returns:
+            float: Seconds the caller must wait before the token is really available
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+class HostBudget:
+    """Rate, concurrency and latency state for one host"""
+    def __init__(self, rate: float, burst: int, max_concurrency: int):
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.target_rate = rate
+        self.bucket = TokenBucket(rate, burst)
+        self.paused_until = 0.0
+        self.baseline_latency: Optional[float] = None
+
+class PolitenessScheduler:
+    """
+    Gates every request to a host behind that host's concurrency limit and token bucket.
+
+    Hosts are independent, so cnn.com, foxnews.com and apnews.com proceed in parallel while
+    each stays inside its own budget. A host's rate is capped by its robots.txt Crawl-delay /
+    Request-rate, halved on 429 and 503 replies (pausing for Retry-After when given), trimmed
+    when latency climbs above its baseline, and slowly restored after healthy responses.
+    """
+    def __init__(
+        self,
+        rate: float = PolitenessConfig.RATE,
+        burst: int = PolitenessConfig.BURST,
+        max_concurrency: int = PolitenessConfig.MAX_CONCURRENCY,
+        respect_robots: bool = True,
+        user_agent: str = PolitenessConfig.USER_AGENT,
+        fetch_robots: Optional[Callable[[str], Optional[str]]] = None,
+    ):
+        """
+        Args:
+            rate (float): Requests per second per host
+            burst (int): Requests a host may receive back to back
+            max_concurrency (int): Requests in flight per host
+            respect_robots (bool): Apply robots.txt crawl delays
+            user_agent (str): robots.txt user agent group to honour
+            fetch_robots (Callable[[str], Optional[str]], optional): Returns the robots.txt body
+                                                                     for a URL, or None. Defaults
+                                                                     to a plain GET with a timeout.
+        """
+        self.logger = setup_logger(__name__)
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+        self.fetch_robots = fetch_robots or self.default_fetch_robots
+
+        self._lock = threading.Lock()
+        self.hosts: Dict[str, HostBudget] = {}
+
+    @staticmethod
+    def default_fetch_robots(robots_url: str) -> Optional[str]:
+        """
+        Downloads robots.txt directly, bypassing the scheduler to avoid waiting on itself.
+        """
+        try:
+            response = requests.get(robots_url, timeout=PolitenessConfig.ROBOTS_TIMEOUT)
+        except requests.RequestException:
+            return None
+        return response.text if response.status_code == 200 else None
+
+    def robots_rate(self, url: str) -> Optional[float]:
+        """
+        Reads the request rate allowed by a host's robots.txt.
+
+        Returns:
+            float: Maximum requests per second from Crawl-delay or Request-rate.
+            None: If robots.txt sets neither, or could not be read.
+        """
+        scheme = urlsplit(url).scheme or 'https'
+        body = self.fetch_robots(f"{scheme}://{host_key(url)}/robots.txt")
+        if not body:
+            return None
+
+        robots = RobotFileParser()
+        robots.parse(body.splitlines())
+
+        rates = []
+        delay = self.parse_crawl_delay(body)
+        if delay:
+            rates.append(1.0 / delay)
+        request_rate = robots.request_rate(self.user_agent)
+        if request_rate and request_rate.requests:
+            rates.append(request_rate.requests / request_rate.seconds)
+        return min(rates) if rates else None
+
+    def parse_crawl_delay(self, body: str) -> Optional[float]:
+        """
+        Reads Crawl-delay for our user agent, falling back to the '*' group.
+        RobotFileParser only accepts whole seconds, so fractional delays are parsed here.
+        """
+        delays = {}
+        agents = []
+        in_rules = False
+        for line in body.splitlines():
+            line = line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            key, value = (part.strip() for part in line.split(':', 1))
+            key = key.lower()
+
+            if key == 'user-agent':
+                # Consecutive User-agent lines share one group
+                if in_rules:
+                    agents, in_rules = [], False
+                agents.append(value.lower())
+                continue
+
+            in_rules = True
+            if key == 'crawl-delay':
+                try:
+                    for agent in agents:
+                        delays.setdefault(agent, float(value))
+                except ValueError:
+                    continue
+
+        return delays.get(self.user_agent.lower(), delays.get('*'))
+
+    def budget(self, url: str) -> HostBudget:
+        """
+        Returns the budget of a URL's host, creating it (and reading robots.txt) on first use.
+        """
+        host = host_key(url)
+        with self._lock:
+            budget = self.hosts.get(host)
+            if budget is not None:
+                return budget
+
+        rate = self.rate
+        if self.respect_robots:
+            allowed = self.robots_rate(url)
+            if allowed is not None and allowed < rate:
+                self.logger.info(f"robots.txt limits {host} to {allowed:.2f} requests/s")
+                rate = allowed
+
+        with self._lock:
+            # Another thread may have created it while robots.txt was downloading
+            return self.hosts.setdefault(host, HostBudget(rate, self.burst, self.max_concurrency))
+
+    @contextmanager
+    def slot(self, url: str):
+        """
+        Blocks until the host has a free connection slot and a token, then holds the slot.
+
+        Example:
+            with scheduler.slot(url):
+                response = session.get(url)
+        """
+        budget = self.budget(url)
+        with budget.slots:
+            with budget.lock:
+                now = time.monotonic()
+                wait = max(budget.bucket.reserve(now), budget.paused_until - now)
+            if wait > 0:
+                time.sleep(wait)
+            yield
+
+    def record(self, url: str, status_code: Optional[int], latency: float, retry_after: Optional[float] = None):
+        """
+        Adapts a host's rate to the outcome of a request.
+
+        Args:
+            url (str): URL that was requested
+            status_code (int, optional): Response status, None if the request failed outright
+            latency (float): Seconds the request took
+            retry_after (float, optional): Seconds the server asked us to wait
+        """
+        budget = self.budget(url)
+        with budget.lock:
+            bucket = budget.bucket
+            if status_code in (429, 503) or status_code is None:
+                bucket.rate = max(PolitenessConfig.MIN_RATE, bucket.rate * PolitenessConfig.THROTTLE_FACTOR)
+                if retry_after:
+                    budget.paused_until = max(budget.paused_until, time.monotonic() + retry_after)
+                self.logger.warning(f"Throttling {host_key(url)} to {bucket.rate:.2f} requests/s")
+                return
+
+            baseline = budget.baseline_latency
+            if baseline is not None and latency > baseline * PolitenessConfig.LATENCY_RATIO:
+                bucket.rate = max(PolitenessConfig.MIN_RATE, bucket.rate * PolitenessConfig.SLOW_FACTOR)
+            else:
+                bucket.rate = min(budget.target_rate, bucket.rate * PolitenessConfig.RECOVERY_FACTOR)
+
+            # Slow-moving average so one outlier does not reset the baseline
+            budget.baseline_latency = latency if baseline is None else 0.9 * baseline + 0.1 * latency
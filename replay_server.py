@@ -0,0 +1,206 @@
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from benchmark_fixtures import load_pages, synthetic_notice
+from finders import FINDERS
+from logger import setup_logger
+from transport import HTTPTransport
+
+class ReplayConfig:
+    """Default settings for the offline replay server"""
+    HOST = '127.0.0.1'
+    PAGE_LATENCY = 0.0      # seconds added before every page response
+    LLM_LATENCY = 0.5       # seconds the stub model takes per summary
+    LLM_TOKENS = 64         # tokens the stub model "generates" per summary
+
+def site_routes() -> Dict[str, Tuple[str, frozenset]]:
+    """
+    Maps each source's hostname to its source name and the paths of its section pages.
+    """
+    routes = {}
+    for source, finder in FINDERS.items():
+        host = urlsplit(finder.config.BASE_URL).netloc
+        routes[host] = (source, frozenset(urlsplit(url).path for url in finder.config.TOPIC_PAGES.values()))
+    return routes
+
+def pick(pages: List[bytes], key: str) -> bytes:
+    """
+    Picks a page for a path, always the same one for the same path.
+    """
+    return pages[zlib.crc32(key.encode('utf-8')) % len(pages)]
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """
+    Serves recorded pages at /<original host>/<original path> and a stub of Ollama's /api/generate.
+    """
+    protocol_version = 'HTTP/1.1'
+    server: 'ReplayServer'
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        host, _, path = self.path.lstrip('/').partition('/')
+        path = '/' + path.split('?')[0]
+        route = self.server.routes.get(host)
+        if route is None:
+            self.send_body(404, b'Not recorded', 'text/plain')
+            return
+
+        source, section_paths = route
+        kind = 'section' if path.rstrip('/') in section_paths else 'article'
+        if self.server.page_latency:
+            time.sleep(self.server.page_latency)
+        self.server.count(kind)
+        self.send_body(200, pick(self.server.pages[source, kind], path), 'text/html; charset=utf-8')
+
+    def do_POST(self):
+        if self.path != '/api/generate':
+            self.send_body(404, b'Not found', 'text/plain')
+            return
+
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        self.server.count('generate')
+        words = body.get('prompt', '').split()
+        tokens = self.server.llm_tokens
+        summary = ['Unbiased', 'Summary:'] + (words * (tokens // max(1, len(words)) + 1))[:max(0, tokens - 2)]
+        stats = {
+            'done': True,
+            'prompt_eval_count': len(words),
+            'eval_count': tokens,
+            'eval_duration': int(self.server.llm_latency * 1e9),
+        }
+
+        if not body.get('stream'):
+            time.sleep(self.server.llm_latency)
+            reply = {'model': body.get('model'), 'response': ' '.join(summary), **stats}
+            self.send_body(200, json.dumps(reply).encode('utf-8'), 'application/json')
+            return
+
+        # Streamed replies arrive as NDJSON, one token per line, spread across the latency
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        delay = self.server.llm_latency / max(1, len(summary))
+        for word in summary:
+            time.sleep(delay)
+            self.write_chunk({'model': body.get('model'), 'response': word + ' ', 'done': False})
+        self.write_chunk({'model': body.get('model'), 'response': '', **stats})
+        self.wfile.write(b'0\r\n\r\n')
+
+    def write_chunk(self, message: dict):
+        line = (json.dumps(message) + '\n').encode('utf-8')
+        self.wfile.write(b'%x\r\n%s\r\n' % (len(line), line))
+        self.wfile.flush()
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    Local HTTP server standing in for the news sites and the Ollama server during benchmarks.
+
+    Section and article pages come from benchmark_fixtures (recorded pages when present,
+    synthetic ones otherwise). Point a ReplayTransport at it to route live URLs here.
+    """
+    daemon_threads = True
+
+    def __init__(
+        self,
+        page_latency: float = ReplayConfig.PAGE_LATENCY,
+        llm_latency: float = ReplayConfig.LLM_LATENCY,
+        llm_tokens: int = ReplayConfig.LLM_TOKENS,
+        port: int = 0
+    ):
+        """
+        Args:
+            page_latency (float): Seconds added before every page response
+            llm_latency (float): Seconds the stub model takes per summary
+            llm_tokens (int): Tokens reported per summary
+            port (int): Port to listen on. 0 picks a free one.
+        """
+        super().__init__((ReplayConfig.HOST, port), ReplayHandler)
+        self.logger = setup_logger(__name__)
+        self.page_latency = page_latency
+        self.llm_latency = llm_latency
+        self.llm_tokens = llm_tokens
+        self.routes = site_routes()
+        self.pages = {
+            (source, kind): load_pages(source, kind)
+            for source, _ in self.routes.values()
+            for kind in ('section', 'article')
+        }
+        # Set when any source is served from generated pages instead of recorded ones
+        self.fixture_notice = synthetic_notice(
+            sorted({source for source, _ in self.routes.values()}), ('section', 'article')
+        )
+        if self.fixture_notice:
+            self.logger.warning(self.fixture_notice)
+        self._lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{ReplayConfig.HOST}:{self.server_address[1]}"
+
+    @property
+    def generate_url(self) -> str:
+        return f"{self.url}/api/generate"
+
+    def count(self, kind: str):
+        with self._lock:
+            self.requests[kind] = self.requests.get(kind, 0) + 1
+
+    def start(self) -> 'ReplayServer':
+        """
+        Serves requests on a background thread.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Replay server listening on {self.url}")
+        return self
+
+    def close(self):
+        """
+        Stops serving and releases the port.
+        """
+        self.shutdown()
+        self.server_close()
+
+class ReplayTransport(HTTPTransport):
+    """
+    HTTPTransport that sends every request to a ReplayServer instead of the live site,
+    so finders and scrapers run unchanged against recorded pages.
+    """
+    def __init__(self, server_url: str, **kwargs):
+        """
+        Args:
+            server_url (str): Base URL of the replay server
+            **kwargs: Options passed to HTTPTransport
+        """
+        super().__init__(**kwargs)
+        self.server_url = server_url.rstrip('/')
+
+    def rewrite(self, url: str) -> str:
+        """
+        Maps https://host/path?query to <server>/host/path?query. URLs already on the server are kept.
+        """
+        if url.startswith(self.server_url):
+            return url
+        parts = urlsplit(url)
+        rewritten = f"{self.server_url}/{parts.netloc}{parts.path or '/'}"
+        return f"{rewritten}?{parts.query}" if parts.query else rewritten
+
+    def request(self, method: str, url: str, headers: Dict[str, str] = None, **kwargs):
+        return super().request(method, self.rewrite(url), headers=headers, **kwargs)
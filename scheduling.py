@@ -0,0 +1,111 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+class ScheduleConfig:
+    """Default settings for ranking articles and budgeting the summarizer"""
+    # Each slot further down a section page is worth this fraction of the slot above it
+    POSITION_DECAY = 0.9
+    # Topics not listed in the weights count as 1.0
+    DEFAULT_TOPIC_WEIGHT = 1.0
+    # A story loses half its value every this many seconds since publication
+    RECENCY_HALF_LIFE = 6 * 60 * 60
+
+def article_priority(
+    position: int,
+    topic_weight: float = ScheduleConfig.DEFAULT_TOPIC_WEIGHT,
+    published: Optional[datetime] = None,
+    now: Optional[datetime] = None
+) -> float:
+    """
+    Scores an article; higher scores are summarized first.
+
+    Args:
+        position (int): Index of the link on its section page or feed (0 is the lead story)
+        topic_weight (float): Weight of the topic the link was found under
+        published (datetime, optional): Publication or last-modified time, when the source exposes it
+        now (datetime, optional): Reference time. Defaults to the current time.
+
+    Returns:
+        float: The article's priority
+    """
+    score = topic_weight * ScheduleConfig.POSITION_DECAY ** position
+    if published is not None:
+        now = now or datetime.now(timezone.utc)
+        age = max(0.0, (now - published).total_seconds())
+        score *= 0.5 ** (age / ScheduleConfig.RECENCY_HALF_LIFE)
+    return score
+
+class LLMBudget:
+    """
+    Per-cycle limit on summarization, by wall time since the cycle started and/or by prompt tokens.
+
+    Articles are offered in priority order, so once the budget is spent everything left
+    is of lower value and can be deferred to the next cycle.
+    """
+    def __init__(self, time_budget: Optional[float] = None, token_budget: Optional[int] = None):
+        """
+        Args:
+            time_budget (float, optional): Seconds after start() during which new summaries may begin
+            token_budget (int, optional): Estimated prompt tokens that may be sent per cycle
+        """
+        self.time_budget = time_budget
+        self.token_budget = token_budget
+        self._lock = threading.Lock()
+        self.started = None
+        self.tokens_used = 0
+        self.reserved = 0
+
+    def start(self):
+        """
+        Begins a cycle: restarts the clock and the token count.
+        """
+        with self._lock:
+            self.started = time.monotonic()
+            self.tokens_used = 0
+            self.reserved = 0
+
+    def remaining_time(self) -> Optional[float]:
+        if self.time_budget is None:
+            return None
+        if self.started is None:
+            return self.time_budget
+        return self.time_budget - (time.monotonic() - self.started)
+
+    def expired(self) -> bool:
+        """
+        Checks whether the time budget has run out. No new summary may start once it has.
+        """
+        with self._lock:
+            remaining = self.remaining_time()
+            return remaining is not None and remaining <= 0
+
+    def reserve(self, tokens: int) -> bool:
+        """
+        Claims budget for one summary.
+
+        The first summary of a cycle is always admitted while time remains, even if it alone
+        exceeds the token budget. Otherwise an article larger than the whole budget would be
+        deferred and refetched every cycle without ever being summarized.
+
+        Args:
+            tokens (int): Estimated prompt tokens of the article
+
+        Returns:
+            bool: True if the summary fits and the tokens were charged, False if it must be deferred
+        """
+        with self._lock:
+            remaining = self.remaining_time()
+            if remaining is not None and remaining <= 0:
+                return False
+            if self.token_budget is not None and self.reserved and self.tokens_used + tokens > self.token_budget:
+                return False
+            self.tokens_used += tokens
+            self.reserved += 1
+            return True
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            elapsed = time.monotonic() - self.started if self.started is not None else 0.0
+            return {'elapsed': elapsed, 'tokens_used': self.tokens_used, 'reserved': self.reserved}
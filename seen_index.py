@@ -0,0 +1,190 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from logger import setup_logger
+from summary_cache import normalize_text
+from url_utils import normalize_url
+
+class SeenIndexConfig:
+    """Default settings for the persistent seen-article index"""
+    INDEX_PATH = os.path.join('cache', 'seen_articles.sqlite3')
+    RECHECK_AFTER = 6 * 60 * 60     # seconds before a seen article is fetched again to look for edits
+    RETENTION = 7 * 24 * 60 * 60    # seconds without a fetch after which an article is pruned
+
+def content_hash(text: str) -> str:
+    """
+    Hashes whitespace-normalized article text.
+    """
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+class SeenArticleIndex:
+    """
+    Persistent record of every article already scraped, keyed by canonical URL.
+
+    Stores the first-seen time, the last time the article was fetched and a hash of its
+    text. Entries are mirrored in an in-memory dict, so membership checks during discovery
+    are O(1) and never touch the disk. The SQLite file holds one short row per article.
+    """
+    def __init__(self, path: str = SeenIndexConfig.INDEX_PATH, recheck_after: Optional[float] = SeenIndexConfig.RECHECK_AFTER):
+        """
+        Args:
+            path (str): SQLite file holding the index. ':memory:' keeps it in process.
+            recheck_after (float, optional): Seconds after which a seen article is fetched again
+                                             to detect edits. None never re-fetches seen articles.
+        """
+        self.logger = setup_logger(__name__)
+        self.recheck_after = recheck_after
+
+        if path != ':memory:' and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen (
+                url TEXT PRIMARY KEY,
+                first_seen REAL NOT NULL,
+                last_checked REAL NOT NULL,
+                content_hash TEXT
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS seen_last_checked ON seen (last_checked)")
+        self._conn.commit()
+
+        # canonical URL -> (last_checked, content_hash)
+        self._entries: Dict[str, Tuple[float, Optional[str]]] = {
+            url: (last_checked, digest)
+            for url, last_checked, digest in self._conn.execute("SELECT url, last_checked, content_hash FROM seen")
+        }
+
+    def __contains__(self, url: str) -> bool:
+        return normalize_url(url) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def needs_fetch(self, url: str, now: Optional[float] = None, modified: Optional[float] = None) -> bool:
+        """
+        Checks whether an article is new, was modified after it was last fetched, or was seen
+        long enough ago that it should be re-checked.
+
+        Args:
+            url (str): Article URL
+            now (float, optional): Current time. Defaults to time.time().
+            modified (float, optional): When the source says the article last changed, e.g. a
+                                        sitemap's lastmod, as a Unix timestamp
+        """
+        entry = self._entries.get(normalize_url(url))
+        if entry is None:
+            return True
+        if modified is not None and modified > entry[0]:
+            return True
+        if self.recheck_after is None:
+            return False
+        return (now or time.time()) - entry[0] >= self.recheck_after
+
+    def filter_new(self, urls: Iterable[str], modified: Optional[Dict[str, float]] = None) -> List[str]:
+        """
+        Keeps only the URLs that need fetching, dropping repeats that normalize to the same page.
+
+        Args:
+            urls (Iterable[str]): Discovered article URLs
+            modified (Dict[str, float], optional): url -> last modification time reported by the
+                                                   source. Seen articles modified since they were
+                                                   last fetched are kept.
+
+        Returns:
+            List[str]: URLs to fetch, in their original order
+        """
+        now = time.time()
+        keep = []
+        emitted = set()
+        for url in urls:
+            key = normalize_url(url)
+            if key in emitted:
+                continue
+            emitted.add(key)
+            if self.needs_fetch(url, now, modified.get(url) if modified else None):
+                keep.append(url)
+        return keep
+
+    def record(self, url: str, text: Optional[str]) -> bool:
+        """
+        Records a fetched article.
+
+        Args:
+            url (str): Article URL
+            text (str, optional): Extracted article text
+
+        Returns:
+            bool: True if the article is new or its text changed since it was last recorded
+        """
+        key = normalize_url(url)
+        digest = content_hash(text) if text else None
+        now = time.time()
+
+        with self._lock:
+            previous = self._entries.get(key)
+            self._entries[key] = (now, digest)
+            if previous is None:
+                self._conn.execute("INSERT INTO seen VALUES (?, ?, ?, ?)", (key, now, now, digest))
+            else:
+                self._conn.execute(
+                    "UPDATE seen SET last_checked = ?, content_hash = ? WHERE url = ?", (now, digest, key)
+                )
+            self._conn.commit()
+
+        return previous is None or previous[1] != digest
+
+    def forget(self, url: str):
+        """
+        Removes an article, so the next run treats it as new. Used for articles whose
+        summary was deferred to a later cycle.
+        """
+        key = normalize_url(url)
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._conn.execute("DELETE FROM seen WHERE url = ?", (key,))
+                self._conn.commit()
+
+    def prune(self, older_than: float = SeenIndexConfig.RETENTION) -> int:
+        """
+        Drops articles not fetched for older_than seconds, so a long-running process does not
+        keep every URL it has ever seen. A pruned article that is still listed is treated as new.
+
+        Args:
+            older_than (float): Age in seconds of the last fetch
+
+        Returns:
+            int: Number of articles removed
+        """
+        cutoff = time.time() - older_than
+        with self._lock:
+            stale = [key for key, (last_checked, _) in self._entries.items() if last_checked < cutoff]
+            for key in stale:
+                del self._entries[key]
+            self._conn.execute("DELETE FROM seen WHERE last_checked < ?", (cutoff,))
+            self._conn.commit()
+
+        if stale:
+            self.logger.info(f"Pruned {len(stale)} articles not fetched in {older_than:.0f}s")
+        return len(stale)
+
+    def first_seen(self, url: str) -> Optional[float]:
+        """
+        Returns when an article was first recorded, or None if it never was.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT first_seen FROM seen WHERE url = ?", (normalize_url(url),)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        """
+        Closes the underlying database.
+        """
+        with self._lock:
+            self._conn.close()
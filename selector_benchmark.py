@@ -0,0 +1,56 @@
+import argparse
+import re
+import statistics
+import time
+
+from benchmark_fixtures import build_article_page
+from finders import SCRAPERS
+from html_parser import parse_html
+
+# The matchers the scrapers used before extraction_spec: a Python callback per div
+LEGACY_MATCHERS = {
+    'cnn': lambda soup: soup.find('div', class_=lambda cls: cls and 'article' in cls and 'content' in cls),
+    'fox': lambda soup: soup.find('div', class_=lambda cls: cls and 'article' in cls and 'content' in cls),
+    'ap': lambda soup: soup.find('div', class_=re.compile(r".*richtextbody.*", re.IGNORECASE)),
+}
+
+def time_ms(func, repeat: int) -> float:
+    """
+    Returns the median runtime of func in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark content matching on large pages")
+    arg_parser.add_argument('--paragraphs', type=int, default=300)
+    arg_parser.add_argument('--filler-kb', type=int, default=2000)
+    arg_parser.add_argument('--repeat', type=int, default=20)
+    args = arg_parser.parse_args()
+
+    print(f"{'source':<6} {'matcher':<22} {'median ms':>10}")
+    for source in LEGACY_MATCHERS:
+        scraper_cls = SCRAPERS[source]
+        page = build_article_page(source, paragraphs=args.paragraphs, filler_kb=args.filler_kb)
+        soup = parse_html(page)
+        full = scraper_cls('https://example.com/fixture')
+        partial = scraper_cls('https://example.com/fixture', partial=True)
+        strained = parse_html(page, parse_only=scraper_cls.parse_only)
+
+        # Both matchers must agree before their speed means anything
+        assert LEGACY_MATCHERS[source](soup) == full.select(soup, 'content')
+
+        rows = [
+            ('legacy callback', lambda: LEGACY_MATCHERS[source](soup)),
+            ('compiled', lambda: full.select(soup, 'content')),
+            ('compiled, partial', lambda: partial.select(strained, 'content')),
+        ]
+        for name, func in rows:
+            print(f"{source:<6} {name:<22} {time_ms(func, args.repeat):>10.3f}")
+
+if __name__ == '__main__':
+    main()
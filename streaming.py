@@ -0,0 +1,112 @@
+import codecs
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+import requests
+
+from extraction_spec import SelectorSpec
+
+class StreamConfig:
+    """Default settings for streaming fetches"""
+    MAX_BYTES = 3 * 1024 * 1024     # hard cap on the bytes read for one page
+    CHUNK_SIZE = 16 * 1024          # bytes read from the socket at a time
+
+# Elements that never have a closing tag and so never go on the open-element stack
+VOID_ELEMENTS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+})
+
+class ArticleBoundaryDetector(HTMLParser):
+    """
+    Incremental tokenizer that reports once every field container of a source has closed.
+
+    It is fed the page chunk by chunk while it downloads and only keeps a stack of open tag
+    names, so it can tell when the first element matching each field has been fully received.
+    """
+    def __init__(self, selectors: SelectorSpec):
+        """
+        Args:
+            selectors (SelectorSpec): Field selectors of the source being fetched
+        """
+        super().__init__(convert_charrefs=False)
+        self.selectors = selectors
+        self.pending = set(selectors.fields)
+        # Open elements as [tag name, field it opened or None]
+        self.stack: List[List[Optional[str]]] = []
+
+    @property
+    def complete(self) -> bool:
+        """
+        True once every field's container has been closed.
+        """
+        return not self.pending
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            return
+
+        opened = None
+        attr_map = dict(attrs)
+        for field in self.pending:
+            # Only the first match counts, and not if an outer element already opened this field
+            if any(entry[1] == field for entry in self.stack):
+                continue
+            if self.selectors.fields[field].matches(tag, attr_map):
+                opened = field
+                break
+        self.stack.append([tag, opened])
+
+    def handle_endtag(self, tag):
+        # Browsers close every element left open inside the one being closed; do the same
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index][0] == tag:
+                for _, field in self.stack[index:]:
+                    if field:
+                        self.pending.discard(field)
+                del self.stack[index:]
+                return
+
+def read_capped(
+    response: requests.Response,
+    max_bytes: int = StreamConfig.MAX_BYTES,
+    detector: Optional[ArticleBoundaryDetector] = None,
+    chunk_size: int = StreamConfig.CHUNK_SIZE,
+) -> Tuple[bytes, str]:
+    """
+    Reads a streamed response in chunks, stopping at a byte cap or once the article is complete.
+
+    Args:
+        response (requests.Response): Response opened with stream=True
+        max_bytes (int): Maximum number of bytes to read
+        detector (ArticleBoundaryDetector, optional): Stops the read once every field has closed
+        chunk_size (int): Bytes requested from the socket at a time
+
+    Returns:
+        Tuple[bytes, str]: The bytes read and why reading stopped: 'eof', 'complete' or 'truncated'
+    """
+    chunks = []
+    size = 0
+    decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    reason = 'eof'
+
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if size + len(chunk) > max_bytes:
+                chunks.append(chunk[:max_bytes - size])
+                reason = 'truncated'
+                break
+
+            chunks.append(chunk)
+            size += len(chunk)
+
+            if detector is not None:
+                detector.feed(decoder.decode(chunk))
+                if detector.complete:
+                    reason = 'complete'
+                    break
+    finally:
+        # Closing early drops the connection instead of draining the rest of the body
+        response.close()
+
+    return b''.join(chunks), reason
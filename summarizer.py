@@ -0,0 +1,198 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
+
+import requests
+
+from logger import setup_logger
+from metrics import REGISTRY
+from summary_cache import SummaryCache
+from transport import HTTPTransport
+
+LLM_SECONDS = REGISTRY.histogram('llm_request_seconds', 'Wall time of one summarization request')
+LLM_TOKENS = REGISTRY.counter('llm_tokens_total', 'Tokens processed by the model, by kind (prompt or generated)')
+LLM_TOKENS_PER_SECOND = REGISTRY.histogram(
+    'llm_tokens_per_second', 'Generation speed reported by the server (eval_count / eval_duration)',
+    buckets=(1, 2, 5, 10, 20, 30, 50, 75, 100, 150, 200, 500)
+)
+
+def record_generation(model: str, stats: dict, elapsed: float):
+    """
+    Records the timing fields Ollama returns with the final response
+    (prompt_eval_count, eval_count, and eval_duration in nanoseconds).
+    """
+    LLM_SECONDS.observe(elapsed, model=model)
+    LLM_TOKENS.inc(stats.get('prompt_eval_count') or 0, model=model, kind='prompt')
+    eval_count = stats.get('eval_count') or 0
+    LLM_TOKENS.inc(eval_count, model=model, kind='generated')
+    eval_duration = stats.get('eval_duration')
+    if eval_count and eval_duration:
+        LLM_TOKENS_PER_SECOND.observe(eval_count / (eval_duration / 1e9), model=model)
+
+class OllamaConfig:
+    """Configuration for the local Ollama summarization server"""
+    URL = "http://localhost:11434/api/generate"
+    MODEL = "deepseek-r1"
+    SYSTEM_PROMPT = """
+        The user will provide text. The response should ingest the paragraph and provide an unbiased summary of the text. 
+        Begin each response with Unbiased Summary:"""
+    MAX_CONCURRENCY = 2     # requests in flight against the server at once
+    CONNECT_TIMEOUT = 5.0
+    READ_TIMEOUT = 300.0    # generation can take minutes on long inputs
+    MAX_RETRIES = 1
+
+class OllamaSummarizer:
+    """
+    Client for Ollama's /api/generate endpoint.
+
+    Requests go over a pooled keep-alive connection, up to max_concurrency at a time no matter
+    how many threads call in, and summaries are looked up in (and written back to) an
+    optional SummaryCache.
+    """
+    def __init__(
+        self,
+        url: str = OllamaConfig.URL,
+        model: str = OllamaConfig.MODEL,
+        system_prompt: str = OllamaConfig.SYSTEM_PROMPT,
+        max_concurrency: int = OllamaConfig.MAX_CONCURRENCY,
+        cache: Optional[SummaryCache] = None,
+        transport: Optional[HTTPTransport] = None,
+    ):
+        """
+        Args:
+            url (str): Ollama generate endpoint
+            model (str): Model used for summaries
+            system_prompt (str): System prompt sent with every request
+            max_concurrency (int): Maximum number of requests in flight
+            cache (SummaryCache, optional): Summary store consulted before calling the model
+            transport (HTTPTransport, optional): HTTP client for the server. Defaults to a
+                                                 dedicated pool sized to max_concurrency.
+        """
+        self.logger = setup_logger(__name__)
+        self.url = url
+        self.model = model
+        self.system_prompt = system_prompt
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache = cache
+        self.transport = transport or HTTPTransport(
+            connect_timeout=OllamaConfig.CONNECT_TIMEOUT,
+            read_timeout=OllamaConfig.READ_TIMEOUT,
+            max_retries=OllamaConfig.MAX_RETRIES,
+            pool_connections=1,
+            pool_maxsize=self.max_concurrency
+        )
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        # Caps requests in flight across every caller: pipeline threads, summarize_many and map-reduce
+        self.slots = threading.BoundedSemaphore(self.max_concurrency)
+
+    def build_payload(self, text: str, stream: bool) -> dict:
+        """
+        Builds the request body for /api/generate.
+        """
+        return {
+            "model": self.model,
+            "prompt": text,
+            "system": self.system_prompt,
+            "stream": stream
+        }
+
+    def summarize(self, text: str) -> Optional[str]:
+        """
+        Summarizes text, serving it from the cache when it has been summarized before.
+
+        Args:
+            text (str): Text to summarize
+
+        Returns:
+            str: The summary if successful.
+            None: If the request fails.
+        """
+        if self.cache:
+            summary = self.cache.get(text, self.model, self.system_prompt)
+            if summary is not None:
+                return summary
+
+        try:
+            with self.slots:
+                start = time.perf_counter()
+                response = self.transport.post(self.url, json=self.build_payload(text, stream=False))
+                response.raise_for_status()
+                result = response.json()
+                summary = result.get('response')
+                record_generation(self.model, result, time.perf_counter() - start)
+        except (requests.RequestException, ValueError) as e:
+            self.logger.error(f"Summarization request failed: {e}")
+            return None
+
+        if self.cache and summary:
+            self.cache.put(text, self.model, self.system_prompt, summary)
+        return summary
+
+    def summarize_many(self, texts: List[str]) -> List[Optional[str]]:
+        """
+        Summarizes several texts, keeping up to max_concurrency requests in flight.
+
+        Args:
+            texts (List[str]): Texts to summarize
+
+        Returns:
+            List[Optional[str]]: Summaries in the same order as texts. Failed entries are None.
+        """
+        return list(self.executor.map(self.summarize, texts))
+
+    def stream(self, text: str) -> Iterator[str]:
+        """
+        Summarizes text and yields the tokens as the server generates them.
+        A cached summary is yielded in one piece; a completed stream is written to the cache.
+
+        Args:
+            text (str): Text to summarize
+
+        Yields:
+            str: Fragments of the summary, in order
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        if self.cache:
+            summary = self.cache.get(text, self.model, self.system_prompt)
+            if summary is not None:
+                yield summary
+                return
+
+        tokens = []
+        completed = False
+        # The slot is held until the stream is finished or abandoned
+        with self.slots:
+            start = time.perf_counter()
+            response = self.transport.post(self.url, json=self.build_payload(text, stream=True), stream=True)
+            try:
+                response.raise_for_status()
+
+                # Ollama streams one JSON object per line, the last one has "done": true
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    token = chunk.get('response', '')
+                    if token:
+                        tokens.append(token)
+                        yield token
+                    if chunk.get('done'):
+                        completed = True
+                        record_generation(self.model, chunk, time.perf_counter() - start)
+                        break
+            finally:
+                response.close()
+
+        if self.cache and completed and tokens:
+            self.cache.put(text, self.model, self.system_prompt, ''.join(tokens))
+
+    def close(self):
+        """
+        Stops the worker threads and closes the pooled connections.
+        """
+        self.executor.shutdown(wait=True)
+        self.transport.close()
@@ -0,0 +1,141 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from logger import setup_logger
+from metrics import REGISTRY
+
+CACHE_REQUESTS = REGISTRY.counter('summary_cache_requests_total', 'Summary cache lookups by result (hit or miss)')
+
+class SummaryCacheConfig:
+    """Default settings for the persistent summary store"""
+    CACHE_PATH = os.path.join('cache', 'summaries.sqlite3')
+    MAX_ENTRIES = 50000     # summaries kept before least recently used ones are evicted
+
+def normalize_text(text: str) -> str:
+    """
+    Collapses whitespace so formatting differences between outlets do not change the key.
+    """
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+def summary_key(text: str, model: str, system_prompt: str) -> str:
+    """
+    Hashes (normalized text, model, system prompt) into the cache key.
+
+    Args:
+        text (str): Text that is being summarized
+        model (str): Name of the model producing the summary
+        system_prompt (str): System prompt sent with the text
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for part in (model, normalize_text(system_prompt), normalize_text(text)):
+        digest.update(part.encode('utf-8'))
+        # Separator keeps ('ab', 'c') and ('a', 'bc') from colliding
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+class SummaryCache:
+    """
+    Persistent store of LLM summaries keyed by a hash of the text, model and system prompt.
+
+    The same article re-run later, or syndicated to several outlets, hashes to the same key,
+    so it is only ever sent to the model once. The store keeps at most max_entries summaries
+    and evicts the least recently used ones beyond that.
+    """
+    def __init__(self, path: str = SummaryCacheConfig.CACHE_PATH, max_entries: int = SummaryCacheConfig.MAX_ENTRIES):
+        """
+        Args:
+            path (str): SQLite file holding the summaries. ':memory:' keeps them in process.
+            max_entries (int): Maximum number of summaries kept
+        """
+        self.logger = setup_logger(__name__)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        if path != ':memory:' and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS summaries_last_access ON summaries (last_access)")
+        self._conn.commit()
+
+    def get(self, text: str, model: str, system_prompt: str) -> Optional[str]:
+        """
+        Looks up a stored summary and records a hit or a miss.
+
+        Returns:
+            str: The stored summary if present.
+            None: If the text has not been summarized with this model and prompt.
+        """
+        key = summary_key(text, model, system_prompt)
+        with self._lock:
+            row = self._conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                CACHE_REQUESTS.inc(result='miss')
+                return None
+
+            self.hits += 1
+            CACHE_REQUESTS.inc(result='hit')
+            self._conn.execute("UPDATE summaries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return row[0]
+
+    def put(self, text: str, model: str, system_prompt: str, summary: str):
+        """
+        Stores a summary, evicting the least recently used entries if the store is full.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?)",
+                (summary_key(text, model, system_prompt), model, summary, now, now)
+            )
+            self.evict()
+            self._conn.commit()
+
+    def evict(self):
+        """
+        Deletes least recently used summaries beyond max_entries. Must be called with the lock held.
+        """
+        count = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+
+        self._conn.execute(
+            "DELETE FROM summaries WHERE key IN (SELECT key FROM summaries ORDER BY last_access ASC LIMIT ?)",
+            (excess,)
+        )
+        self.logger.info(f"Evicted {excess} summaries to stay under {self.max_entries} entries")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns hit/miss counters for this process.
+        """
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        """
+        Closes the underlying database.
+        """
+        with self._lock:
+            self._conn.close()
@@ -1,35 +1,65 @@
-import requests
-from bs4 import BeautifulSoup
-
-# Replace with your API key and endpoint
-url = "http://localhost:11434/api/generate"
-
-def summarize_text(paragraph):
-
-    data = {
-        "model": "deepseek-r1",
-        "prompt": paragraph ,
-        # "text": paragraph,
-        "system": """
-        The user will provide text. The response should ingest the paragraph and provide an unbiased summary of the text. 
-        Begin each response with Unbiased Summary:""",
-        
-        "stream": False
-    }
-
-    try:
-        response = requests.post(url, json=data)
-        
-        if response.status_code == 200:
-            result = response.json()
-            summary = result.get('response')
-            return summary
-        else:
-            print(f"Error: {response.status_code}, {response.text}")
-            return None
-    except Exception as e:
-        print(f'An error occured: {e}')
-        return None
+import atexit
+import threading
+from typing import Dict, Optional
+
+from map_reduce import MapReduceSummarizer
+from summarizer import OllamaSummarizer
+from summary_cache import SummaryCache
+
+# One summarizer per cache, kept for the life of the process so every call reuses its pooled connection
+_summarizers: Dict[Optional[SummaryCache], OllamaSummarizer] = {}
+_map_reducers: Dict[Optional[SummaryCache], MapReduceSummarizer] = {}
+_summarizers_lock = threading.Lock()
+
+def get_summarizer(cache: SummaryCache = None) -> OllamaSummarizer:
+    """
+    Returns the shared summarizer for a cache, creating it on first use.
+    """
+    with _summarizers_lock:
+        summarizer = _summarizers.get(cache)
+        if summarizer is None:
+            summarizer = _summarizers[cache] = OllamaSummarizer(cache=cache)
+        return summarizer
+
+def get_map_reducer(cache: SummaryCache = None) -> MapReduceSummarizer:
+    """
+    Returns the shared map-reduce summarizer for a cache, built on get_summarizer(cache).
+    """
+    summarizer = get_summarizer(cache)
+    with _summarizers_lock:
+        map_reducer = _map_reducers.get(cache)
+        if map_reducer is None:
+            map_reducer = _map_reducers[cache] = MapReduceSummarizer(summarizer)
+        return map_reducer
+
+@atexit.register
+def close_summarizers():
+    """
+    Closes the shared summarizers' thread pools and connections.
+    """
+    with _summarizers_lock:
+        for map_reducer in _map_reducers.values():
+            map_reducer.close()
+        _map_reducers.clear()
+        for summarizer in _summarizers.values():
+            summarizer.close()
+        _summarizers.clear()
+
+def summarize_text(paragraph, cache: SummaryCache = None):
+    """
+    Summarizes text with the local Ollama server. Text longer than one chunk is summarized
+    chunk by chunk and the partial summaries are combined.
+
+    Args:
+        paragraph (str): Text to summarize
+        cache (SummaryCache, optional): Summary store checked before calling the model.
+                                        New summaries are written back to it.
+
+    Returns:
+        str: The summary if successful.
+        None: If the request fails.
+    """
+    return get_map_reducer(cache).summarize(paragraph)
 
 # Example paragraph to summarize
 paragraph = """
@@ -41,5 +71,10 @@ user experiences in e-commerce and entertainment. Despite these benefits, challe
 data privacy concerns, and potential biases in AI systems require ongoing attention.
 """
 
-summary = summarize_text(paragraph)
-print(summary)
\ No newline at end of file
+if __name__ == '__main__':
+    summarizer = get_summarizer(SummaryCache())
+
+    # Print the summary as it is generated
+    for token in summarizer.stream(paragraph):
+        print(token, end='', flush=True)
+    print()
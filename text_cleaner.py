@@ -0,0 +1,123 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from map_reduce import estimate_tokens
+from metrics import REGISTRY
+
+ARTICLE_TOKENS = REGISTRY.counter('article_tokens_total', 'Estimated article tokens by source, before (raw) and after (clean) cleaning')
+
+class CleanerConfig:
+    """Boilerplate removed from article text before it is summarized"""
+    # Lines dropped for every source. Each pattern must match the whole (whitespace-collapsed) line.
+    COMMON_PATTERNS: Tuple[str, ...] = (
+        r'advertisement',
+        r'(video )?ad feedback',
+        r'related (article|content|video|stories|coverage)s?\b.*',
+        r'(read|watch|see) more\b.{0,80}',
+        r'share (this|on)\b.{0,40}',
+        # Image captions: "... Credit: Getty Images", "... (AP Photo/Jane Doe)"
+        r'.{0,400}\b(credit|photo)\s*:\s*.{0,80}',
+        r'.{0,400}\((ap photo|getty images|reuters|afp)\b[^)]*\)',
+    )
+    SOURCE_PATTERNS: Dict[str, Tuple[str, ...]] = {
+        'cnn': (
+            r'now playing\b.*',
+            r'\d{1,2}:\d{2}',
+            r'see more videos',
+            r'sign up for .{0,80}newsletter.*',
+            r'©\s*\d{4}\s*cable news network.*',
+        ),
+        'fox': (
+            r'click here (to|for)\b.*',
+            r'fox news flash top headlines.*',
+            r'new\s*you can now listen to fox news articles!?',
+            r'first on fox',
+            r'this material may not be published, broadcast, rewritten,? or redistributed\.?',
+            r'like what you.re reading\?.*',
+        ),
+        'ap': (
+            r'_{3,}',
+            r'.{0,120}associated press (writer|reporter|journalist)s?\b.{0,200}contributed( to this report)?\.?',
+            r'the associated press receives .*support.*',
+            r'follow ap.s .*coverage.*',
+            r'find ap.s full coverage.*',
+            r'ap is solely responsible .*',
+        ),
+    }
+
+@dataclass
+class CleanedText:
+    """Article text after cleaning, with the estimated token counts on both sides"""
+    text: str
+    tokens_before: int
+    tokens_after: int
+
+    @property
+    def tokens_removed(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+class TextCleaner:
+    """
+    Normalizes extracted article text before it is summarized.
+
+    Text is processed line by line (the scrapers emit one block per line): whitespace is
+    collapsed, boilerplate lines known for the source are dropped, and lines repeated
+    elsewhere in the article are kept only once. Every token removed here is a prompt token
+    the model does not have to read.
+    """
+    def __init__(self, source_patterns: Optional[Dict[str, Tuple[str, ...]]] = None):
+        """
+        Args:
+            source_patterns (Dict[str, Tuple[str, ...]], optional): Boilerplate line patterns per
+                                                                   source. Defaults to CleanerConfig's.
+        """
+        source_patterns = CleanerConfig.SOURCE_PATTERNS if source_patterns is None else source_patterns
+        self.common = self.compile(CleanerConfig.COMMON_PATTERNS)
+        # One alternation per source, so each line is checked with a single match call
+        self.patterns = {
+            source: self.compile(CleanerConfig.COMMON_PATTERNS + tuple(patterns))
+            for source, patterns in source_patterns.items()
+        }
+
+    @staticmethod
+    def compile(patterns: Tuple[str, ...]) -> re.Pattern:
+        return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+
+    def clean(self, text: str, source: str = '') -> CleanedText:
+        """
+        Cleans one article.
+
+        Args:
+            text (str): Extracted article text
+            source (str): Source the article came from, selects its boilerplate patterns
+
+        Returns:
+            CleanedText: The cleaned text, one paragraph per line, and its token counts
+        """
+        boilerplate = self.patterns.get(source, self.common)
+        lines = []
+        seen = set()
+
+        for line in (text or '').splitlines():
+            line = ' '.join(line.split())
+            if not line or boilerplate.fullmatch(line):
+                continue
+
+            # Teasers and pull quotes often repeat a paragraph word for word
+            key = line.casefold()
+            if key in seen:
+                continue
+            seen.add(key)
+            lines.append(line)
+
+        cleaned_text = '\n'.join(lines)
+        cleaned = CleanedText(
+            text=cleaned_text,
+            tokens_before=estimate_tokens(text or ''),
+            tokens_after=estimate_tokens(cleaned_text)
+        )
+
+        ARTICLE_TOKENS.inc(cleaned.tokens_before, source=source, stage='raw')
+        ARTICLE_TOKENS.inc(cleaned.tokens_after, source=source, stage='clean')
+        return cleaned
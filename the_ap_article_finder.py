@@ -0,0 +1,68 @@
+import json
+from typing import List
+from urllib.parse import urlsplit
+from base_article_finder import BaseArticleFinder, FinderConfig, AElementNotFoundError
+from the_ap_scrapper import TheAPScraper
+
+class TheAPConfig(FinderConfig):
+    """Configuration class for The AP-related constants and settings"""
+    BASE_URL = "https://apnews.com"
+    TOPIC_PAGES = {
+        'US': f'{BASE_URL}/us-news',
+        'World': f'{BASE_URL}/world-news',
+        'Politics': f'{BASE_URL}/politics',
+        'Business': f'{BASE_URL}/business',
+        'Health': f'{BASE_URL}/health',
+        'Entertainment': f'{BASE_URL}/entertainment',
+        'Science': f'{BASE_URL}/science',
+        'Climate': f'{BASE_URL}/climate-and-environment',
+        'Technology': f'{BASE_URL}/technology'
+    }
+    # Site-wide Google News sitemap; AP story URLs carry no section, so topics match on keywords
+    FEED_PAGES = dict.fromkeys(TOPIC_PAGES, f'{BASE_URL}/news-sitemap-content.xml')
+    # Maximum number of section pages fetched at the same time
+    MAX_WORKERS = 10
+
+class TheAPArticleFinder(BaseArticleFinder):
+    """
+    Extracts URLs for trending AP articles of the topics of interest.
+    """
+    source = 'ap'
+    config = TheAPConfig
+    scraper_cls = TheAPScraper
+
+    def extract_hrefs(self, topic: str, page: object) -> List[str]:
+        """
+        Pulls the story links out of the promo cards of an AP hub page.
+
+        Raises:
+            AElementNotFoundError: If the page holds no article links
+        """
+        hrefs = [
+            tag['href'] for tag in page.find_all('a', href=True)
+            if '/article/' in tag['href']
+        ]
+
+        if not hrefs:
+            self.logger.warning(f"No a elements found for {topic}. Hyperlinks not found")
+            raise AElementNotFoundError(f"No a elements found for {topic}. Hyperlinks not found")
+
+        return hrefs
+
+    def is_article_url(self, url: str) -> bool:
+        """
+        Keeps apnews.com story pages.
+        """
+        parts = urlsplit(url)
+        return (parts.hostname or '').endswith('apnews.com') and parts.path.startswith('/article/')
+
+def main():
+    user_data = json.dumps({
+        'topics': ['US']
+    })
+
+    article_finder = TheAPArticleFinder(user_data=user_data)
+    article_finder.logger.info(f"Complete URLs: {article_finder.get_link()}")
+
+if __name__ == '__main__':
+    main()
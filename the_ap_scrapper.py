@@ -1,80 +1,115 @@
 from base_scraper import BaseScraper
-import re
+from extraction_spec import FieldSelector, SelectorSpec
+from html_parser import block_text
 
 class TheAPScraper(BaseScraper):
-    def __init__(self, url: str):
+    extractors = {
+        'headline': 'parse_headline',
+        'content': 'parse_content',
+    }
+    selectors = SelectorSpec(
+        headline=FieldSelector('h1'),
+        content=FieldSelector('div', class_contains=('richtextbody',), ignore_case=True),
+    )
+    parse_only = selectors.strainer
+
+    def __init__(self, url: str, **kwargs):
         """
         Initializes the TheAPScraper with the URL of the The AP article.
 
         Args:
             url (str): The URL of the article to scrape.
+            **kwargs: Fetch and parse options passed to BaseScraper (transport, cache, parser, partial).
         """
         if not isinstance(url, str) or not url:
             raise ValueError("A valid URL is required to initialize TheAPScraper.")
-        super().__init__(url)
+        super().__init__(url, **kwargs)
 
-    def get_headline(self) -> str:
+    def parse_headline(self, soup) -> str:
         """
-        Extracts the headline from the article page.
+        Extracts the headline from an already parsed article page.
+
+        Args:
+            soup (bs4.BeautifulSoup): The parsed article page.
 
         Returns:
             str: The article headline if found.
-            None: If an error occurs or the headline is not found.
-        """ 
-        # retrieve html content
-        soup = self.get_soup()
-
-        # if html content is None
-        if not soup:
-            raise ValueError(f"Soup is None")
-            
+            None: If the headline is not found.
+        """
         try:
-            article_headline = soup.find('h1').get_text(strip=True) 
+            article_headline = self.select(soup, 'headline').get_text(strip=True) 
             return article_headline
         except AttributeError:
             return None
         except Exception as e:
             # error is most likely due to the element class name changing over time
             raise ValueError(f"Unexpected error while extracting headline: {e}")
-    
-    def get_content(self) -> str:
+
+    def parse_content(self, soup) -> str:
         """
-        Extracts the main content of the article from the page.
+        Extracts the main content of the article from an already parsed page.
+
+        Args:
+            soup (bs4.BeautifulSoup): The parsed article page.
 
         Returns:
             str: The extracted article content if found.
-            None: If an error occurs or the content is not found.
         """
-        # retrieve HTML content
-        soup = self.get_soup()
-
-        if not soup:
-            raise ValueError(f"Soup is None")
-
         try:
-            # Match a div where the class contains 'page' and 'content'.             
-            raw_content = soup.find("div", class_=re.compile(r".*richtextbody.*", re.IGNORECASE))
+            # Match a div where the class contains 'richtextbody', in any case.
+            raw_content = self.select(soup, 'content')
 
-            # Extract the text from the raw content
-            raw_text = raw_content.get_text()
+            # Extract the text from the raw content, one block per line
+            raw_text = block_text(raw_content)
             
             return raw_text
         except Exception as e:
             # Log errors, likely due to changes in HTML structure
             raise ValueError(f"Unexpected error while extracting headline: {e}")
 
+    def extract(self, fields=None):
+        """
+        Runs the registered field extractors against a single fetch and parse of the page.
+
+        Raises:
+            ValueError: If the page could not be fetched or parsed
+        """
+        if not self.get_soup():
+            raise ValueError(f"Soup is None")
+
+        return super().extract(fields)
+
+    def get_headline(self) -> str:
+        """
+        Extracts the headline from the article page.
+
+        Returns:
+            str: The article headline if found.
+            None: If an error occurs or the headline is not found.
+        """ 
+        return self.extract(['headline'])['headline']
+    
+    def get_content(self) -> str:
+        """
+        Extracts the main content of the article from the page.
+
+        Returns:
+            str: The extracted article content if found.
+            None: If an error occurs or the content is not found.
+        """
+        return self.extract(['content'])['content']
+
     def get_article_data(self) -> tuple[str, str]:
         """
         Extracts the headline and content from the website.
+        The page is fetched and parsed once for both fields.
 
         Returns:
             tuple: (str, str) The article headline and content if found.
         """
+        article = self.extract(['headline', 'content'])
 
-        headline = self.get_headline()
-        content = self.get_content()
-
-        return headline, content
+        return article['headline'], article['content']
 
 def main():
     scraper_ap = TheAPScraper(url='https://apnews.com/article/new-orleans-bourbon-street-truck-crash-terrorism-149bdb38ca0d7fc8e184eb3d32b5de40')
@@ -83,4 +118,4 @@ def main():
 
 
 if __name__ == '__main__':
-   main()
\ No newline at end of file
+   main()
@@ -0,0 +1,277 @@
+import random
+import threading
+import time
+import weakref
+from contextlib import ExitStack
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from logger import setup_logger
+from metrics import REGISTRY
+from politeness import PolitenessScheduler, host_key
+
+REQUEST_SECONDS = REGISTRY.histogram('http_request_seconds', 'Wall time of one HTTP attempt, body included unless streamed')
+HEADERS_SECONDS = REGISTRY.histogram('http_time_to_headers_seconds', 'Time from sending a request to parsing the response headers (connect + server time)')
+REQUESTS_TOTAL = REGISTRY.counter('http_requests_total', 'HTTP attempts by host and status (error for connection failures and timeouts)')
+# Counted here for buffered responses; streamed bodies are counted by whoever reads them
+RESPONSE_BYTES = REGISTRY.counter('http_response_bytes_total', 'Response body bytes downloaded')
+
+class TransportConfig:
+    """Default settings for the shared HTTP transport"""
+    CONNECT_TIMEOUT = 5.0       # seconds to establish a TCP/TLS connection
+    READ_TIMEOUT = 20.0         # seconds to wait between bytes of the response
+    MAX_RETRIES = 3             # retries after the first attempt
+    BACKOFF_FACTOR = 0.5        # base delay in seconds, doubled on every retry
+    BACKOFF_MAX = 30.0          # upper bound for any single wait, including Retry-After
+    POOL_CONNECTIONS = 10       # number of per-host pools kept alive
+    POOL_MAXSIZE = 10           # keep-alive connections per host
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+class HTTPTransport:
+    """
+    Pooled HTTP client shared by the scrapers.
+
+    A single HTTPAdapter holds the per-host keep-alive pools. Each thread gets its own
+    requests.Session mounted on that adapter, so connections are reused across threads
+    without sharing session state (cookies, headers) between them.
+    """
+    def __init__(
+        self,
+        connect_timeout: float = TransportConfig.CONNECT_TIMEOUT,
+        read_timeout: float = TransportConfig.READ_TIMEOUT,
+        max_retries: int = TransportConfig.MAX_RETRIES,
+        backoff_factor: float = TransportConfig.BACKOFF_FACTOR,
+        backoff_max: float = TransportConfig.BACKOFF_MAX,
+        pool_connections: int = TransportConfig.POOL_CONNECTIONS,
+        pool_maxsize: int = TransportConfig.POOL_MAXSIZE,
+        retry_statuses: frozenset = TransportConfig.RETRY_STATUSES,
+        scheduler: Optional[PolitenessScheduler] = None,
+    ):
+        """
+        Args:
+            connect_timeout (float): Seconds allowed to open a connection
+            read_timeout (float): Seconds allowed between bytes of the response
+            max_retries (int): Number of retries after the first attempt
+            backoff_factor (float): Base delay for the exponential backoff
+            backoff_max (float): Maximum delay between two attempts
+            pool_connections (int): Number of per-host pools to keep
+            pool_maxsize (int): Number of keep-alive connections per host
+            retry_statuses (frozenset): Status codes that trigger a retry
+            scheduler (PolitenessScheduler, optional): Per-host rate and concurrency limits applied
+                                                       to every attempt, including retries
+        """
+        self.logger = setup_logger(__name__)
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max(0, max_retries)
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+        self.scheduler = scheduler
+
+        # Retries are handled in get() so that Retry-After and jitter apply to every status
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0
+        )
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the calling thread's session, mounted on the shared connection pools.
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('http://', self.adapter)
+            session.mount('https://', self.adapter)
+            self._local.session = session
+        return session
+
+    def retry_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Computes how long to wait before the next attempt.
+
+        Args:
+            attempt (int): Zero-based index of the attempt that just failed
+            response (requests.Response, optional): The failed response, if one was received
+
+        Returns:
+            float: Seconds to sleep. Honours Retry-After when present, otherwise uses
+                   exponential backoff with full jitter.
+        """
+        if response is not None:
+            retry_after = self.parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+
+        ceiling = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parses a Retry-After header given either in seconds or as an HTTP date.
+
+        Returns:
+            float: Seconds to wait.
+            None: If the header is missing or malformed.
+        """
+        if not value:
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        """
+        Sends a request with timeouts and bounded retries.
+
+        Args:
+            method (str): HTTP method
+            url (str): URL to request
+            headers (Dict[str, str], optional): Request headers
+            **kwargs: Extra arguments forwarded to requests.Session.request
+
+        Returns:
+            requests.Response: The final response. Retryable statuses are returned as-is
+                               once the retries are exhausted so callers can raise_for_status().
+
+        Raises:
+            requests.exceptions.ConnectionError: If the host is unreachable after every retry
+            requests.exceptions.Timeout: If every attempt timed out
+        """
+        kwargs.setdefault('timeout', self.timeout)
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                response = self.send(method, url, headers=headers, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+                if last_attempt:
+                    raise
+                delay = self.retry_delay(attempt)
+                self.logger.warning(f"{type(err).__name__} for {url}, retrying in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in self.retry_statuses or last_attempt:
+                return response
+
+            delay = self.retry_delay(attempt, response)
+            self.logger.warning(f"HTTP {response.status_code} for {url}, retrying in {delay:.2f}s")
+            # Release the connection back to the pool before sleeping
+            response.close()
+            time.sleep(delay)
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a single attempt, inside the host's politeness budget when a scheduler is set.
+
+        A buffered response gives its slot back once the body has arrived. A streamed response
+        keeps the slot until it is closed, since its body is still coming down the connection.
+        """
+        streamed = kwargs.get('stream', False)
+        with ExitStack() as stack:
+            if self.scheduler:
+                stack.enter_context(self.scheduler.slot(url))
+            start = time.monotonic()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if self.scheduler:
+                    self.scheduler.record(url, None, time.monotonic() - start)
+                REQUESTS_TOTAL.inc(host=host_key(url), status='error')
+                raise
+
+            if streamed:
+                self.release_on_close(response, stack.pop_all())
+
+        latency = time.monotonic() - start
+        if self.scheduler:
+            retry_after = self.parse_retry_after(response.headers.get('Retry-After'))
+            self.scheduler.record(url, response.status_code, latency, retry_after)
+        self.record_metrics(url, response, latency, streamed=streamed)
+        return response
+
+    @staticmethod
+    def release_on_close(response: requests.Response, slot: ExitStack):
+        """
+        Ties a held politeness slot to a streamed response: it is released when the response
+        is closed, or when the response is garbage collected without being closed.
+        """
+        close = response.close
+
+        def close_and_release():
+            try:
+                close()
+            finally:
+                slot.close()
+
+        response.close = close_and_release
+        weakref.finalize(response, slot.close)
+
+    @staticmethod
+    def record_metrics(url: str, response: requests.Response, latency: float, streamed: bool):
+        """
+        Records per-host latency, status and size of one attempt. Streamed bodies are
+        counted by whoever reads them, since they have not been downloaded yet.
+        """
+        host = host_key(url)
+        REQUESTS_TOTAL.inc(host=host, status=response.status_code)
+        REQUEST_SECONDS.observe(latency, host=host)
+        HEADERS_SECONDS.observe(response.elapsed.total_seconds(), host=host)
+        if not streamed:
+            RESPONSE_BYTES.inc(len(response.content), host=host)
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        """
+        Sends a GET request with timeouts and bounded retries. See request().
+        """
+        return self.request('GET', url, headers=headers, **kwargs)
+
+    def post(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        """
+        Sends a POST request with timeouts and bounded retries. See request().
+        """
+        return self.request('POST', url, headers=headers, **kwargs)
+
+    def close(self):
+        """
+        Closes every pooled connection.
+        """
+        self.adapter.close()
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+def get_default_transport() -> HTTPTransport:
+    """
+    Returns the process-wide transport, creating it on first use.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            # Shared by every scraper, so it also enforces the per-host crawl budget
+            _default_transport = HTTPTransport(scheduler=PolitenessScheduler())
+        return _default_transport
+
+def set_default_transport(transport: Optional[HTTPTransport]):
+    """
+    Replaces the process-wide transport, e.g. with one pointed at a local fake server in tests.
+    Passing None resets it so the next caller gets a fresh default.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
@@ -0,0 +1,38 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from and never change the page
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'cid', 'iid')
+
+def normalize_url(url: str) -> str:
+    """
+    Normalizes a URL so the same page always maps to the same key.
+
+    Lowercases the scheme and host, drops default ports, fragments and tracking
+    parameters, and sorts the remaining query parameters.
+
+    Args:
+        url (str): The URL to normalize
+
+    Returns:
+        str: The normalized URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    ]
+
+    return urlunsplit((scheme, host, parts.path or '/', urlencode(sorted(query)), ''))
+
+def url_host(url: str) -> str:
+    """
+    Returns the lowercased host name of a URL.
+    """
+    return (urlsplit(url).hostname or '').lower()